@@ -0,0 +1,536 @@
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections import OrderedDict, deque
+from typing import Any, Deque, Dict, List, Optional, Sequence, Set
+
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+from gil_py.core.context import Context
+from gil_py.core.deadline import deadline_scope
+from gil_py.workflow.checkpoint import CheckpointStore
+from gil_py.workflow.compiler import WorkflowCompiler
+from gil_py.workflow.events import ExecutionObserver
+from gil_py.workflow.executor import WorkflowExecutor
+from gil_py.workflow.node_factory import NodeFactory
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+
+# A claimed job whose worker stops renewing its lease for this long (the process died) is queued again
+DEFAULT_LEASE_SECONDS = 60.0
+# Runs a job may start before it is failed instead of being queued again after a crash
+DEFAULT_MAX_ATTEMPTS = 3
+# Pause before a worker takes the next job after an unexpected error (e.g. the backend is unreachable)
+WORKER_ERROR_DELAY = 1.0
+
+
+class JobRecord(BaseModel):
+    job_id: str
+    status: str = QUEUED
+    workflow_yaml: str
+    context: Dict[str, Any] = {}
+    submitted_at: float
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    attempts: int = 0
+
+    def public_dict(self) -> Dict[str, Any]:
+        """Job status as returned by the API (without the submitted workflow)."""
+        return self.model_dump(exclude={"workflow_yaml", "context"})
+
+    def to_json(self) -> str:
+        return json.dumps(self.model_dump(), ensure_ascii=False, default=str)
+
+    @classmethod
+    def from_json(cls, data: str) -> "JobRecord":
+        return cls(**json.loads(data))
+
+
+class QueueFullError(Exception):
+    """Raised when too many jobs are waiting to run."""
+
+
+class JobBackend(ABC):
+    """
+    Stores job records and the queue of job ids waiting to run.
+
+    Backends that outlive the process lease claimed jobs: the worker renews the lease while the
+    job runs and completes it when the job has finished, and a job whose lease has expired is
+    claimed again by `next_job_id` (or put back by `recover`).
+    """
+
+    lease_seconds = DEFAULT_LEASE_SECONDS
+
+    @abstractmethod
+    async def put(self, job: JobRecord) -> None:
+        """Stores a new job and appends it to the queue."""
+
+    @abstractmethod
+    async def next_job_id(self) -> str:
+        """Waits for and removes the next queued job id."""
+
+    @abstractmethod
+    async def get(self, job_id: str) -> Optional[JobRecord]:
+        """Returns the job record, or None if it is unknown."""
+
+    @abstractmethod
+    async def save(self, job: JobRecord) -> None:
+        """Updates an existing job record."""
+
+    @abstractmethod
+    async def pending_count(self) -> int:
+        """Number of jobs waiting to run."""
+
+    async def renew(self, job_id: str) -> None:
+        """Extends the lease of a job that is still running."""
+
+    async def complete(self, job_id: str) -> None:
+        """Releases the lease of a finished job."""
+
+    async def recover(self) -> int:
+        """Queues claimed jobs whose lease has expired again; returns how many were requeued."""
+        return 0
+
+    async def requeue(self, job: JobRecord) -> bool:
+        """Puts a claimed job back at the front of the queue (when the server shuts down while it runs).
+        Returns False for backends whose queue does not outlive the process."""
+        return False
+
+    async def close(self) -> None:
+        pass
+
+
+class InMemoryJobBackend(JobBackend):
+    """
+    Default backend: jobs live in process memory and are lost on restart.
+    Finished jobs are kept for `retention` seconds, and at most `max_finished` of them.
+    """
+
+    def __init__(self, retention: float = 3600.0, max_finished: int = 10_000):
+        self.retention = retention
+        self.max_finished = max_finished
+        self._jobs: Dict[str, JobRecord] = {}
+        self._queue: Deque[str] = deque()
+        self._available: Optional[asyncio.Event] = None
+        # Finished job ids in the order they finished, with their finish time
+        self._finished: "OrderedDict[str, float]" = OrderedDict()
+
+    def _event(self) -> asyncio.Event:
+        if self._available is None:
+            self._available = asyncio.Event()
+        return self._available
+
+    async def put(self, job: JobRecord) -> None:
+        self._jobs[job.job_id] = job
+        self._queue.append(job.job_id)
+        self._event().set()
+
+    async def next_job_id(self) -> str:
+        while not self._queue:
+            event = self._event()
+            event.clear()
+            await event.wait()
+        return self._queue.popleft()
+
+    async def get(self, job_id: str) -> Optional[JobRecord]:
+        return self._jobs.get(job_id)
+
+    async def save(self, job: JobRecord) -> None:
+        self._jobs[job.job_id] = job
+        if job.status in (SUCCEEDED, FAILED):
+            self._finished[job.job_id] = job.finished_at or time.time()
+            self._finished.move_to_end(job.job_id)
+        self._prune()
+
+    def _prune(self) -> None:
+        expires = time.time() - self.retention
+        finished = self._finished
+        while finished:
+            job_id, finished_at = next(iter(finished.items()))
+            if finished_at > expires and len(finished) <= self.max_finished:
+                break
+            finished.popitem(last=False)
+            self._jobs.pop(job_id, None)
+
+    async def pending_count(self) -> int:
+        return len(self._queue)
+
+
+class SQLiteJobBackend(JobBackend):
+    """Persists jobs in a SQLite database so that queued jobs survive restarts."""
+
+    def __init__(self, path: str, poll_interval: float = 0.2, lease_seconds: float = DEFAULT_LEASE_SECONDS):
+        self.path = path
+        self.poll_interval = poll_interval
+        self.lease_seconds = lease_seconds
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS gil_jobs ("
+            " job_id TEXT PRIMARY KEY,"
+            " status TEXT NOT NULL,"
+            " submitted_at REAL NOT NULL,"
+            " dequeued INTEGER NOT NULL DEFAULT 0,"
+            " data TEXT NOT NULL)"
+        )
+        self._connection.execute("CREATE INDEX IF NOT EXISTS gil_jobs_queue ON gil_jobs (dequeued, submitted_at)")
+        columns = {row[1] for row in self._connection.execute("PRAGMA table_info(gil_jobs)")}
+        if "lease_until" not in columns:
+            self._connection.execute("ALTER TABLE gil_jobs ADD COLUMN lease_until REAL")
+            # Jobs claimed before leases existed and never finished were left behind by a dead process
+            self._connection.execute(
+                "UPDATE gil_jobs SET lease_until = 0 WHERE dequeued = 1 AND status IN (?, ?)", (QUEUED, RUNNING)
+            )
+        self._available: Optional[asyncio.Event] = None
+
+    def _execute(self, sql: str, params: tuple = ()) -> List[tuple]:
+        with self._lock:
+            return self._connection.execute(sql, params).fetchall()
+
+    def _claim(self) -> Optional[str]:
+        with self._lock:
+            self._connection.execute("BEGIN IMMEDIATE")
+            try:
+                now = time.time()
+                row = self._connection.execute(
+                    "SELECT job_id FROM gil_jobs WHERE dequeued = 0 OR lease_until < ? ORDER BY submitted_at LIMIT 1",
+                    (now,),
+                ).fetchone()
+                if row is not None:
+                    self._connection.execute(
+                        "UPDATE gil_jobs SET dequeued = 1, lease_until = ? WHERE job_id = ?",
+                        (now + self.lease_seconds, row[0]),
+                    )
+                self._connection.execute("COMMIT")
+            except Exception:
+                self._connection.execute("ROLLBACK")
+                raise
+        return row[0] if row is not None else None
+
+    async def put(self, job: JobRecord) -> None:
+        await asyncio.to_thread(
+            self._execute,
+            "INSERT INTO gil_jobs (job_id, status, submitted_at, data) VALUES (?, ?, ?, ?)",
+            (job.job_id, job.status, job.submitted_at, job.to_json()),
+        )
+        if self._available is not None:
+            self._available.set()
+
+    async def next_job_id(self) -> str:
+        if self._available is None:
+            self._available = asyncio.Event()
+        while True:
+            job_id = await asyncio.to_thread(self._claim)
+            if job_id is not None:
+                return job_id
+            # Other processes may enqueue jobs too, so poll as well as waiting for local submissions
+            self._available.clear()
+            try:
+                await asyncio.wait_for(self._available.wait(), self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+
+    async def get(self, job_id: str) -> Optional[JobRecord]:
+        rows = await asyncio.to_thread(self._execute, "SELECT data FROM gil_jobs WHERE job_id = ?", (job_id,))
+        return JobRecord.from_json(rows[0][0]) if rows else None
+
+    async def save(self, job: JobRecord) -> None:
+        await asyncio.to_thread(
+            self._execute,
+            "UPDATE gil_jobs SET status = ?, data = ? WHERE job_id = ?",
+            (job.status, job.to_json(), job.job_id),
+        )
+
+    async def pending_count(self) -> int:
+        rows = await asyncio.to_thread(self._execute, "SELECT COUNT(*) FROM gil_jobs WHERE dequeued = 0")
+        return rows[0][0]
+
+    async def renew(self, job_id: str) -> None:
+        await asyncio.to_thread(
+            self._execute, "UPDATE gil_jobs SET lease_until = ? WHERE job_id = ?", (time.time() + self.lease_seconds, job_id)
+        )
+
+    async def complete(self, job_id: str) -> None:
+        await asyncio.to_thread(self._execute, "UPDATE gil_jobs SET lease_until = NULL WHERE job_id = ?", (job_id,))
+
+    async def requeue(self, job: JobRecord) -> bool:
+        await asyncio.to_thread(
+            self._execute,
+            "UPDATE gil_jobs SET status = ?, dequeued = 0, lease_until = NULL, data = ? WHERE job_id = ?",
+            (job.status, job.to_json(), job.job_id),
+        )
+        return True
+
+    async def recover(self) -> int:
+        # Claiming already picks up expired leases; this only reports them
+        rows = await asyncio.to_thread(
+            self._execute, "SELECT COUNT(*) FROM gil_jobs WHERE dequeued = 1 AND lease_until < ?", (time.time(),)
+        )
+        return rows[0][0]
+
+    async def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+
+class RedisJobBackend(JobBackend):
+    """Stores jobs in Redis (or any server speaking the Redis protocol). Requires the `redis` package."""
+
+    def __init__(
+        self,
+        url: str,
+        prefix: str = "gil:jobs",
+        poll_interval: float = 1.0,
+        lease_seconds: float = DEFAULT_LEASE_SECONDS,
+    ):
+        try:
+            import redis.asyncio as aioredis
+        except ImportError as e:
+            raise ImportError("The Redis job backend requires the 'redis' package: pip install redis") from e
+        self._redis = aioredis.from_url(url, decode_responses=True)
+        self._queue_key = f"{prefix}:queue"
+        self._job_prefix = f"{prefix}:job:"
+        # Claimed job ids stay in this list until completed; each has a lease key that expires
+        self._processing_key = f"{prefix}:processing"
+        self._lease_prefix = f"{prefix}:lease:"
+        self.poll_interval = poll_interval
+        self.lease_seconds = lease_seconds
+        # Claimed ids seen without a lease on the previous `recover` pass; a lease missing twice
+        # is expired rather than not yet set by the process that has just claimed the job
+        self._unleased: Set[str] = set()
+
+    async def put(self, job: JobRecord) -> None:
+        await self._redis.set(self._job_prefix + job.job_id, job.to_json())
+        await self._redis.lpush(self._queue_key, job.job_id)
+
+    async def next_job_id(self) -> str:
+        while True:
+            job_id = await self._redis.blmove(self._queue_key, self._processing_key, self.poll_interval, "RIGHT", "LEFT")
+            if job_id is not None:
+                await self.renew(job_id)
+                return job_id
+            await self.recover()
+
+    async def get(self, job_id: str) -> Optional[JobRecord]:
+        data = await self._redis.get(self._job_prefix + job_id)
+        return JobRecord.from_json(data) if data is not None else None
+
+    async def save(self, job: JobRecord) -> None:
+        await self._redis.set(self._job_prefix + job.job_id, job.to_json())
+
+    async def pending_count(self) -> int:
+        return await self._redis.llen(self._queue_key)
+
+    async def renew(self, job_id: str) -> None:
+        await self._redis.set(self._lease_prefix + job_id, "1", px=int(self.lease_seconds * 1000))
+
+    async def complete(self, job_id: str) -> None:
+        await self._redis.lrem(self._processing_key, 0, job_id)
+        await self._redis.delete(self._lease_prefix + job_id)
+
+    async def requeue(self, job: JobRecord) -> bool:
+        await self.save(job)
+        if await self._redis.lrem(self._processing_key, 0, job.job_id):
+            await self._redis.rpush(self._queue_key, job.job_id)
+        await self._redis.delete(self._lease_prefix + job.job_id)
+        return True
+
+    async def recover(self) -> int:
+        requeued = 0
+        unleased: Set[str] = set()
+        for job_id in await self._redis.lrange(self._processing_key, 0, -1):
+            if await self._redis.exists(self._lease_prefix + job_id):
+                continue
+            if job_id not in self._unleased:
+                unleased.add(job_id)
+                continue
+            # Requeue at the end that is popped next, so the job runs before newer ones
+            if await self._redis.lrem(self._processing_key, 0, job_id):
+                await self._redis.rpush(self._queue_key, job_id)
+                requeued += 1
+        self._unleased = unleased
+        return requeued
+
+    async def close(self) -> None:
+        await self._redis.aclose()
+
+
+def create_job_backend(url: Optional[str] = None) -> JobBackend:
+    """
+    Creates a job backend from a URL (default: the GIL_FLOW_JOB_BACKEND environment variable).
+    Supported values: `memory` (default), `sqlite:///path/to/jobs.db`, `redis://host:port/db`.
+    """
+    url = url or os.getenv("GIL_FLOW_JOB_BACKEND", "memory")
+    if url == "memory":
+        return InMemoryJobBackend(retention=float(os.getenv("GIL_FLOW_JOB_RETENTION", "3600")))
+    if url.startswith("sqlite:///"):
+        return SQLiteJobBackend(url[len("sqlite:///"):])
+    if url.startswith(("redis://", "rediss://", "unix://")):
+        return RedisJobBackend(url)
+    raise ValueError(f"Unsupported job backend: '{url}'")
+
+
+class JobManager:
+    """Runs submitted workflows in the background on a bounded pool of worker tasks."""
+
+    def __init__(
+        self,
+        backend: JobBackend,
+        node_factory: NodeFactory,
+        compiler: WorkflowCompiler,
+        observers: Optional[Sequence[ExecutionObserver]] = None,
+        run_timeout: Optional[float] = None,
+        workers: int = 4,
+        max_pending: int = 1000,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        checkpoints: Optional[CheckpointStore] = None,
+    ):
+        self.backend = backend
+        self.node_factory = node_factory
+        self.compiler = compiler
+        self.observers = observers
+        self.checkpoints = checkpoints
+        self.run_timeout = run_timeout
+        self.workers = workers
+        self.max_pending = max_pending
+        self.max_attempts = max_attempts
+        self._worker_tasks: List["asyncio.Task[None]"] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # Set by shutdown(): jobs cancelled from then on are requeued rather than failed
+        self._stopping = False
+
+    async def start(self) -> None:
+        """Requeues jobs left behind by a previous process and starts the workers, so that jobs
+        still queued in a persistent backend run without waiting for a new submission."""
+        await self.backend.recover()
+        self._ensure_workers()
+
+    def _ensure_workers(self) -> None:
+        """Starts the worker tasks on the running event loop (at startup, or on first submission)."""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop and self._worker_tasks:
+            return
+        self._loop = loop
+        self._worker_tasks = [asyncio.ensure_future(self._worker()) for _ in range(self.workers)]
+
+    async def submit(self, workflow_yaml: str, context: Optional[Dict[str, Any]] = None) -> JobRecord:
+        # Compile up front so that invalid workflows are rejected at submission time
+        self.compiler.compile_yaml(workflow_yaml)
+
+        if await self.backend.pending_count() >= self.max_pending:
+            raise QueueFullError(f"Too many pending jobs (limit: {self.max_pending})")
+
+        job = JobRecord(
+            job_id=uuid.uuid4().hex,
+            workflow_yaml=workflow_yaml,
+            context=context or {},
+            submitted_at=time.time(),
+        )
+        await self.backend.put(job)
+        self._ensure_workers()
+        return job
+
+    async def get(self, job_id: str) -> Optional[JobRecord]:
+        return await self.backend.get(job_id)
+
+    async def _worker(self) -> None:
+        while True:
+            try:
+                await self._process(await self.backend.next_job_id())
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                # Keep the worker alive; a job left claimed is requeued once its lease expires
+                logger.exception("Job worker failed; continuing with the next job")
+                await asyncio.sleep(WORKER_ERROR_DELAY)
+
+    async def _process(self, job_id: str) -> None:
+        job = await self.backend.get(job_id)
+        if job is None:
+            await self.backend.complete(job_id)
+            return
+        heartbeat = asyncio.ensure_future(self._renew_lease(job_id))
+        try:
+            await self._run(job)
+        finally:
+            heartbeat.cancel()
+        await self.backend.complete(job_id)
+
+    async def _renew_lease(self, job_id: str) -> None:
+        while True:
+            await asyncio.sleep(self.backend.lease_seconds / 3)
+            try:
+                await self.backend.renew(job_id)
+            except Exception:
+                # Try again on the next beat; the lease only lapses if renewals keep failing
+                pass
+
+    async def _run(self, job: JobRecord) -> None:
+        if job.status in (SUCCEEDED, FAILED):
+            return
+        job.attempts += 1
+        if job.attempts > self.max_attempts:
+            # The process died while running this job on every earlier attempt
+            job.status = FAILED
+            job.error = f"Job was interrupted {self.max_attempts} times"
+            job.finished_at = time.time()
+            await self.backend.save(job)
+            return
+        job.status = RUNNING
+        job.started_at = time.time()
+        await self.backend.save(job)
+
+        try:
+            workflow = self.compiler.compile_yaml(job.workflow_yaml)
+            executor = WorkflowExecutor(
+                node_factory=self.node_factory, compiler=self.compiler, observers=self.observers, checkpoints=self.checkpoints
+            )
+            with deadline_scope(self.run_timeout):
+                job.result = await executor.execute(workflow, Context(job.context))
+            job.status = SUCCEEDED
+        except asyncio.CancelledError:
+            await self._cancelled(job)
+            raise
+        except Exception as e:
+            job.status = FAILED
+            job.error = str(e)
+
+        job.finished_at = time.time()
+        await self.backend.save(job)
+
+    async def _cancelled(self, job: JobRecord) -> None:
+        if self._stopping:
+            # Interrupted by the server shutting down: run it again after the restart, without
+            # counting this attempt
+            job.status = QUEUED
+            job.started_at = None
+            job.attempts -= 1
+            if await self.backend.requeue(job):
+                return
+            job.error = "Job was cancelled because the server shut down"
+        else:
+            job.error = "Job was cancelled"
+        job.status = FAILED
+        job.finished_at = time.time()
+        await self.backend.save(job)
+
+    async def shutdown(self) -> None:
+        self._stopping = True
+        for task in self._worker_tasks:
+            task.cancel()
+        await asyncio.gather(*self._worker_tasks, return_exceptions=True)
+        self._worker_tasks = []
+        await self.backend.close()
@@ -1,24 +1,83 @@
 from fastapi import FastAPI, HTTPException, Header, Depends
+from fastapi.responses import PlainTextResponse, StreamingResponse
 from pydantic import BaseModel
-from typing import Dict, Any
+from typing import Dict, Any, AsyncIterator, Optional
+import asyncio
+from contextlib import asynccontextmanager
+import json
 import os
+import sys
 
 # gil-py imports
 from gil_py.workflow.executor import WorkflowExecutor
 from gil_py.core.context import Context
+from gil_py.core.deadline import deadline_scope
 from gil_py.workflow.node_factory import NodeFactory
-import yaml
-from gil_py.yaml_parser import YamlWorkflowParser as YamlParser
+from gil_py.workflow.compiler import WorkflowCompiler
+from gil_py.workflow.events import default_observers
+from gil_py.workflow.tracing import get_metrics_registry
+from gil_py.workflow.checkpoint import CheckpointStore, create_checkpoint_store
+from gil_py.workflow.pool import get_node_pool
 
-app = FastAPI()
+from gil_flow_py.jobs import JobManager, QueueFullError, create_job_backend
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Run jobs still queued (or abandoned by a crashed process) in a persistent backend
+    await _job_manager_instance.start()
+    yield
+    await _job_manager_instance.shutdown()
+    # Warm node instances are kept across requests; tear them down, then close the HTTP
+    # connection pools their clients shared. Node packages are loaded lazily, so only close
+    # the OpenAI pools if an OpenAI node was used.
+    await get_node_pool().close()
+    client_pool = sys.modules.get("gil_node_openai.client_pool")
+    if client_pool is not None:
+        await client_pool.close_shared_clients()
+
+app = FastAPI(lifespan=lifespan)
 
 # Initialize NodeFactory globally to discover nodes once
 _node_factory_instance = NodeFactory()
 
+# Compiled workflow plans are cached by YAML content hash and reused across requests
+_workflow_compiler_instance = WorkflowCompiler(node_factory=_node_factory_instance)
+
+# Execution observers shared by every run (logging per GIL_LOG_LEVEL, latency histograms for /metrics)
+_execution_observers = default_observers(metrics=True)
+
+# Upper bound for a single workflow run in seconds (unset: only the workflow's own `timeout` applies)
+def get_run_timeout() -> Optional[float]:
+    value = os.getenv("GIL_FLOW_RUN_TIMEOUT")
+    return float(value) if value else None
+
+# Per-node checkpoints for resuming failed runs; only kept when GIL_CHECKPOINTS is set
+_checkpoint_store: Optional[CheckpointStore] = create_checkpoint_store() if os.getenv("GIL_CHECKPOINTS") else None
+
+# Background job queue; workers start with the server
+_job_manager_instance = JobManager(
+    backend=create_job_backend(),
+    node_factory=_node_factory_instance,
+    compiler=_workflow_compiler_instance,
+    observers=_execution_observers,
+    checkpoints=_checkpoint_store,
+    run_timeout=get_run_timeout(),
+    workers=int(os.getenv("GIL_FLOW_JOB_WORKERS", "4")),
+    max_pending=int(os.getenv("GIL_FLOW_JOB_MAX_PENDING", "1000")),
+)
+
 # Dependency to get NodeFactory instance
 def get_node_factory_dependency():
     return _node_factory_instance
 
+# Dependency to get WorkflowCompiler instance
+def get_workflow_compiler_dependency():
+    return _workflow_compiler_instance
+
+# Dependency to get JobManager instance
+def get_job_manager_dependency():
+    return _job_manager_instance
+
 # In a real application, API keys would be stored securely (e.g., database)
 # and managed with proper authentication mechanisms.
 def get_api_key():
@@ -32,33 +91,162 @@ class WorkflowRequest(BaseModel):
 async def health_check():
     return {"status": "ok"}
 
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """Node and workflow latency histograms in the Prometheus text format."""
+    return PlainTextResponse(get_metrics_registry().to_prometheus(), media_type="text/plain; version=0.0.4")
+
 @app.get("/nodes")
 async def get_available_nodes(node_factory: NodeFactory = Depends(get_node_factory_dependency)):
     """Returns a list of all available node types discovered by the NodeFactory."""
     return {"available_nodes": node_factory.get_available_nodes()}
 
+@app.get("/nodes/{node_type}")
+async def get_node_info(node_type: str, node_factory: NodeFactory = Depends(get_node_factory_dependency)):
+    """Returns a node type's description and ports, read from its class without creating an instance."""
+    info = node_factory.get_node_info(node_type)
+    if "error" in info:
+        raise HTTPException(status_code=404, detail=info["error"])
+    return info
+
 @app.post("/workflows/run")
-async def run_workflow(request: WorkflowRequest, x_api_key: str = Header(...), node_factory: NodeFactory = Depends(get_node_factory_dependency)):
+async def run_workflow(request: WorkflowRequest, x_api_key: str = Header(...), node_factory: NodeFactory = Depends(get_node_factory_dependency), compiler: WorkflowCompiler = Depends(get_workflow_compiler_dependency)):
     if x_api_key != get_api_key():
         raise HTTPException(status_code=401, detail="Invalid API Key")
 
     try:
-        # Parse the workflow YAML
-        parser = YamlParser()
-        workflow_dict = yaml.safe_load(request.workflow_yaml)
-        workflow = parser.parse_dict(workflow_dict)
+        # Parse and compile the workflow YAML (cached by content hash)
+        workflow = compiler.compile_yaml(request.workflow_yaml)
 
         # Create context
         context = Context(request.context)
 
         # Execute the workflow
-        executor = WorkflowExecutor(node_factory=node_factory)
-        result = await executor.execute(workflow, context)
+        executor = WorkflowExecutor(node_factory=node_factory, compiler=compiler, observers=_execution_observers, checkpoints=_checkpoint_store)
+        with deadline_scope(get_run_timeout()):
+            result = await executor.execute(workflow, context)
 
         return {"status": "success", "result": result}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/workflows/runs/{run_id}/resume")
+async def resume_workflow(run_id: str, request: WorkflowRequest, x_api_key: str = Header(...), node_factory: NodeFactory = Depends(get_node_factory_dependency), compiler: WorkflowCompiler = Depends(get_workflow_compiler_dependency)):
+    """
+    Reruns a checkpointed run, reusing the stored output of every node whose type,
+    config and resolved inputs are unchanged; only the remaining nodes are executed.
+    """
+    if x_api_key != get_api_key():
+        raise HTTPException(status_code=401, detail="Invalid API Key")
+    if _checkpoint_store is None:
+        raise HTTPException(status_code=400, detail="Checkpoints are disabled (set GIL_CHECKPOINTS to enable them)")
+    if await _checkpoint_store.call("load", run_id) is None:
+        raise HTTPException(status_code=404, detail=f"Run '{run_id}' not found")
+
+    try:
+        workflow = compiler.compile_yaml(request.workflow_yaml)
+        context = Context(request.context)
+        executor = WorkflowExecutor(node_factory=node_factory, compiler=compiler, observers=_execution_observers, checkpoints=_checkpoint_store)
+        with deadline_scope(get_run_timeout()):
+            result = await executor.execute(workflow, context, resume=run_id)
+
+        return {"status": "success", "result": result}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+def _sse(event: str, data: Any) -> str:
+    """Formats a single server-sent event."""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False, default=str)}\n\n"
+
+def _ndjson(event: str, data: Any) -> str:
+    """Formats a single newline-delimited JSON event."""
+    return json.dumps({"event": event, **data}, ensure_ascii=False, default=str) + "\n"
+
+STREAM_FORMATS = {
+    "sse": (_sse, "text/event-stream"),
+    "ndjson": (_ndjson, "application/x-ndjson"),
+}
+
+async def _stream_workflow_events(executor: WorkflowExecutor, workflow, context: Context, formatter) -> AsyncIterator[str]:
+    """Runs the workflow and yields its progress events as they happen, followed by the final result."""
+    queue: asyncio.Queue = asyncio.Queue()
+
+    def on_event(event_type: str, data: Dict[str, Any]) -> None:
+        queue.put_nowait((event_type, data))
+
+    # The run task copies the current context, including the deadline
+    with deadline_scope(get_run_timeout()):
+        run = asyncio.ensure_future(executor.execute(workflow, context, on_event=on_event))
+    run.add_done_callback(lambda _: queue.put_nowait(None))
+
+    try:
+        while True:
+            item = await queue.get()
+            if item is None:
+                break
+            yield formatter(*item)
+
+        try:
+            yield formatter("result", {"status": "success", "result": run.result()})
+        except Exception as e:
+            yield formatter("error", {"status": "error", "detail": str(e)})
+    finally:
+        # The client may disconnect before the run finishes
+        if not run.done():
+            run.cancel()
+
+@app.post("/workflows/run/stream")
+async def run_workflow_stream(request: WorkflowRequest, format: str = "sse", x_api_key: str = Header(...), node_factory: NodeFactory = Depends(get_node_factory_dependency), compiler: WorkflowCompiler = Depends(get_workflow_compiler_dependency)):
+    """
+    Runs a workflow and streams its progress (node started/finished/failed events with
+    outputs and timings, streamed output tokens) as server-sent events or NDJSON.
+    """
+    if x_api_key != get_api_key():
+        raise HTTPException(status_code=401, detail="Invalid API Key")
+    if format not in STREAM_FORMATS:
+        raise HTTPException(status_code=400, detail=f"Unsupported stream format: '{format}'. Use 'sse' or 'ndjson'.")
+
+    try:
+        workflow = compiler.compile_yaml(request.workflow_yaml)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+    formatter, media_type = STREAM_FORMATS[format]
+    context = Context(request.context)
+    executor = WorkflowExecutor(node_factory=node_factory, compiler=compiler, observers=_execution_observers, checkpoints=_checkpoint_store)
+    return StreamingResponse(
+        _stream_workflow_events(executor, workflow, context, formatter),
+        media_type=media_type,
+        # Ask reverse proxies not to buffer the stream
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+@app.post("/workflows/jobs", status_code=202)
+async def submit_workflow_job(request: WorkflowRequest, x_api_key: str = Header(...), jobs: JobManager = Depends(get_job_manager_dependency)):
+    """Queues a workflow run and returns its job id immediately; poll GET /workflows/jobs/{job_id} for the result."""
+    if x_api_key != get_api_key():
+        raise HTTPException(status_code=401, detail="Invalid API Key")
+
+    try:
+        job = await jobs.submit(request.workflow_yaml, request.context)
+    except QueueFullError as e:
+        raise HTTPException(status_code=429, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+    return {"job_id": job.job_id, "status": job.status}
+
+@app.get("/workflows/jobs/{job_id}")
+async def get_workflow_job(job_id: str, x_api_key: str = Header(...), jobs: JobManager = Depends(get_job_manager_dependency)):
+    """Returns the status of a queued job, and its result or error once it has finished."""
+    if x_api_key != get_api_key():
+        raise HTTPException(status_code=401, detail="Invalid API Key")
+
+    job = await jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job '{job_id}' not found")
+    return job.public_dict()
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
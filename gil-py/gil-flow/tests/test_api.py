@@ -1,3 +1,4 @@
+import asyncio
 import sys
 import os
 
@@ -50,6 +51,20 @@ async def test_get_nodes(client):
     assert "Util-SetVariable" in response.json()["available_nodes"]
     assert "Control-Branch" in response.json()["available_nodes"]
 
+@pytest.mark.asyncio
+async def test_get_node_info_reads_ports_without_config(client):
+    from gil_node_data.transform import DataTransformNode
+
+    get_node_factory_dependency().register("Test-Transform", DataTransformNode)
+    response = client.get("/nodes/Test-Transform")
+    assert response.status_code == 200
+    info = response.json()
+    assert info["class"] == "DataTransformNode"
+    assert [port["name"] for port in info["input_ports"]] == ["input_data"]
+    assert info["output_ports"][0]["type"] == "any"
+
+    assert client.get("/nodes/Test-Missing").status_code == 404
+
 @pytest.mark.asyncio
 async def test_run_workflow_success(client):
     workflow_yaml = """
@@ -121,3 +136,356 @@ async def test_run_workflow_invalid_yaml(client):
     assert response.status_code == 500
     assert "detail" in response.json()
     assert "while parsing a flow node" in response.json()["detail"]
+
+
+@pytest.mark.asyncio
+async def test_run_workflow_stream_sends_tokens_as_sse(client):
+    from gil_py.core.node import Node
+    from gil_py.core.stream import TokenStream
+
+    class StreamingEchoNode(Node):
+        async def execute(self, data, context):
+            return {"output": TokenStream.from_source(iter(["Hel", "lo"]))}
+
+    get_node_factory_dependency().register("Test-StreamingEcho", StreamingEchoNode)
+    workflow_yaml = """
+    version: "1.0"
+    name: Streaming Test Workflow
+    nodes:
+      echo:
+        type: Test-StreamingEcho
+    flow:
+      - echo
+    """
+    response = client.post(
+        "/workflows/run/stream",
+        headers={"X-API-Key": "test_api_key"},
+        json={"workflow_yaml": workflow_yaml}
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    body = response.text
+    assert 'event: node_token\ndata: {"node": "echo", "port": "output", "chunk": "Hel"}' in body
+    assert "event: result" in body
+    assert '"output": "Hello"' in body
+
+
+@pytest.mark.asyncio
+async def test_run_workflow_stream_reports_progress_as_ndjson(client):
+    import json
+    from gil_py.core.node import Node
+
+    class UpperNode(Node):
+        async def execute(self, data, context):
+            return {"output": data["input"].upper()}
+
+    get_node_factory_dependency().register("Test-Upper", UpperNode)
+    workflow_yaml = """
+    version: "1.0"
+    name: Progress Test Workflow
+    nodes:
+      upper:
+        type: Test-Upper
+        inputs:
+          input: hello
+    flow:
+      - upper
+    """
+    response = client.post(
+        "/workflows/run/stream?format=ndjson",
+        headers={"X-API-Key": "test_api_key"},
+        json={"workflow_yaml": workflow_yaml}
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    events = [json.loads(line) for line in response.text.splitlines()]
+    assert [event["event"] for event in events] == ["run_started", "node_started", "node_finished", "run_finished", "result"]
+    assert events[2]["node"] == "upper"
+    assert events[2]["output"] == {"output": "HELLO"}
+    assert events[2]["duration_ms"] >= 0
+
+
+@pytest.mark.asyncio
+async def test_workflow_job_can_be_polled_until_finished(override_api_key):
+    import time
+    from gil_py.core.node import Node
+
+    class DoubleNode(Node):
+        async def execute(self, data, context):
+            return {"output": data["input"] * 2}
+
+    get_node_factory_dependency().register("Test-Double", DoubleNode)
+    workflow_yaml = """
+    version: "1.0"
+    name: Job Test Workflow
+    nodes:
+      double:
+        type: Test-Double
+        inputs:
+          input: 21
+    flow:
+      - double
+    """
+    # Keep a single event loop across requests so that the job workers stay alive
+    with TestClient(app) as client:
+        response = client.post(
+            "/workflows/jobs",
+            headers={"X-API-Key": "test_api_key"},
+            json={"workflow_yaml": workflow_yaml}
+        )
+        assert response.status_code == 202
+        job_id = response.json()["job_id"]
+
+        deadline = time.time() + 5
+        while True:
+            job = client.get(f"/workflows/jobs/{job_id}", headers={"X-API-Key": "test_api_key"}).json()
+            if job["status"] not in ("queued", "running") or time.time() > deadline:
+                break
+            time.sleep(0.05)
+
+        assert job["status"] == "succeeded"
+        assert job["result"]["node_outputs"]["double"] == {"output": 42}
+        assert job["finished_at"] >= job["started_at"] >= job["submitted_at"]
+
+        missing = client.get("/workflows/jobs/unknown", headers={"X-API-Key": "test_api_key"})
+        assert missing.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_sqlite_job_backend_persists_queue(tmp_path):
+    from gil_flow_py.jobs import JobRecord, SQLiteJobBackend
+
+    path = str(tmp_path / "jobs.db")
+    backend = SQLiteJobBackend(path)
+    await backend.put(JobRecord(job_id="first", workflow_yaml="", submitted_at=1.0))
+    await backend.put(JobRecord(job_id="second", workflow_yaml="", submitted_at=2.0))
+    await backend.close()
+
+    # A new backend on the same file picks up the queued jobs in order
+    backend = SQLiteJobBackend(path)
+    assert await backend.pending_count() == 2
+    assert await backend.next_job_id() == "first"
+    assert await backend.pending_count() == 1
+    job = await backend.get("first")
+    job.status = "succeeded"
+    await backend.save(job)
+    assert (await backend.get("first")).status == "succeeded"
+    await backend.close()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_job_backend_requeues_jobs_whose_lease_expired(tmp_path):
+    from gil_flow_py.jobs import JobRecord, SQLiteJobBackend
+
+    path = str(tmp_path / "jobs.db")
+    backend = SQLiteJobBackend(path, lease_seconds=0.05)
+    await backend.put(JobRecord(job_id="abandoned", workflow_yaml="", submitted_at=1.0))
+    assert await backend.next_job_id() == "abandoned"
+    await backend.close()
+
+    # The process that claimed the job died without renewing the lease
+    await asyncio.sleep(0.1)
+    backend = SQLiteJobBackend(path, lease_seconds=0.05)
+    assert await backend.recover() == 1
+    assert await backend.next_job_id() == "abandoned"
+    await backend.complete("abandoned")
+    await asyncio.sleep(0.1)
+    assert await backend.recover() == 0
+    await backend.close()
+
+
+@pytest.mark.asyncio
+async def test_job_manager_runs_queued_jobs_on_start(tmp_path):
+    from gil_flow_py.jobs import JobManager, JobRecord, SQLiteJobBackend
+    from gil_py.workflow.compiler import WorkflowCompiler
+
+    factory = NodeFactory()
+    factory.register("Util-SetVariable", UtilSetVariableNode)
+    workflow_yaml = """
+    version: "1.0"
+    name: Queued Job
+    nodes:
+      set:
+        type: Util-SetVariable
+        config:
+          variable_name: answer
+        inputs:
+          value: 42
+    flow:
+      - set
+    """
+    backend = SQLiteJobBackend(str(tmp_path / "jobs.db"), poll_interval=0.01)
+    await backend.put(JobRecord(job_id="queued", workflow_yaml=workflow_yaml, submitted_at=1.0))
+    manager = JobManager(backend=backend, node_factory=factory, compiler=WorkflowCompiler(factory), workers=1)
+
+    await manager.start()
+    for _ in range(200):
+        job = await backend.get("queued")
+        if job.status not in ("queued", "running"):
+            break
+        await asyncio.sleep(0.01)
+    await manager.shutdown()
+
+    assert job.status == "succeeded"
+    assert job.attempts == 1
+
+
+SLOW_WORKFLOW = """
+version: "1.0"
+name: Slow Job
+nodes:
+  slow:
+    type: Test-Slow
+flow:
+  - slow
+"""
+
+
+def make_slow_job_manager(backend):
+    from gil_flow_py.jobs import JobManager
+    from gil_py.core.node import Node
+    from gil_py.workflow.compiler import WorkflowCompiler
+
+    class SlowNode(Node):
+        async def execute(self, data, context):
+            await asyncio.sleep(10)
+            return {"output": None}
+
+    factory = NodeFactory()
+    factory.register("Test-Slow", SlowNode)
+    return JobManager(backend=backend, node_factory=factory, compiler=WorkflowCompiler(factory), workers=1)
+
+
+async def wait_for_status(backend, job_id, status):
+    for _ in range(200):
+        job = await backend.get(job_id)
+        if job.status == status:
+            return job
+        await asyncio.sleep(0.01)
+    raise AssertionError(f"job {job_id} never became {status}")
+
+
+@pytest.mark.asyncio
+async def test_jobs_running_at_shutdown_are_requeued_in_persistent_backends(tmp_path):
+    from gil_flow_py.jobs import SQLiteJobBackend
+
+    path = str(tmp_path / "jobs.db")
+    manager = make_slow_job_manager(SQLiteJobBackend(path, poll_interval=0.01))
+    await manager.start()
+    job = await manager.submit(SLOW_WORKFLOW)
+    await wait_for_status(manager.backend, job.job_id, "running")
+    await manager.shutdown()
+
+    backend = SQLiteJobBackend(path)
+    job = await backend.get(job.job_id)
+    assert job.status == "queued" and job.attempts == 0 and job.error is None
+    assert await backend.pending_count() == 1
+    await backend.close()
+
+
+@pytest.mark.asyncio
+async def test_jobs_running_at_shutdown_fail_in_the_memory_backend():
+    from gil_flow_py.jobs import InMemoryJobBackend
+
+    backend = InMemoryJobBackend()
+    manager = make_slow_job_manager(backend)
+    await manager.start()
+    job = await manager.submit(SLOW_WORKFLOW)
+    await wait_for_status(backend, job.job_id, "running")
+    await manager.shutdown()
+
+    job = await backend.get(job.job_id)
+    assert job.status == "failed" and "shut down" in job.error
+
+
+@pytest.mark.asyncio
+async def test_job_worker_survives_backend_errors(monkeypatch):
+    from gil_flow_py import jobs
+    from gil_flow_py.jobs import InMemoryJobBackend
+
+    class FlakyBackend(InMemoryJobBackend):
+        async def get(self, job_id):
+            if job_id == "broken":
+                raise RuntimeError("backend unavailable")
+            return await super().get(job_id)
+
+    monkeypatch.setattr(jobs, "WORKER_ERROR_DELAY", 0)
+    backend = FlakyBackend()
+    factory = NodeFactory()
+    factory.register("Util-SetVariable", UtilSetVariableNode)
+    manager = jobs.JobManager(backend=backend, node_factory=factory, compiler=jobs.WorkflowCompiler(factory), workers=1)
+    await backend.put(jobs.JobRecord(job_id="broken", workflow_yaml="", submitted_at=1.0))
+    job = await manager.submit("""
+    version: "1.0"
+    name: After Error
+    nodes:
+      set:
+        type: Util-SetVariable
+        config:
+          variable_name: answer
+        inputs:
+          value: 42
+    flow:
+      - set
+    """)
+
+    assert (await wait_for_status(backend, job.job_id, "succeeded")).attempts == 1
+    await manager.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_memory_job_backend_forgets_finished_jobs():
+    from gil_flow_py.jobs import InMemoryJobBackend, JobRecord
+
+    backend = InMemoryJobBackend(retention=60, max_finished=2)
+    for index in range(3):
+        await backend.put(JobRecord(job_id=f"job-{index}", workflow_yaml="", submitted_at=float(index)))
+        job = await backend.get(f"job-{index}")
+        job.status = "succeeded"
+        await backend.save(job)
+    await backend.put(JobRecord(job_id="waiting", workflow_yaml="", submitted_at=3.0))
+
+    # Only the most recently finished jobs are kept; queued jobs are never dropped
+    assert await backend.get("job-0") is None
+    assert (await backend.get("job-2")).status == "succeeded"
+    assert await backend.get("waiting") is not None
+
+    backend.retention = 0
+    await backend.save(await backend.get("waiting"))
+    assert await backend.get("job-1") is None and await backend.get("job-2") is None
+    assert await backend.get("waiting") is not None
+
+
+@pytest.mark.asyncio
+async def test_metrics_exposes_node_latency_histograms(client):
+    from gil_py.core.node import Node
+
+    class NoopNode(Node):
+        async def execute(self, data, context):
+            return {"output": None}
+
+    get_node_factory_dependency().register("Test-Noop", NoopNode)
+    workflow_yaml = """
+    version: "1.0"
+    name: Metrics Test Workflow
+    nodes:
+      noop:
+        type: Test-Noop
+    flow:
+      - noop
+    """
+    client.post("/workflows/run", headers={"X-API-Key": "test_api_key"}, json={"workflow_yaml": workflow_yaml})
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert 'gil_node_duration_seconds_count{node_type="Test-Noop",phase="execute"}' in response.text
+    assert 'gil_workflow_duration_seconds_count{workflow="Metrics Test Workflow",status="ok"}' in response.text
+
+
+def test_server_import_does_not_load_node_packages():
+    import subprocess
+
+    code = "import sys, gil_flow_py.main; print('openai' in sys.modules or 'gil_node_openai' in sys.modules)"
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, env=os.environ)
+    assert output.stdout.strip() == "False"
@@ -4,8 +4,10 @@ Gil CLI 메인 모듈
 
 import argparse
 import asyncio
+import os
 import sys
 import json
+import time
 from pathlib import Path
 
 # 환경 변수 로드
@@ -14,6 +16,8 @@ load_dotenv()
 
 from ..workflow.workflow import GilWorkflow
 from ..workflow.node_factory import NodeFactory
+from ..workflow.events import DEBUG, INFO, ConsoleObserver, JsonLogObserver
+from ..workflow.checkpoint import get_checkpoint_store
 
 
 def main():
@@ -25,6 +29,11 @@ def main():
 예시:
   gil run workflow.yaml                    # 워크플로우 실행
   gil run workflow.yaml --input theme=ai  # 입력과 함께 실행
+  gil run workflow.yaml --debug --log-json # 노드 입력을 포함한 JSON 로그
+  gil run workflow.yaml --checkpoint       # 실패하면 이어서 실행할 수 있도록 체크포인트 저장
+  gil run workflow.yaml --resume <실행 ID>  # 중단된 실행을 이어서 실행
+  gil run workflow.yaml --incremental     # 바뀐 노드와 그 후행 노드만 다시 실행
+  gil runs                                # 최근 실행 체크포인트 목록
   gil validate workflow.yaml              # 워크플로우 검증
   gil list-nodes                          # 사용 가능한 노드 목록
   gil describe GilGenImage                # 노드 상세 정보
@@ -41,7 +50,16 @@ def main():
     run_parser.add_argument("--input", action="append", help="입력 파라미터 (key=value 형태)")
     run_parser.add_argument("--nodes", help="실행할 노드들 (쉼표로 구분)")
     run_parser.add_argument("--debug", action="store_true", help="디버그 모드")
+    run_parser.add_argument("--log-json", action="store_true", help="실행 로그를 JSON 줄 형식으로 stderr에 기록")
     run_parser.add_argument("--output", help="결과 저장할 JSON 파일")
+    run_parser.add_argument("--resume", metavar="RUN_ID", help="이전 실행을 이어서 실행 (완료된 노드는 건너뜀)")
+    run_parser.add_argument("--incremental", action="store_true", help="이전 실행과 지문이 같은 노드는 저장된 결과를 재사용")
+    run_parser.add_argument("--checkpoint", action="store_true", help="실패하면 --resume으로 이어서 실행할 수 있도록 실행 체크포인트 저장")
+    run_parser.add_argument("--no-checkpoint", action="store_true", help="GIL_CHECKPOINTS가 설정되어 있어도 체크포인트를 저장하지 않음")
+
+    # runs 명령어
+    runs_parser = subparsers.add_parser("runs", help="최근 실행 체크포인트 목록")
+    runs_parser.add_argument("--limit", type=int, default=20, help="표시할 실행 수")
     
     # validate 명령어
     validate_parser = subparsers.add_parser("validate", help="워크플로우 검증")
@@ -69,6 +87,8 @@ def main():
     
     if args.command == "run":
         asyncio.run(handle_run(args))
+    elif args.command == "runs":
+        handle_runs(args)
     elif args.command == "validate":
         handle_validate(args)
     elif args.command == "visualize":
@@ -91,11 +111,29 @@ async def handle_run(args):
         print(f"❌ 워크플로우 파일을 찾을 수 없습니다: {workflow_path}")
         sys.exit(1)
     
+    workflow = None
     try:
         # 워크플로우 로드
         print(f"📋 워크플로우 로드 중: {workflow_path}")
         workflow = GilWorkflow.from_yaml(workflow_path)
         
+        # 실행 로그 설정 (옵션이 없으면 GIL_LOG_LEVEL/GIL_LOG_FORMAT 환경 변수 사용)
+        if args.debug or args.log_json:
+            level = DEBUG if args.debug else INFO
+            observer = JsonLogObserver(level=level) if args.log_json else ConsoleObserver(level=level)
+            workflow.executor.observers = [observer]
+
+        # 실행 체크포인트 (--checkpoint/--resume/--incremental 또는 GIL_CHECKPOINTS가 설정된 경우에만 저장,
+        # 저장소는 GIL_CHECKPOINTS, 기본값 .gil/checkpoints.db)
+        if args.resume and args.incremental:
+            print("❌ --resume과 --incremental은 함께 사용할 수 없습니다")
+            sys.exit(1)
+        if (args.resume or args.incremental) and args.no_checkpoint:
+            print("❌ --resume/--incremental과 --no-checkpoint는 함께 사용할 수 없습니다")
+            sys.exit(1)
+        if (args.resume or args.incremental or args.checkpoint or os.getenv("GIL_CHECKPOINTS")) and not args.no_checkpoint:
+            workflow.executor.checkpoints = get_checkpoint_store()
+        
         # 입력 파라미터 파싱
         inputs = {}
         if args.input:
@@ -118,11 +156,26 @@ async def handle_run(args):
                 return
         
         # 워크플로우 실행
-        print("🚀 워크플로우 실행 시작...")
-        result = await workflow.run(inputs)
+        if args.resume:
+            print(f"⏯️ 실행 재개: {args.resume}")
+        else:
+            print("🚀 워크플로우 실행 시작...")
+        # 증분 실행은 워크플로우 파일마다 하나의 체크포인트를 이어서 사용
+        incremental = str(workflow_path.resolve()) if args.incremental else False
+        result = await workflow.run(inputs, resume=args.resume, incremental=incremental)
         
         # 결과 출력
         print("✅ 워크플로우 실행 완료!")
+        if args.incremental or args.resume:
+            reused = result["reused"]
+            executed = [name for name in result["node_outputs"] if name not in reused]
+            print(f"♻️ 재사용: {', '.join(reused) or '없음'} / 실행: {', '.join(executed) or '없음'}")
+        failed_nodes = [name for name, output in result["node_outputs"].items() if isinstance(output, dict) and "error" in output]
+        if failed_nodes and workflow.executor.checkpoints is not None:
+            print(f"⚠️ 실패한 노드: {', '.join(failed_nodes)}")
+            print(f"   이어서 실행: gil run {args.workflow} --resume {result['run_id']}")
+        elif failed_nodes:
+            print(f"⚠️ 실패한 노드: {', '.join(failed_nodes)}")
         
         if args.output:
             # JSON 파일로 저장
@@ -145,12 +198,26 @@ async def handle_run(args):
     
     except Exception as e:
         print(f"❌ 오류 발생: {e}")
+        if workflow is not None and workflow.executor.run_id and workflow.executor.checkpoints is not None:
+            print(f"   이어서 실행: gil run {args.workflow} --resume {workflow.executor.run_id}")
         if args.debug:
             import traceback
             traceback.print_exc()
         sys.exit(1)
 
 
+def handle_runs(args):
+    """최근 실행 체크포인트 목록"""
+    runs = get_checkpoint_store().list_runs(args.limit)
+    if not runs:
+        print("저장된 실행이 없습니다.")
+        return
+    print("📜 최근 실행:")
+    for run in runs:
+        updated = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(run.updated_at)) if run.updated_at else "-"
+        print(f"   {run.run_id}  {run.status:<8}  {updated}  {run.workflow}")
+
+
 def handle_validate(args):
     """워크플로우 검증 처리"""
     workflow_path = Path(args.workflow)
@@ -249,14 +316,15 @@ def handle_describe(args):
     print(f"📝 설명: {node_info['description']}")
     print()
     
-    if "input_ports" in node_info:
+    if node_info.get("input_ports"):
         print("📥 입력 포트:")
         for port in node_info["input_ports"]:
             required = "필수" if port["required"] else "선택"
-            print(f"   - {port['name']} ({port['type']}, {required}): {port['description']}")
+            default = f", 기본값 {port['default']!r}" if port.get("default") is not None else ""
+            print(f"   - {port['name']} ({port['type']}, {required}{default}): {port['description']}")
         print()
     
-    if "output_ports" in node_info:
+    if node_info.get("output_ports"):
         print("📤 출력 포트:")
         for port in node_info["output_ports"]:
             print(f"   - {port['name']} ({port['type']}): {port['description']}")
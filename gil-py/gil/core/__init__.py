@@ -6,6 +6,7 @@ from .node import Node
 from .port import Port, InputPort, OutputPort
 from .connection import Connection
 from .data_types import DataType
+from .stream import TokenStream
 
 __all__ = [
     "Node",
@@ -14,4 +15,5 @@ __all__ = [
     "OutputPort",
     "Connection", 
     "DataType",
+    "TokenStream",
 ]
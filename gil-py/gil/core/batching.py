@@ -0,0 +1,89 @@
+"""
+Gil 마이크로 배치 - 동시에 들어온 호출을 짧은 시간 동안 모아 한 번에 처리
+"""
+
+import asyncio
+import contextvars
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Sequence, Set, Tuple
+
+# 배치 처리 함수: (key, items) -> 항목별 결과 (예외 객체를 반환하면 그 항목만 실패)
+BatchFunction = Callable[[Hashable, List[Any]], Awaitable[Sequence[Any]]]
+
+
+class _Batch:
+    __slots__ = ("items", "futures", "timer")
+
+    def __init__(self) -> None:
+        self.items: List[Any] = []
+        self.futures: List["asyncio.Future[Any]"] = []
+        self.timer: Optional[asyncio.TimerHandle] = None
+
+
+class MicroBatcher:
+    """같은 `key`로 `window`초 안에 들어온 호출을 모아 `flush(key, items)`를 한 번 호출
+
+    배치가 `max_size`개가 되면 기다리지 않고 바로 처리합니다. 결과는 입력 순서대로
+    각 호출자에게 돌려주며, 결과 자리에 예외 객체가 있으면 해당 호출만 그 예외로 실패합니다.
+    배치 처리는 호출자의 컨텍스트(마감 시각 등)와 분리된 태스크에서 실행되고,
+    처리 전에 취소된 호출은 배치에서 빠집니다.
+    """
+
+    def __init__(self, flush: BatchFunction, window: float = 0.01, max_size: int = 32):
+        if max_size < 1:
+            raise ValueError("max_size는 1 이상이어야 합니다")
+        self.flush = flush
+        self.window = window
+        self.max_size = max_size
+        # 이벤트 루프마다 따로 모음 (Future는 만든 루프에서만 기다릴 수 있음)
+        self._batches: Dict[Tuple[asyncio.AbstractEventLoop, Hashable], _Batch] = {}
+        self._tasks: Set["asyncio.Task[None]"] = set()
+
+    async def submit(self, key: Hashable, item: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        batch_key = (loop, key)
+        batch = self._batches.get(batch_key)
+        if batch is None:
+            batch = self._batches[batch_key] = _Batch()
+            batch.timer = loop.call_later(self.window, self._dispatch, batch_key, context=contextvars.Context())
+
+        future = loop.create_future()
+        batch.items.append(item)
+        batch.futures.append(future)
+        if len(batch.items) >= self.max_size:
+            self._dispatch(batch_key)
+        return await future
+
+    def _dispatch(self, batch_key: Tuple[asyncio.AbstractEventLoop, Hashable]) -> None:
+        batch = self._batches.pop(batch_key, None)
+        if batch is None:
+            return
+        if batch.timer is not None:
+            batch.timer.cancel()
+        loop, key = batch_key
+        task = contextvars.Context().run(loop.create_task, self._run(key, batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, key: Hashable, batch: _Batch) -> None:
+        pending = [(item, future) for item, future in zip(batch.items, batch.futures) if not future.done()]
+        if not pending:
+            return
+        try:
+            results = await self.flush(key, [item for item, _ in pending])
+            if len(results) != len(pending):
+                raise RuntimeError(f"배치 결과 수({len(results)})가 요청 수({len(pending)})와 다릅니다")
+        except BaseException as e:
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(e)
+            if isinstance(e, asyncio.CancelledError):
+                raise
+            return
+
+        for (_, future), result in zip(pending, results):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
@@ -2,19 +2,36 @@
 Gil 연결 시스템
 """
 
-from pydantic import BaseModel, Field
+from typing import Optional
 import uuid
 
 
-class Connection(BaseModel):
-    """노드 간 연결을 나타내는 클래스"""
-    
-    connection_id: str = Field(default_factory=lambda: str(uuid.uuid4()), description="연결 고유 ID")
-    source_node_id: str = Field(description="출력 노드 ID")
-    source_port: str = Field(description="출력 포트명")
-    target_node_id: str = Field(description="입력 노드 ID")
-    target_port: str = Field(description="입력 포트명")
-    active: bool = Field(default=True, description="연결 활성화 상태")
-    
+class Connection:
+    """노드 간 연결을 나타내는 클래스
+
+    연결 ID는 처음 조회할 때 생성합니다 (연결을 만들 때마다 uuid를 생성하지 않도록).
+    """
+
+    __slots__ = ("source_node_id", "source_port", "target_node_id", "target_port", "active", "_connection_id")
+
+    def __init__(self, source_node_id: str, source_port: str, target_node_id: str, target_port: str,
+                 active: bool = True, connection_id: Optional[str] = None):
+        self.source_node_id = source_node_id
+        self.source_port = source_port
+        self.target_node_id = target_node_id
+        self.target_port = target_port
+        self.active = active
+        self._connection_id = connection_id
+
+    @property
+    def connection_id(self) -> str:
+        """연결 고유 ID"""
+        if self._connection_id is None:
+            self._connection_id = str(uuid.uuid4())
+        return self._connection_id
+
+    def __repr__(self) -> str:
+        return f"Connection({self})"
+
     def __str__(self) -> str:
         return f"{self.source_node_id}:{self.source_port} -> {self.target_node_id}:{self.target_port}"
@@ -1,5 +1,5 @@
 from gil_py.core.node import Node
-from gil_py.core.port import Port
+from gil_py.core.port import InputPort, OutputPort
 from gil_py.core.data_types import DataType
 from gil_py.core.context import Context
 
@@ -10,32 +10,35 @@ class ControlBranchNode(Node):
     Otherwise, it is passed to the 'false_output'.
     """
 
-    def __init__(self, node_id: str, node_config: dict):
-        super().__init__(node_id, node_config)
-
-        self.add_input_port(Port(
+    input_port_schema = (
+        InputPort(
             name="condition",
             data_type=DataType.BOOLEAN,
             description="The boolean value to determine the branch.",
             required=True
-        ))
-        self.add_input_port(Port(
+        ),
+        InputPort(
             name="input",
             data_type=DataType.ANY,
             description="The data to pass through to the selected branch.",
             required=True
-        ))
-        
-        self.add_output_port(Port(
+        ),
+    )
+    output_port_schema = (
+        OutputPort(
             name="true_output",
             data_type=DataType.ANY,
             description="Output for when the condition is true."
-        ))
-        self.add_output_port(Port(
+        ),
+        OutputPort(
             name="false_output",
             data_type=DataType.ANY,
             description="Output for when the condition is false."
-        ))
+        ),
+    )
+
+    def __init__(self, node_id: str, node_config: dict):
+        super().__init__(node_id=node_id, node_config=node_config)
 
     async def execute(self, data: dict, context: Context) -> dict:
         """
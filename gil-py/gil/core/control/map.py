@@ -0,0 +1,154 @@
+import asyncio
+from typing import Any, ClassVar, Dict, List, Tuple
+
+from gil_py.core.node import Node
+from gil_py.core.port import InputPort, OutputPort
+from gil_py.core.data_types import DataType
+from gil_py.core.context import Context
+
+ON_ERROR_MODES = ("fail", "skip", "null")
+
+
+class ControlMapNode(Node):
+    """
+    Runs a nested node or sub-workflow once per element of an array (data-parallel fan-out).
+    Each element runs in its own copy of the context, with the element under `item_key`
+    (default `item`) and its position under `index_key` (default `index`), so nested
+    inputs can refer to them as `$item` and `$index`.
+
+    Config:
+    - `node`: a node definition (`type`, `config`, `inputs`, `retry`, `timeout`, ...), or
+    - `workflow`: a sub-workflow (a mapping with `nodes` and `flow`, or the path to a YAML file)
+    - `output`: what to collect per element; a port name for `node` (default: the whole result),
+      `node_id` or `node_id.port` for `workflow` (default: all node outputs)
+    - `concurrency`: elements processed at the same time (default 8)
+    - `ordered`: `true` (default) keeps results in input order, `false` collects them as they finish
+    - `on_error`: `fail` (default) stops at the first failed element, `skip` leaves failed elements
+      out of `results`, `null` puts None in their place; failures are listed in `errors` either way
+    """
+
+    # Each element runs with a copy of the whole context
+    reads_context: ClassVar[bool] = True
+
+    input_port_schema = (
+        InputPort(
+            name="items",
+            data_type=DataType.ARRAY,
+            description="The elements to process.",
+            required=True
+        ),
+    )
+    output_port_schema = (
+        OutputPort(
+            name="results",
+            data_type=DataType.ARRAY,
+            description="The collected output for each element."
+        ),
+        OutputPort(
+            name="errors",
+            data_type=DataType.ARRAY,
+            description="Failed elements as {index, error}."
+        ),
+    )
+
+    def __init__(self, node_id: str, node_config: dict):
+        super().__init__(node_id=node_id, node_config=node_config)
+
+        if bool(self.node_config.get("node")) == bool(self.node_config.get("workflow")):
+            raise ValueError(f"Control-Map '{self.node_id}' needs exactly one of 'node' or 'workflow' in its config")
+        self.on_error = self.node_config.get("on_error", "fail")
+        if self.on_error not in ON_ERROR_MODES:
+            raise ValueError(f"Unsupported on_error: '{self.on_error}' ({', '.join(ON_ERROR_MODES)})")
+        self.concurrency = int(self.node_config.get("concurrency", 8))
+        if self.concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        self.ordered = bool(self.node_config.get("ordered", True))
+        self.item_key = self.node_config.get("item_key", "item")
+        self.index_key = self.node_config.get("index_key", "index")
+
+    def _sub_workflow(self) -> Dict[str, Any]:
+        """The per-element flow as a workflow definition (a nested node becomes a one-node workflow)."""
+        node = self.node_config.get("node")
+        if node is not None:
+            return {"version": "1.0", "name": f"{self.node_id} item", "nodes": {"item": node}, "flow": ["item"]}
+        workflow = self.node_config["workflow"]
+        return {"version": "1.0", "name": f"{self.node_id} item", **workflow}
+
+    def _select_output(self, node_outputs: Dict[str, Any]) -> Any:
+        """Picks the configured output from a sub-run, raising if the part it depends on failed."""
+        output = self.node_config.get("output")
+        if self.node_config.get("node") is not None:
+            result = node_outputs.get("item")
+            if isinstance(result, dict) and "error" in result:
+                raise RuntimeError(result["error"])
+            return result.get(output) if output and isinstance(result, dict) else result
+
+        failed = [(node_id, result["error"]) for node_id, result in node_outputs.items() if isinstance(result, dict) and "error" in result]
+        if failed:
+            raise RuntimeError("; ".join(f"{node_id}: {error}" for node_id, error in failed))
+        if not output:
+            return node_outputs
+        node_id, _, port = output.partition(".")
+        result = node_outputs.get(node_id)
+        return result.get(port) if port and isinstance(result, dict) else result
+
+    async def execute(self, data: dict, context: Context) -> dict:
+        # Imported here: the workflow package depends on gil_py.core
+        from gil_py.workflow.compiler import WorkflowCompiler
+        from gil_py.workflow.executor import WorkflowExecutor, current_executor
+        from gil_py.workflow.node_factory import NodeFactory
+
+        items = data.get("items")
+        if items is None:
+            raise ValueError("Input 'items' is not provided.")
+        items = list(items)
+
+        parent = current_executor()
+        node_factory = parent.node_factory if parent is not None else NodeFactory()
+        compiler = parent.compiler if parent is not None else WorkflowCompiler(node_factory)
+        workflow = self.node_config.get("workflow")
+        if isinstance(workflow, str):
+            plan = compiler.compile_file(workflow)
+        else:
+            plan = compiler.compile_dict(self._sub_workflow())
+        result_cache = parent.result_cache if parent is not None else None
+        node_pool = parent.node_pool if parent is not None else None
+
+        async def run_item(index: int, item: Any) -> Any:
+            item_context = Context({**context.to_dict(), self.item_key: item, self.index_key: index})
+            executor = WorkflowExecutor(node_factory=node_factory, compiler=compiler, result_cache=result_cache, observers=[], node_pool=node_pool)
+            result = await executor.execute(plan, item_context)
+            return self._select_output(result["node_outputs"])
+
+        finished: List[Tuple[int, Any]] = []
+        errors: List[Dict[str, Any]] = []
+        positions = iter(enumerate(items))
+
+        async def worker() -> None:
+            for index, item in positions:
+                try:
+                    finished.append((index, await run_item(index, item)))
+                except Exception as e:
+                    if self.on_error == "fail":
+                        raise RuntimeError(f"Element {index} failed: {e}") from e
+                    errors.append({"index": index, "error": str(e)})
+                    if self.on_error == "null":
+                        finished.append((index, None))
+
+        workers = [asyncio.ensure_future(worker()) for _ in range(min(self.concurrency, len(items)))]
+        try:
+            await asyncio.gather(*workers)
+        finally:
+            # On the first failure (or cancellation) stop the elements still running
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+        if self.ordered:
+            finished.sort(key=lambda entry: entry[0])
+            errors.sort(key=lambda entry: entry["index"])
+        results = [value for _, value in finished]
+
+        self.get_output_port("results").set_data(results)
+        self.get_output_port("errors").set_data(errors)
+        return {"results": results, "errors": errors}
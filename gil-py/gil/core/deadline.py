@@ -0,0 +1,44 @@
+"""
+Gil 실행 마감 시각 전달
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+# 현재 실행 중인 노드의 마감 시각 (`time.monotonic()` 기준)
+_deadline: ContextVar[Optional[float]] = ContextVar("gil_deadline", default=None)
+
+
+def get_deadline() -> Optional[float]:
+    """현재 마감 시각 (`time.monotonic()` 기준, 없으면 None)"""
+    return _deadline.get()
+
+
+def remaining_time() -> Optional[float]:
+    """마감까지 남은 시간 (초, 마감이 없으면 None)
+
+    노드는 이 값으로 HTTP 요청 등의 타임아웃을 설정해, 실행 엔진이 취소하기 전에
+    스스로 요청을 정리할 수 있습니다.
+    """
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return max(0.0, deadline - time.monotonic())
+
+
+@contextmanager
+def deadline_scope(timeout: Optional[float]) -> Iterator[Optional[float]]:
+    """`timeout`초 뒤를 마감으로 설정 (바깥 마감이 더 이르면 바깥 마감 유지)"""
+    current = _deadline.get()
+    deadline = current
+    if timeout is not None:
+        deadline = time.monotonic() + timeout
+        if current is not None:
+            deadline = min(deadline, current)
+    token = _deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _deadline.reset(token)
@@ -3,65 +3,139 @@ Gil 노드 기본 클래스 (간단한 버전)
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any, Optional
-from pydantic import BaseModel, Field, ConfigDict
+from typing import ClassVar, Dict, List, Any, Optional, Tuple
 import uuid
 from .port import InputPort, OutputPort
 from .connection import Connection
 from .context import NodeContext, FlowContext, Context
 
 
-class Node(BaseModel, ABC):
-    """Gil 노드의 기본 클래스"""
-    
-    node_id: str = Field(default_factory=lambda: str(uuid.uuid4()), description="노드 고유 ID")
-    name: str = Field(description="노드 이름")
-    node_type: str = Field(description="노드 타입")
-    version: str = Field(default="1.0.0", description="노드 버전")
-    node_config: Dict[str, Any] = Field(default_factory=dict, description="노드 설정")
-    
-    # 포트 정의
-    input_ports: List[InputPort] = Field(default_factory=list, description="입력 포트들")
-    output_ports: List[OutputPort] = Field(default_factory=list, description="출력 포트들")
-    
-    # 연결 관리
-    input_connections: List[Connection] = Field(default_factory=list, description="입력 연결들")
-    output_connections: List[Connection] = Field(default_factory=list, description="출력 연결들")
-    
-    # 실행 상태
-    is_running: bool = Field(default=False, description="실행 중 여부")
-    last_execution_time: Optional[float] = Field(default=None, description="마지막 실행 시간")
-    
-    # 컨텍스트 (런타임에 설정)
-    node_context: Optional[NodeContext] = Field(default=None, exclude=True, description="노드 컨텍스트")
-    flow_context: Optional[FlowContext] = Field(default=None, exclude=True, description="플로우 컨텍스트")
-    
-    model_config = ConfigDict(arbitrary_types_allowed=True, extra='allow', use_enum_values=True)
+class Node(ABC):
+    """Gil 노드의 기본 클래스
+
+    실행마다 많은 인스턴스가 만들어지므로 필드 검증 없이 `__slots__`로 기본 필드를 보관합니다.
+    하위 클래스가 `__init__`에서 설정하는 추가 속성은 평소처럼 인스턴스 `__dict__`에 저장됩니다.
+    포트는 이름으로 색인되어 `get_input_port`/`get_output_port`가 상수 시간에 조회합니다.
+
+    포트는 클래스에 `input_port_schema`/`output_port_schema`로 한 번 선언하면 인스턴스를 만들 때
+    복사되며, `describe_ports()`로 인스턴스 없이 조회할 수 있습니다. 설정에 따라 달라지는 포트만
+    `__init__`에서 `add_input_port`/`add_output_port`로 추가합니다.
+    """
+
+    __slots__ = (
+        "node_id", "name", "node_type", "version", "node_config",
+        # 포트 정의 (추가 순서 유지)와 이름 색인
+        "input_ports", "output_ports", "_input_index", "_output_index",
+        # 연결 관리
+        "input_connections", "output_connections",
+        # 실행 상태
+        "is_running", "last_execution_time",
+        # 컨텍스트 (런타임에 설정)
+        "node_context", "flow_context",
+    )
+
+    # 동기 execute가 CPU 바운드 작업인 경우 True로 설정하면 프로세스 풀에서 실행됨
+    cpu_bound: ClassVar[bool] = False
+
+    # 입력 포트 외에 컨텍스트 전체를 읽는 노드는 True (증분 실행 시 컨텍스트가 바뀌면 다시 실행)
+    reads_context: ClassVar[bool] = False
+
+    # 실행 사이에 `reset()`으로 지워지지 않는 실행별 상태를 가진 노드는 False (노드 풀에서 재사용하지 않음)
+    poolable: ClassVar[bool] = True
+
+    # 노드 타입마다 한 번 선언하는 포트 정의 (인스턴스마다 복사되어 데이터를 따로 가짐)
+    input_port_schema: ClassVar[Tuple[InputPort, ...]] = ()
+    output_port_schema: ClassVar[Tuple[OutputPort, ...]] = ()
     
-    def __init__(self, node_id: str, name: Optional[str] = None, node_type: Optional[str] = None, version: str = "1.0.0", node_config: Optional[Dict[str, Any]] = None, **data):
-        super().__init__(node_id=node_id, name=name or node_id, node_type=node_type or self.__class__.__name__, version=version, node_config=node_config if node_config is not None else {}, **data)
+    def __init__(self, node_id: Optional[str] = None, name: Optional[str] = None, node_type: Optional[str] = None, version: str = "1.0.0", node_config: Optional[Dict[str, Any]] = None, **data):
+        self.node_id: str = node_id if node_id is not None else str(uuid.uuid4())
+        self.name: str = name or self.node_id
+        self.node_type: str = node_type or self.__class__.__name__
+        self.version = version
+        self.node_config: Dict[str, Any] = node_config if node_config is not None else {}
+
+        self.input_ports: List[InputPort] = []
+        self.output_ports: List[OutputPort] = []
+        self._input_index: Dict[str, InputPort] = {}
+        self._output_index: Dict[str, OutputPort] = {}
+
+        self.input_connections: List[Connection] = []
+        self.output_connections: List[Connection] = []
+
+        self.is_running = False
+        self.last_execution_time: Optional[float] = None
+
+        self.node_context: Optional[NodeContext] = None
+        self.flow_context: Optional[FlowContext] = None
+
+        for in_port in type(self).input_port_schema:
+            self.add_input_port(in_port.copy())
+        for out_port in type(self).output_port_schema:
+            self.add_output_port(out_port.copy())
+
+        for key, value in data.items():
+            setattr(self, key, value)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(node_id={self.node_id!r})"
+
+    @classmethod
+    def describe_ports(cls) -> Dict[str, List[Dict[str, Any]]]:
+        """인스턴스를 만들지 않고 클래스에 선언된 포트 정의 조회"""
+        return {
+            "input_ports": [
+                {
+                    "name": port.name,
+                    "type": port.data_type,
+                    "required": port.required,
+                    "default": port.default_value,
+                    "description": port.description,
+                }
+                for port in cls.input_port_schema
+            ],
+            "output_ports": [
+                {"name": port.name, "type": port.data_type, "description": port.description}
+                for port in cls.output_port_schema
+            ],
+        }
     
     @abstractmethod
     async def execute(self, data: Dict[str, Any], context: Context) -> Dict[str, Any]:
-        """노드 실행 로직을 정의하는 추상 메서드"""
+        """노드 실행 로직을 정의하는 추상 메서드
+
+        동기 함수(`def execute`)로 구현해도 되며, 이 경우 실행 엔진이 워커 풀에서 실행합니다.
+        """
         pass
     
+    async def setup(self) -> None:
+        """처음 실행하기 전에 한 번 호출 (클라이언트 생성 등 비용이 큰 준비 작업)
+
+        노드 풀에서 재사용되는 인스턴스는 여러 실행에 걸쳐 한 번만 호출됩니다.
+        """
+
+    async def teardown(self) -> None:
+        """인스턴스를 더 사용하지 않을 때 호출 (`setup`에서 얻은 자원 정리)"""
+
+    def reset(self) -> None:
+        """실행 사이에 실행별 상태 초기화 (노드 풀로 돌아갈 때 호출)"""
+        for in_port in self.input_ports:
+            in_port.set_data(None)
+        for out_port in self.output_ports:
+            out_port.set_data(None)
+        self.is_running = False
+
     def add_input_port(self, port: InputPort):
         self.input_ports.append(port)
+        self._input_index[port.name] = port
 
     def add_output_port(self, port: OutputPort):
         self.output_ports.append(port)
+        self._output_index[port.name] = port
     
     def get_input_port(self, port_name: str) -> Optional[InputPort]:
         """입력 포트 조회"""
-        for port in self.input_ports:
-            if port.name == port_name:
-                return port
-        return None
+        return self._input_index.get(port_name)
     
     def get_output_port(self, port_name: str) -> Optional[OutputPort]:
         """출력 포트 조회"""
-        for port in self.output_ports:
-            if port.name == port_name:
-                return port
-        return None
+        return self._output_index.get(port_name)
@@ -2,25 +2,30 @@
 Gil 포트 시스템
 """
 
-from typing import Any, Optional
-from pydantic import BaseModel, Field
+from enum import Enum
+from typing import Any, Dict, Optional, TypeVar, Union
 from .data_types import DataType
 
+P = TypeVar("P", bound="Port")
 
-class Port(BaseModel):
-    """Gil 노드의 입출력 포트"""
-    
-    name: str = Field(description="포트 이름")
-    data_type: DataType = Field(description="데이터 타입")
-    description: str = Field(default="", description="포트 설명")
-    
-    model_config = {"use_enum_values": True}
 
-class InputPort(Port):
-    """입력 포트"""
-    required: bool = Field(default=True, description="필수 입력 여부")
-    default_value: Optional[Any] = Field(default=None, description="기본값")
-    _data: Any = None
+class Port:
+    """Gil 노드의 입출력 포트
+
+    노드 인스턴스마다 만들어지므로 검증 없이 `__slots__`만 사용하는 가벼운 클래스입니다.
+    `data_type`은 `DataType` 값 문자열(예: "text")로 저장됩니다.
+    """
+
+    __slots__ = ("name", "data_type", "description", "required", "default_value", "_data")
+
+    def __init__(self, name: str, data_type: Union[DataType, str], description: str = "",
+                 required: bool = True, default_value: Optional[Any] = None):
+        self.name = name
+        self.data_type = data_type.value if isinstance(data_type, Enum) else data_type
+        self.description = description
+        self.required = required
+        self.default_value = default_value
+        self._data: Any = None
 
     def set_data(self, data: Any):
         self._data = data
@@ -28,12 +33,48 @@ class InputPort(Port):
     def get_data(self) -> Any:
         return self._data
 
+    def copy(self: P) -> P:
+        """데이터 없이 같은 정의의 포트 생성 (클래스에 선언된 포트를 인스턴스마다 복사할 때)"""
+        port = type(self).__new__(type(self))
+        port.name = self.name
+        port.data_type = self.data_type
+        port.description = self.description
+        port.required = self.required
+        port.default_value = self.default_value
+        port._data = None
+        return port
+
+    def to_dict(self) -> Dict[str, Any]:
+        """포트 정의 (데이터 제외)"""
+        return {
+            "name": self.name,
+            "data_type": self.data_type,
+            "description": self.description,
+            "required": self.required,
+            "default_value": self.default_value,
+        }
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Port):
+            return NotImplemented
+        return type(self) is type(other) and self.to_dict() == other.to_dict()
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(name={self.name!r}, data_type={self.data_type!r})"
+
+
+class InputPort(Port):
+    """입력 포트"""
+
+    __slots__ = ()
+
+
 class OutputPort(Port):
-    """출력 포트"""
-    _data: Any = None
+    """출력 포트 (`required`는 사용하지 않음)"""
 
-    def set_data(self, data: Any):
-        self._data = data
+    __slots__ = ()
 
-    def get_data(self) -> Any:
-        return self._data
+    def __init__(self, name: str, data_type: Union[DataType, str], description: str = "", **kwargs: Any):
+        super().__init__(name, data_type, description, required=False, **kwargs)
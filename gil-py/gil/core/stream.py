@@ -0,0 +1,116 @@
+"""
+Gil 스트리밍 출력
+"""
+
+import asyncio
+from typing import Any, AsyncIterator, Callable, List, Optional
+
+
+class TokenStream:
+    """노드가 출력 포트로 내보내는 비동기 청크 스트림
+
+    생산자는 `push`/`close`/`fail`로 청크를 기록하고, 소비자는 `async for`로 읽습니다.
+    모든 청크가 버퍼에 보관되므로 여러 소비자가 각자 처음부터 끝까지 읽을 수 있고,
+    늦게 구독한 소비자도 누락 없이 전체 내용을 받습니다.
+    """
+
+    def __init__(self) -> None:
+        self._chunks: List[Any] = []
+        self._closed = False
+        self._error: Optional[BaseException] = None
+        self._changed: Optional[asyncio.Event] = None
+        self._producer: Optional["asyncio.Future[None]"] = None
+
+    @classmethod
+    def from_source(cls, source: Any, transform: Optional[Callable[[Any], Any]] = None) -> "TokenStream":
+        """(비)동기 이터러블을 백그라운드 태스크로 읽어 스트림으로 변환
+
+        `transform`이 None을 반환하는 항목은 건너뜁니다.
+        """
+        stream = cls()
+        stream._producer = asyncio.ensure_future(stream._pump(source, transform))
+        return stream
+
+    async def _pump(self, source: Any, transform: Optional[Callable[[Any], Any]]) -> None:
+        try:
+            if hasattr(source, "__aiter__"):
+                async for item in source:
+                    self._push_transformed(item, transform)
+            else:
+                for item in source:
+                    self._push_transformed(item, transform)
+        except asyncio.CancelledError:
+            self.fail(RuntimeError("Stream producer was cancelled"))
+            raise
+        except Exception as e:
+            self.fail(e)
+        else:
+            self.close()
+
+    def _push_transformed(self, item: Any, transform: Optional[Callable[[Any], Any]]) -> None:
+        chunk = transform(item) if transform else item
+        if chunk is not None:
+            self.push(chunk)
+
+    def __repr__(self) -> str:
+        return f"TokenStream(chunks={len(self._chunks)}, done={self._closed})"
+
+    @property
+    def done(self) -> bool:
+        return self._closed
+
+    @property
+    def chunks(self) -> List[Any]:
+        """지금까지 받은 청크"""
+        return list(self._chunks)
+
+    def push(self, chunk: Any) -> None:
+        if self._closed:
+            raise RuntimeError("Cannot push to a closed stream")
+        self._chunks.append(chunk)
+        self._notify()
+
+    def close(self) -> None:
+        self._closed = True
+        self._notify()
+
+    def fail(self, error: BaseException) -> None:
+        self._error = error
+        self.close()
+
+    def cancel(self) -> None:
+        """생산자 태스크 취소"""
+        if self._producer is not None and not self._producer.done():
+            self._producer.cancel()
+
+    def _notify(self) -> None:
+        if self._changed is not None:
+            self._changed.set()
+            self._changed = None
+
+    def __aiter__(self) -> AsyncIterator[Any]:
+        return self._iterate()
+
+    async def _iterate(self) -> AsyncIterator[Any]:
+        position = 0
+        while True:
+            while position < len(self._chunks):
+                yield self._chunks[position]
+                position += 1
+            if self._closed:
+                if self._error is not None:
+                    raise self._error
+                return
+            if self._changed is None:
+                self._changed = asyncio.Event()
+            await self._changed.wait()
+
+    async def collect(self) -> Any:
+        """스트림이 끝날 때까지 기다린 후 전체 내용 반환 (문자열/바이트 청크는 이어 붙임)"""
+        async for _ in self:
+            pass
+        if all(isinstance(chunk, str) for chunk in self._chunks):
+            return "".join(self._chunks)
+        if all(isinstance(chunk, bytes) for chunk in self._chunks):
+            return b"".join(self._chunks)
+        return list(self._chunks)
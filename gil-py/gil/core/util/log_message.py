@@ -1,5 +1,5 @@
 from gil_py.core.node import Node
-from gil_py.core.port import Port
+from gil_py.core.port import InputPort, OutputPort
 from gil_py.core.data_types import DataType
 from gil_py.core.context import Context
 
@@ -9,20 +9,24 @@ class UtilLogMessageNode(Node):
     It takes any data type and passes it through to the output.
     """
 
-    def __init__(self, node_id: str, node_config: dict):
-        super().__init__(node_id, node_config)
-
-        self.add_input_port(Port(
+    input_port_schema = (
+        InputPort(
             name="input",
             data_type=DataType.ANY,
             description="The data to be logged.",
             required=True
-        ))
-        self.add_output_port(Port(
+        ),
+    )
+    output_port_schema = (
+        OutputPort(
             name="output",
             data_type=DataType.ANY,
             description="The same data that was logged."
-        ))
+        ),
+    )
+
+    def __init__(self, node_id: str, node_config: dict):
+        super().__init__(node_id=node_id, node_config=node_config)
 
     async def execute(self, data: dict, context: Context) -> dict:
         """
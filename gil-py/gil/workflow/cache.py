@@ -0,0 +1,245 @@
+"""
+노드 실행 결과 캐시
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import pickle
+import shelve
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+# 캐시에 없음을 나타내는 값 (None도 유효한 결과이므로 별도 객체 사용)
+MISS = object()
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, bytes):
+        return {"__bytes__": hashlib.sha256(value).hexdigest()}
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=repr)
+    raise TypeError(f"{type(value).__name__} 값은 캐시 키로 사용할 수 없습니다")
+
+
+def stable_hash(value: Any) -> Optional[str]:
+    """JSON으로 표현한 값의 안정적인 해시 (JSON으로 표현할 수 없으면 None)"""
+    try:
+        payload = json.dumps(
+            value,
+            sort_keys=True,
+            ensure_ascii=False,
+            separators=(",", ":"),
+            default=_json_default,
+        )
+    except (TypeError, ValueError):
+        return None
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def cache_key(node_type: str, config: Dict[str, Any], inputs: Dict[str, Any]) -> Optional[str]:
+    """노드 타입, 설정, 해결된 입력의 안정적인 해시 (JSON으로 표현할 수 없는 입력이면 None)"""
+    return stable_hash({"type": node_type, "config": config, "inputs": inputs})
+
+
+class ResultCache(ABC):
+    """노드 결과 캐시 기본 클래스
+
+    하위 클래스는 `get`/`set`/`clear`를 구현합니다. 디스크를 사용하는 캐시는
+    `blocking = True`로 설정하면 실행 엔진이 워커 스레드에서 호출합니다.
+    """
+
+    blocking = False
+
+    @abstractmethod
+    def get(self, key: str) -> Any:
+        """캐시된 결과 반환 (없거나 만료되었으면 `MISS`)"""
+        pass
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """결과 저장 (`ttl`초 후 만료, None이면 만료 없음)"""
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    async def aget(self, key: str) -> Any:
+        if self.blocking:
+            return await asyncio.to_thread(self.get, key)
+        return self.get(key)
+
+    async def aset(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        if self.blocking:
+            await asyncio.to_thread(self.set, key, value, ttl)
+        else:
+            self.set(key, value, ttl)
+
+    @staticmethod
+    def _expires_at(ttl: Optional[float]) -> Optional[float]:
+        return time.time() + ttl if ttl is not None else None
+
+    @staticmethod
+    def _expired(expires_at: Optional[float]) -> bool:
+        return expires_at is not None and expires_at <= time.time()
+
+
+class MemoryResultCache(ResultCache):
+    """프로세스 메모리 LRU 캐시 (항목별 TTL 지원)
+
+    결과 객체를 복사하지 않고 그대로 보관하므로, 노드는 캐시된 출력을 수정하면 안 됩니다.
+    """
+
+    def __init__(self, max_size: int = 1024):
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, Tuple[Optional[float], Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return MISS
+            expires_at, value = entry
+            if self._expired(expires_at):
+                del self._entries[key]
+                return MISS
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        with self._lock:
+            self._entries[key] = (self._expires_at(ttl), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteResultCache(ResultCache):
+    """SQLite 파일 캐시 (프로세스 재시작 후에도 유지, 여러 프로세스가 공유 가능)"""
+
+    blocking = True
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS gil_node_results (key TEXT PRIMARY KEY, expires_at REAL, value BLOB NOT NULL)"
+        )
+
+    def get(self, key: str) -> Any:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT expires_at, value FROM gil_node_results WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return MISS
+            if self._expired(row[0]):
+                self._connection.execute("DELETE FROM gil_node_results WHERE key = ?", (key,))
+                return MISS
+        return pickle.loads(row[1])
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO gil_node_results (key, expires_at, value) VALUES (?, ?, ?)",
+                (key, self._expires_at(ttl), data),
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._connection.execute("DELETE FROM gil_node_results")
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+
+class ShelveResultCache(ResultCache):
+    """`shelve` 파일 캐시 (단일 프로세스용)"""
+
+    blocking = True
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._shelf = shelve.open(path)
+
+    def get(self, key: str) -> Any:
+        with self._lock:
+            entry = self._shelf.get(key)
+            if entry is None:
+                return MISS
+            expires_at, value = entry
+            if self._expired(expires_at):
+                del self._shelf[key]
+                return MISS
+            return value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        with self._lock:
+            self._shelf[key] = (self._expires_at(ttl), value)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._shelf.clear()
+
+    def close(self) -> None:
+        with self._lock:
+            self._shelf.close()
+
+
+def create_result_cache(url: Optional[str] = None) -> ResultCache:
+    """URL로 캐시 생성 (기본값: 환경 변수 GIL_RESULT_CACHE)
+
+    - `memory` (기본값), `memory:<최대 항목 수>`
+    - `sqlite:///path/to/cache.db`
+    - `shelve:///path/to/cache`
+    """
+    url = url or os.getenv("GIL_RESULT_CACHE") or "memory"
+    if url == "memory":
+        return MemoryResultCache()
+    if url.startswith("memory:"):
+        return MemoryResultCache(max_size=int(url[len("memory:"):]))
+    if url.startswith("sqlite:///"):
+        return SQLiteResultCache(url[len("sqlite:///"):])
+    if url.startswith("shelve:///"):
+        return ShelveResultCache(url[len("shelve:///"):])
+    raise ValueError(f"지원하지 않는 결과 캐시입니다: '{url}'")
+
+
+_default_cache: Optional[ResultCache] = None
+
+
+def get_result_cache() -> ResultCache:
+    """프로세스 전체에서 공유하는 기본 결과 캐시 (처음 사용할 때 생성)"""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = create_result_cache()
+    return _default_cache
+
+
+def set_result_cache(cache: Optional[ResultCache]) -> None:
+    """기본 결과 캐시 교체 (None이면 다음 사용 시 환경 변수로 다시 생성)"""
+    global _default_cache
+    if _default_cache is not None and _default_cache is not cache:
+        _default_cache.close()
+    _default_cache = cache
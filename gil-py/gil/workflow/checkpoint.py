@@ -0,0 +1,319 @@
+"""
+실행 체크포인트 (중단된 실행 재개)
+"""
+
+import asyncio
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Tuple
+
+# 실행 상태
+RUNNING = "running"
+FINISHED = "finished"
+FAILED = "failed"
+
+# 저장소마다 보관할 최근 실행 수 (오래된 실행부터 삭제)
+DEFAULT_MAX_RUNS = 100
+
+
+def _dumps(value: Any) -> Optional[bytes]:
+    """pickle할 수 없는 값(연결된 클라이언트 등)이면 None"""
+    try:
+        return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception:
+        return None
+
+
+def _dumps_context(context: Dict[str, Any]) -> bytes:
+    """pickle할 수 있는 컨텍스트 값만 저장"""
+    data = _dumps(context)
+    if data is None:
+        data = pickle.dumps({name: value for name, value in context.items() if _dumps(value) is not None},
+                            protocol=pickle.HIGHEST_PROTOCOL)
+    return data
+
+
+class RunCheckpoint:
+    """저장된 실행 하나의 상태
+
+    `nodes`는 완료된 노드별 `(지문, 결과)`이며, 지문은 노드 타입/설정/해결된 입력의 해시입니다.
+    """
+
+    def __init__(self, run_id: str, workflow: str, status: str, context: Optional[Dict[str, Any]] = None,
+                 nodes: Optional[Dict[str, Tuple[str, Any]]] = None, updated_at: Optional[float] = None):
+        self.run_id = run_id
+        self.workflow = workflow
+        self.status = status
+        self.context = context or {}
+        self.nodes = nodes or {}
+        self.updated_at = updated_at
+
+    def result_for(self, node_id: str, fingerprint: Optional[str]) -> Tuple[bool, Any]:
+        """지문이 같은 완료 결과가 있으면 `(True, 결과)`"""
+        entry = self.nodes.get(node_id)
+        if entry is None or fingerprint is None or entry[0] != fingerprint:
+            return False, None
+        return True, entry[1]
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "run_id": self.run_id,
+            "workflow": self.workflow,
+            "status": self.status,
+            "completed_nodes": sorted(self.nodes),
+            "updated_at": self.updated_at,
+        }
+
+
+class CheckpointStore(ABC):
+    """체크포인트 저장소 기본 클래스
+
+    하위 클래스는 `begin`/`save_node`/`save_context`/`finish`/`load`/`list_runs`/`delete`를 구현합니다.
+    디스크를 사용하는 저장소는 `blocking = True`로 설정하면 실행 엔진이 워커 스레드에서 호출합니다.
+    `max_runs`를 넘는 오래된 실행은 새 실행을 시작할 때 삭제합니다.
+    """
+
+    blocking = False
+    max_runs = DEFAULT_MAX_RUNS
+
+    @abstractmethod
+    def begin(self, run_id: str, workflow: str) -> None:
+        """실행 시작 기록 (이미 있는 실행이면 상태만 `running`으로 변경)"""
+        pass
+
+    @abstractmethod
+    def save_node(self, run_id: str, node_id: str, fingerprint: str, result: Any) -> None:
+        """완료된 노드 결과 저장 (pickle할 수 없는 결과는 저장하지 않으며, 재개하면 그 노드는 다시 실행)"""
+        pass
+
+    @abstractmethod
+    def save_context(self, run_id: str, context: Dict[str, Any]) -> None:
+        """컨텍스트 스냅샷 저장 (pickle할 수 없는 값은 제외)"""
+        pass
+
+    @abstractmethod
+    def finish(self, run_id: str, status: str) -> None:
+        pass
+
+    @abstractmethod
+    def load(self, run_id: str) -> Optional[RunCheckpoint]:
+        pass
+
+    @abstractmethod
+    def list_runs(self, limit: int = 20) -> List[RunCheckpoint]:
+        """최근에 갱신된 실행부터 (노드 결과는 제외)"""
+        pass
+
+    @abstractmethod
+    def delete(self, run_id: str) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    async def call(self, method: str, *args: Any) -> Any:
+        """저장소 메서드 호출 (`blocking`이면 워커 스레드에서)"""
+        function = getattr(self, method)
+        if self.blocking:
+            return await asyncio.to_thread(function, *args)
+        return function(*args)
+
+
+class MemoryCheckpointStore(CheckpointStore):
+    """프로세스 메모리 체크포인트 (테스트, 같은 프로세스 안에서의 재개용)
+
+    결과는 pickle 복사본으로 보관하므로 저장소 밖에서의 변경이 반영되지 않습니다.
+    """
+
+    def __init__(self, max_runs: int = DEFAULT_MAX_RUNS):
+        self.max_runs = max_runs
+        # 노드 결과는 pickle된 바이트로 보관
+        self._runs: Dict[str, RunCheckpoint] = {}
+        self._contexts: Dict[str, bytes] = {}
+        self._lock = threading.Lock()
+
+    def begin(self, run_id: str, workflow: str) -> None:
+        with self._lock:
+            run = self._runs.get(run_id)
+            if run is None:
+                self._runs[run_id] = run = RunCheckpoint(run_id, workflow, RUNNING)
+            run.status = RUNNING
+            run.updated_at = time.time()
+            if len(self._runs) > self.max_runs:
+                runs = sorted(self._runs.values(), key=lambda run: run.updated_at or 0)
+                for old in runs[:len(runs) - self.max_runs]:
+                    self._runs.pop(old.run_id, None)
+                    self._contexts.pop(old.run_id, None)
+
+    def save_node(self, run_id: str, node_id: str, fingerprint: str, result: Any) -> None:
+        data = _dumps(result)
+        if data is None:
+            return
+        with self._lock:
+            run = self._runs[run_id]
+            run.nodes[node_id] = (fingerprint, data)
+            run.updated_at = time.time()
+
+    def save_context(self, run_id: str, context: Dict[str, Any]) -> None:
+        data = _dumps_context(context)
+        with self._lock:
+            self._contexts[run_id] = data
+
+    def finish(self, run_id: str, status: str) -> None:
+        with self._lock:
+            run = self._runs[run_id]
+            run.status = status
+            run.updated_at = time.time()
+
+    def load(self, run_id: str) -> Optional[RunCheckpoint]:
+        with self._lock:
+            run = self._runs.get(run_id)
+            if run is None:
+                return None
+            context = pickle.loads(self._contexts[run_id]) if run_id in self._contexts else {}
+            nodes = {node_id: (fingerprint, pickle.loads(data)) for node_id, (fingerprint, data) in run.nodes.items()}
+            return RunCheckpoint(run.run_id, run.workflow, run.status, context, nodes, run.updated_at)
+
+    def list_runs(self, limit: int = 20) -> List[RunCheckpoint]:
+        with self._lock:
+            runs = sorted(self._runs.values(), key=lambda run: run.updated_at or 0, reverse=True)[:limit]
+            return [RunCheckpoint(run.run_id, run.workflow, run.status, updated_at=run.updated_at) for run in runs]
+
+    def delete(self, run_id: str) -> None:
+        with self._lock:
+            self._runs.pop(run_id, None)
+            self._contexts.pop(run_id, None)
+
+
+class SQLiteCheckpointStore(CheckpointStore):
+    """SQLite 파일 체크포인트 (프로세스 재시작 후에도 재개 가능)"""
+
+    blocking = True
+
+    def __init__(self, path: str, max_runs: int = DEFAULT_MAX_RUNS):
+        self.path = path
+        self.max_runs = max_runs
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS gil_runs ("
+            "run_id TEXT PRIMARY KEY, workflow TEXT, status TEXT NOT NULL, context BLOB, updated_at REAL)"
+        )
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS gil_run_nodes ("
+            "run_id TEXT NOT NULL, node_id TEXT NOT NULL, fingerprint TEXT NOT NULL, result BLOB NOT NULL, "
+            "PRIMARY KEY (run_id, node_id))"
+        )
+
+    def begin(self, run_id: str, workflow: str) -> None:
+        with self._lock:
+            self._connection.execute(
+                "INSERT INTO gil_runs (run_id, workflow, status, updated_at) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(run_id) DO UPDATE SET status = excluded.status, updated_at = excluded.updated_at",
+                (run_id, workflow, RUNNING, time.time()),
+            )
+            expired = self._connection.execute(
+                "SELECT run_id FROM gil_runs ORDER BY updated_at DESC LIMIT -1 OFFSET ?", (self.max_runs,)
+            ).fetchall()
+            for (old_run_id,) in expired:
+                self._connection.execute("DELETE FROM gil_run_nodes WHERE run_id = ?", (old_run_id,))
+                self._connection.execute("DELETE FROM gil_runs WHERE run_id = ?", (old_run_id,))
+
+    def save_node(self, run_id: str, node_id: str, fingerprint: str, result: Any) -> None:
+        data = _dumps(result)
+        if data is None:
+            return
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO gil_run_nodes (run_id, node_id, fingerprint, result) VALUES (?, ?, ?, ?)",
+                (run_id, node_id, fingerprint, data),
+            )
+            self._connection.execute("UPDATE gil_runs SET updated_at = ? WHERE run_id = ?", (time.time(), run_id))
+
+    def save_context(self, run_id: str, context: Dict[str, Any]) -> None:
+        data = _dumps_context(context)
+        with self._lock:
+            self._connection.execute("UPDATE gil_runs SET context = ? WHERE run_id = ?", (data, run_id))
+
+    def finish(self, run_id: str, status: str) -> None:
+        with self._lock:
+            self._connection.execute(
+                "UPDATE gil_runs SET status = ?, updated_at = ? WHERE run_id = ?", (status, time.time(), run_id)
+            )
+
+    def load(self, run_id: str) -> Optional[RunCheckpoint]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT workflow, status, context, updated_at FROM gil_runs WHERE run_id = ?", (run_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            node_rows = self._connection.execute(
+                "SELECT node_id, fingerprint, result FROM gil_run_nodes WHERE run_id = ?", (run_id,)
+            ).fetchall()
+        workflow, status, context, updated_at = row
+        nodes = {node_id: (fingerprint, pickle.loads(result)) for node_id, fingerprint, result in node_rows}
+        return RunCheckpoint(run_id, workflow, status, pickle.loads(context) if context else {}, nodes, updated_at)
+
+    def list_runs(self, limit: int = 20) -> List[RunCheckpoint]:
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT run_id, workflow, status, updated_at FROM gil_runs ORDER BY updated_at DESC LIMIT ?", (limit,)
+            ).fetchall()
+        return [RunCheckpoint(run_id, workflow, status, updated_at=updated_at) for run_id, workflow, status, updated_at in rows]
+
+    def delete(self, run_id: str) -> None:
+        with self._lock:
+            self._connection.execute("DELETE FROM gil_run_nodes WHERE run_id = ?", (run_id,))
+            self._connection.execute("DELETE FROM gil_runs WHERE run_id = ?", (run_id,))
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+
+DEFAULT_CHECKPOINTS = "sqlite:///.gil/checkpoints.db"
+
+
+def create_checkpoint_store(url: Optional[str] = None) -> CheckpointStore:
+    """URL로 체크포인트 저장소 생성 (기본값: 환경 변수 GIL_CHECKPOINTS, 없으면 `.gil/checkpoints.db`)
+
+    - `memory`
+    - `sqlite:///path/to/checkpoints.db`
+
+    보관할 최근 실행 수는 환경 변수 GIL_CHECKPOINTS_KEEP (기본값 100)
+    """
+    url = url or os.getenv("GIL_CHECKPOINTS") or DEFAULT_CHECKPOINTS
+    keep = os.getenv("GIL_CHECKPOINTS_KEEP")
+    max_runs = int(keep) if keep else DEFAULT_MAX_RUNS
+    if url == "memory":
+        return MemoryCheckpointStore(max_runs=max_runs)
+    if url.startswith("sqlite:///"):
+        return SQLiteCheckpointStore(url[len("sqlite:///"):], max_runs=max_runs)
+    raise ValueError(f"지원하지 않는 체크포인트 저장소입니다: '{url}'")
+
+
+_default_store: Optional[CheckpointStore] = None
+
+
+def get_checkpoint_store() -> CheckpointStore:
+    """프로세스 전체에서 공유하는 기본 체크포인트 저장소 (처음 사용할 때 생성)"""
+    global _default_store
+    if _default_store is None:
+        _default_store = create_checkpoint_store()
+    return _default_store
+
+
+def set_checkpoint_store(store: Optional[CheckpointStore]) -> None:
+    """기본 체크포인트 저장소 교체 (None이면 다음 사용 시 환경 변수로 다시 생성)"""
+    global _default_store
+    if _default_store is not None and _default_store is not store:
+        _default_store.close()
+    _default_store = store
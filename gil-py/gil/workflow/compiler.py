@@ -0,0 +1,372 @@
+"""
+워크플로우 컴파일러 - 파싱/검증된 설정을 실행 계획으로 변환하고 캐시
+"""
+
+import hashlib
+import json
+import re
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Sequence, Set, Tuple, Type, Union
+
+import yaml
+
+from ..core.node import Node
+from ..core.connection import Connection
+from ..core.context import Context
+from ..yaml_parser import YamlWorkflowParser, WorkflowConfig
+from .cache import stable_hash
+from .limits import Limiter, LimiterRegistry, get_limiter_registry, select_limiters
+from .node_factory import NodeFactory
+from .retry import RetryPolicy
+from .workers import execution_mode
+
+
+class ContextReference:
+    """`$key` 형태의 컨텍스트 참조 (로드 시점에 한 번만 파싱)"""
+
+    __slots__ = ("key", "raw")
+
+    def __init__(self, key: str, raw: str):
+        self.key = key
+        self.raw = raw
+
+    def resolve(self, context: Context) -> Any:
+        return context.get(self.key, self.raw)
+
+
+# `@node_id` 또는 `@node_id.port`
+_OUTPUT_REFERENCE = re.compile(r"^@([A-Za-z_][\w-]*)(?:\.([A-Za-z_][\w-]*))?$")
+
+
+class NodeOutputReference:
+    """`@node_id.port` 형태의 노드 출력 참조 (컴파일 시 실행 계획의 출력 슬롯 인덱스로 바인딩)
+
+    `port`가 None이면 노드 출력 전체를 참조합니다.
+    """
+
+    __slots__ = ("node_id", "port", "raw", "index")
+
+    def __init__(self, node_id: str, port: Optional[str], raw: str):
+        self.node_id = node_id
+        self.port = port
+        self.raw = raw
+        self.index = -1
+
+    def resolve(self, slots: Sequence[Any]) -> Any:
+        result = slots[self.index]
+        if isinstance(result, dict) and "error" in result:
+            raise RuntimeError(f"입력 노드 '{self.node_id}'가 실패했습니다: {result['error']}")
+        if self.port is None:
+            return result
+        if not isinstance(result, dict) or self.port not in result:
+            raise KeyError(f"노드 '{self.node_id}'의 출력에 '{self.port}' 포트가 없습니다")
+        return result[self.port]
+
+
+def compile_input(value: Any) -> Any:
+    """입력 값을 참조 객체 또는 리터럴로 변환"""
+    if isinstance(value, str):
+        if value.startswith("$"):
+            return ContextReference(value[1:], value)
+        match = _OUTPUT_REFERENCE.match(value)
+        if match:
+            return NodeOutputReference(match.group(1), match.group(2), value)
+    return value
+
+
+class CompiledNode:
+    """실행 계획의 단일 노드"""
+
+    __slots__ = ("node_id", "node_type", "node_class", "execution_mode", "config", "inputs", "cached", "cache_ttl", "retry", "timeout", "limiters", "index", "input_connections", "output_connections", "dependencies", "dependents", "definition")
+
+    def __init__(self, node_id: str, node_type: str, node_class: Type[Node], config: Dict[str, Any], inputs: Dict[str, Any], cache: Union[bool, Dict[str, Any]] = False, retry: Optional[RetryPolicy] = None,
+                 timeout: Optional[float] = None, limiters: Tuple[Limiter, ...] = (), definition: Optional[str] = None):
+        self.node_id = node_id
+        self.node_type = node_type
+        self.node_class = node_class
+        # async / thread / process
+        self.execution_mode = execution_mode(node_class)
+        self.config = config
+        self.inputs = inputs
+        # 결과 캐시 사용 여부와 만료 시간(초, None이면 만료 없음; YAML의 `ttl`은 다른 시간 설정처럼 ms)
+        if isinstance(cache, dict):
+            self.cached = bool(cache.get("enabled", True))
+            ttl = cache.get("ttl")
+            self.cache_ttl: Optional[float] = ttl / 1000 if ttl is not None else None
+        else:
+            self.cached = bool(cache)
+            self.cache_ttl = None
+        self.retry = retry
+        # 시도 한 번의 제한 시간 (초)
+        self.timeout = timeout
+        # 시도마다 획득할 동시 실행/호출 빈도 제한
+        self.limiters = limiters
+        # 타입/설정/입력 정의의 해시 (실행 시 노드 지문의 바탕, JSON으로 표현할 수 없으면 None)
+        self.definition = definition
+        # 실행 계획 내 인덱스 (출력 슬롯 위치)와 인덱스 배열
+        self.index = -1
+        self.input_connections: Tuple[Connection, ...] = ()
+        self.output_connections: Tuple[Connection, ...] = ()
+        self.dependencies: Tuple[int, ...] = ()
+        self.dependents: Tuple[int, ...] = ()
+
+    def resolve_inputs(self, context: Context, slots: Sequence[Any] = ()) -> Dict[str, Any]:
+        """미리 파싱된 참조를 현재 컨텍스트와 노드 출력 슬롯으로 해결"""
+        inputs: Dict[str, Any] = {}
+        for name, value in self.inputs.items():
+            if isinstance(value, ContextReference):
+                value = value.resolve(context)
+            elif isinstance(value, NodeOutputReference):
+                value = value.resolve(slots)
+            inputs[name] = value
+        return inputs
+
+    def instantiate(self) -> Node:
+        node = self.node_class(node_id=self.node_id, node_config=self.config)
+        node.input_connections = list(self.input_connections)
+        node.output_connections = list(self.output_connections)
+        return node
+
+
+class CompiledWorkflow:
+    """한 번 컴파일되어 여러 실행에서 재사용되는 워크플로우 실행 계획
+
+    노드 클래스 해석, 의존성 그래프(인덱스 배열), 위상 정렬 레벨, 입력 참조 파싱을
+    컴파일 시점에 모두 끝내므로 실행 시에는 계획을 순회하기만 하면 됩니다.
+    """
+
+    def __init__(self, config: WorkflowConfig, nodes: List[CompiledNode], levels: List[List[int]], missing_nodes: List[str],
+                 connections: Optional[List[Connection]] = None, warnings: Optional[List[Tuple[str, str]]] = None):
+        self.config = config
+        self.name = config.name
+        self.nodes = nodes
+        # `@node.port` 입력 참조로 만든 노드 간 데이터 연결
+        self.connections = connections or []
+        self.index: Dict[str, int] = {node.node_id: i for i, node in enumerate(nodes)}
+        self.levels = levels
+        self.missing_nodes = missing_nodes
+        # 컴파일 중 발견한 문제 `(노드 ID, 메시지)`, 실행 엔진이 실행마다 `node_warning` 이벤트로 전달
+        self.warnings = warnings or []
+        # 결과 캐시를 쓰는 노드가 있으면 실행 엔진이 노드 지문을 계산 (캐시 키에 사용)
+        self.uses_cache = any(node.cached for node in nodes)
+        self.retry_budget = config.retry_budget
+        # 실행 전체의 제한 시간 (초)
+        self.timeout = config.timeout / 1000 if config.timeout is not None else None
+
+    @property
+    def execution_order(self) -> List[str]:
+        return [self.nodes[i].node_id for level in self.levels for i in level]
+
+
+class WorkflowCompiler:
+    """워크플로우 설정을 `CompiledWorkflow`로 컴파일하고 내용 해시 기반 LRU 캐시에 보관"""
+
+    def __init__(self, node_factory: NodeFactory, max_size: int = 128, limiters: Optional[LimiterRegistry] = None):
+        self.node_factory = node_factory
+        # None이면 프로세스 공유 제한 레지스트리 사용
+        self.limiters = limiters
+        self.max_size = max_size
+        self._parser = YamlWorkflowParser()
+        self._cache: "OrderedDict[str, CompiledWorkflow]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def compile_yaml(self, yaml_text: str) -> CompiledWorkflow:
+        """YAML 문자열 컴파일 (캐시 적중 시 YAML 파싱과 검증을 건너뜀)"""
+        key = self._hash("yaml", yaml_text)
+        cached = self._get(key)
+        if cached is not None:
+            return cached
+        config = self._parser.parse_dict(yaml.safe_load(yaml_text))
+        return self._put(key, self._compile(config))
+
+    def compile_file(self, yaml_path: str | Path) -> CompiledWorkflow:
+        """YAML 파일 컴파일"""
+        with open(yaml_path, 'r', encoding='utf-8') as f:
+            return self.compile_yaml(f.read())
+
+    def compile_dict(self, config_dict: Dict[str, Any]) -> CompiledWorkflow:
+        """딕셔너리 컴파일"""
+        key = self._hash("dict", json.dumps(config_dict, sort_keys=True, default=str))
+        cached = self._get(key)
+        if cached is not None:
+            return cached
+        return self._put(key, self._compile(self._parser.parse_dict(config_dict)))
+
+    def compile(self, config: WorkflowConfig) -> CompiledWorkflow:
+        """검증된 `WorkflowConfig` 컴파일"""
+        key = self._hash("config", json.dumps(config.model_dump(), sort_keys=True, default=str))
+        cached = self._get(key)
+        if cached is not None:
+            return cached
+        return self._put(key, self._compile(config))
+
+    def clear_cache(self) -> None:
+        self._cache.clear()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _hash(kind: str, content: str) -> str:
+        return kind + ":" + hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+    def _get(self, key: str) -> Optional[CompiledWorkflow]:
+        compiled = self._cache.get(key)
+        if compiled is None:
+            self.misses += 1
+            return None
+        self._cache.move_to_end(key)
+        self.hits += 1
+        return compiled
+
+    def _put(self, key: str, compiled: CompiledWorkflow) -> CompiledWorkflow:
+        self._cache[key] = compiled
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.max_size:
+            self._cache.popitem(last=False)
+        return compiled
+
+    def _compile(self, config: WorkflowConfig) -> CompiledWorkflow:
+        warnings: List[Tuple[str, str]] = []
+        dependencies = build_dependencies(config.flow, warnings)
+
+        # 정의되지 않은 노드는 제외하되, 그 노드의 선행 노드를 후행 노드에 이어 붙여 순서를 유지
+        missing_nodes = [node_id for node_id in dependencies if node_id not in config.nodes]
+        for missing in missing_nodes:
+            warnings.append((missing, "노드를 찾을 수 없어 실행하지 않습니다"))
+            inherited = dependencies.pop(missing)
+            for deps in dependencies.values():
+                if missing in deps:
+                    deps.discard(missing)
+                    deps.update(inherited)
+
+        node_ids = list(dependencies)
+        index = {node_id: i for i, node_id in enumerate(node_ids)}
+
+        # 노드 출력 참조는 데이터 연결이자 실행 순서 의존성
+        node_inputs: Dict[str, Dict[str, Any]] = {}
+        connections: List[Connection] = []
+        for node_id in node_ids:
+            inputs = {name: compile_input(value) for name, value in config.nodes[node_id].inputs.items()}
+            for port_name, value in inputs.items():
+                if not isinstance(value, NodeOutputReference):
+                    continue
+                if value.node_id not in index:
+                    where = "플로우에 없는" if value.node_id in config.nodes else "정의되지 않은"
+                    raise ValueError(f"노드 '{node_id}'의 입력 '{port_name}'이(가) {where} 노드 '{value.node_id}'를 참조합니다")
+                value.index = index[value.node_id]
+                dependencies[node_id].add(value.node_id)
+                connections.append(Connection(
+                    source_node_id=value.node_id,
+                    source_port=value.port or "*",
+                    target_node_id=node_id,
+                    target_port=port_name,
+                ))
+            node_inputs[node_id] = inputs
+
+        limiters = (self.limiters or get_limiter_registry()).bind(config.limits, config.name)
+        nodes: List[CompiledNode] = []
+        for node_id in node_ids:
+            node_config = config.nodes[node_id]
+            nodes.append(CompiledNode(
+                node_id=node_id,
+                node_type=node_config.type,
+                node_class=self.node_factory.get_node_class(node_config.type),
+                config=node_config.config,
+                inputs=node_inputs[node_id],
+                cache=node_config.cache,
+                retry=RetryPolicy.from_config(node_config.retry) if node_config.retry else None,
+                timeout=node_config.timeout / 1000 if node_config.timeout is not None else None,
+                limiters=select_limiters(node_id, config.nodes, limiters),
+                definition=stable_hash({"type": node_config.type, "config": node_config.config, "inputs": node_config.inputs}),
+            ))
+
+        for i, node in enumerate(nodes):
+            node.index = i
+            node.input_connections = tuple(c for c in connections if c.target_node_id == node.node_id)
+            node.output_connections = tuple(c for c in connections if c.source_node_id == node.node_id)
+
+        dependents: List[List[int]] = [[] for _ in node_ids]
+        for node_id, deps in dependencies.items():
+            i = index[node_id]
+            nodes[i].dependencies = tuple(sorted(index[dep] for dep in deps))
+            for dep in nodes[i].dependencies:
+                dependents[dep].append(i)
+        for i, node in enumerate(nodes):
+            node.dependents = tuple(dependents[i])
+
+        levels = topological_levels(nodes)
+        return CompiledWorkflow(config, nodes, levels, missing_nodes, connections, warnings)
+
+
+def build_dependencies(flow: List[Any], warnings: Optional[List[Tuple[str, str]]] = None) -> Dict[str, Set[str]]:
+    """플로우 정의에서 노드별 선행 노드 집합 계산
+
+    - 문자열: 이전 단계의 모든 노드에 의존
+    - 리스트: 병렬 그룹, 그룹의 각 노드가 이전 단계의 모든 노드에 의존
+    - 딕셔너리: `depends_on`이 있으면 해당 노드들에, 없으면 이전 단계에 의존
+
+    플로우에 없는 선행 노드는 무시하고, `warnings`가 주어지면 `(노드 ID, 메시지)`를 추가합니다.
+    """
+    dependencies: Dict[str, Set[str]] = {}
+    prev_nodes: List[str] = []
+
+    for step in flow:
+        if isinstance(step, str):
+            dependencies.setdefault(step, set()).update(prev_nodes)
+            prev_nodes = [step]
+
+        elif isinstance(step, list):
+            group = [node for node in step if isinstance(node, str)]
+            for node in group:
+                dependencies.setdefault(node, set()).update(prev_nodes)
+            prev_nodes = group
+
+        elif isinstance(step, dict):
+            node_name = step.get("node")
+            if not isinstance(node_name, str):
+                continue
+            depends_on = step.get("depends_on")
+            if depends_on is None:
+                step_deps = set(prev_nodes)
+            else:
+                step_deps = {dep for dep in depends_on if isinstance(dep, str)}
+            dependencies.setdefault(node_name, set()).update(step_deps)
+            prev_nodes = [node_name]
+
+    # 플로우에 없는 노드에 대한 의존성은 무시
+    for node_name, deps in dependencies.items():
+        unknown = deps - dependencies.keys()
+        if unknown:
+            if warnings is not None:
+                warnings.append((node_name, f"플로우에서 찾을 수 없는 선행 노드를 무시합니다: {', '.join(sorted(unknown))}"))
+            deps -= unknown
+        deps.discard(node_name)
+
+    return dependencies
+
+
+def topological_levels(nodes: List[CompiledNode]) -> List[List[int]]:
+    """위상 정렬 레벨 계산 (같은 레벨의 노드는 서로 독립)"""
+    in_degree = [len(node.dependencies) for node in nodes]
+    level = [i for i, degree in enumerate(in_degree) if degree == 0]
+    levels: List[List[int]] = []
+    visited = 0
+
+    while level:
+        levels.append(level)
+        visited += len(level)
+        next_level = []
+        for i in level:
+            for dependent in nodes[i].dependents:
+                in_degree[dependent] -= 1
+                if in_degree[dependent] == 0:
+                    next_level.append(dependent)
+        level = next_level
+
+    if visited != len(nodes):
+        cyclic = sorted(node.node_id for i, node in enumerate(nodes) if in_degree[i] > 0)
+        raise ValueError(f"순환 참조가 발견되었습니다: {', '.join(cyclic)}")
+
+    return levels
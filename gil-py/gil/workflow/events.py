@@ -0,0 +1,207 @@
+"""
+워크플로우 실행 이벤트와 관찰자
+"""
+
+import json
+import os
+import reprlib
+import sys
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, FrozenSet, IO, List, Optional, Sequence
+
+# 이벤트 레벨
+DEBUG = 10
+INFO = 20
+WARNING = 30
+ERROR = 40
+OFF = 100
+
+LEVEL_NAMES = {DEBUG: "debug", INFO: "info", WARNING: "warning", ERROR: "error", OFF: "off"}
+
+# 이벤트 종류별 레벨
+EVENT_LEVELS: Dict[str, int] = {
+    "run_started": INFO,
+    "node_started": INFO,
+    "node_inputs": DEBUG,
+    "node_token": INFO,
+    "node_finished": INFO,
+    "node_retry": WARNING,
+    "node_warning": WARNING,
+    "node_failed": ERROR,
+    "run_finished": INFO,
+    # 추적 스팬 (단계별 시각 포함)
+    "node_span": DEBUG,
+    "run_span": DEBUG,
+}
+
+_summary = reprlib.Repr()
+_summary.maxstring = 200
+_summary.maxother = 200
+_summary.maxlist = 20
+_summary.maxdict = 20
+
+
+def summarize(value: Any) -> str:
+    """로그용 짧은 표현 (긴 문자열/바이트/컬렉션은 잘라냄)"""
+    return _summary.repr(value)
+
+
+def compact(value: Any, depth: int = 0) -> Any:
+    """JSON 로그용으로 값의 구조는 유지하면서 크기를 제한"""
+    if value is None or isinstance(value, (bool, int, float)):
+        return value
+    if isinstance(value, str):
+        return value if len(value) <= _summary.maxstring else value[:_summary.maxstring] + f"...({len(value)} chars)"
+    if isinstance(value, (bytes, bytearray)):
+        return f"<{len(value)} bytes>"
+    if depth < 3 and isinstance(value, dict):
+        items = list(value.items())[:_summary.maxdict]
+        return {str(key): compact(item, depth + 1) for key, item in items}
+    if depth < 3 and isinstance(value, (list, tuple)):
+        return [compact(item, depth + 1) for item in value[:_summary.maxlist]]
+    return summarize(value)
+
+
+def parse_level(name: str) -> int:
+    """레벨 이름(`debug`, `info`, `warning`, `error`, `off`)을 레벨 값으로 변환"""
+    for level, level_name in LEVEL_NAMES.items():
+        if level_name == name.lower():
+            return level
+    raise ValueError(f"알 수 없는 로그 레벨입니다: '{name}'")
+
+
+class ExecutionObserver(ABC):
+    """실행 이벤트 관찰자 기본 클래스
+
+    `level` 이상인 이벤트만 `handle(event_type, data)`로 전달받습니다.
+    `event_types`를 지정하면 그 이벤트 종류만 전달받습니다.
+    """
+
+    level: int = INFO
+    event_types: Optional[FrozenSet[str]] = None
+
+    @abstractmethod
+    def handle(self, event_type: str, data: Dict[str, Any]) -> None:
+        pass
+
+
+class CallbackObserver(ExecutionObserver):
+    """`(event_type, data)` 콜백을 관찰자로 감쌈"""
+
+    def __init__(self, callback: Callable[[str, Dict[str, Any]], Any], level: int = INFO):
+        self.callback = callback
+        self.level = level
+
+    def handle(self, event_type: str, data: Dict[str, Any]) -> None:
+        self.callback(event_type, data)
+
+
+class ConsoleObserver(ExecutionObserver):
+    """사람이 읽기 쉬운 형태로 콘솔에 출력 (DEBUG 레벨에서는 노드 입력도 요약해 출력)"""
+
+    event_types = frozenset({
+        "run_started", "node_started", "node_inputs", "node_finished", "node_retry", "node_warning", "node_failed",
+        "run_finished",
+    })
+
+    def __init__(self, level: int = INFO, stream: Optional[IO[str]] = None):
+        self.level = level
+        self.stream = stream
+
+    def _print(self, message: str) -> None:
+        print(message, file=self.stream or sys.stdout)
+
+    def handle(self, event_type: str, data: Dict[str, Any]) -> None:
+        if event_type == "run_started":
+            self._print(f"🚀 워크플로우 실행 시작 (노드 {len(data['nodes'])}개)")
+            self._print(f"📋 실행 순서: {' -> '.join(data['nodes'])}")
+        elif event_type == "node_started":
+            self._print(f"⚡ 노드 '{data['node']}' 실행 중...")
+        elif event_type == "node_inputs":
+            self._print(f"   📥 입력 데이터: {summarize(data['inputs'])}")
+        elif event_type == "node_finished":
+            if data.get("cached"):
+                self._print(f"💾 노드 '{data['node']}' 캐시된 결과 사용")
+            else:
+                self._print(f"✅ 노드 '{data['node']}' 완료 ({data['duration_ms']}ms)")
+        elif event_type == "node_retry":
+            self._print(
+                f"🔁 노드 '{data['node']}' 재시도 {data['attempt'] + 1}/{data['max_attempts']} "
+                f"({data['delay_ms']}ms 후): {data['error']}"
+            )
+        elif event_type == "node_warning":
+            self._print(f"⚠️ 노드 '{data['node']}': {data['message']}")
+        elif event_type == "node_failed":
+            self._print(f"❌ 노드 '{data['node']}' 실행 실패: {data['error']}")
+        elif event_type == "run_finished":
+            self._print(f"🎉 워크플로우 실행 완료! ({data['duration_ms']}ms)")
+
+
+class JsonLogObserver(ExecutionObserver):
+    """이벤트마다 JSON 한 줄을 기록하는 구조화 로그 (기본값: DEBUG 레벨, stderr)
+
+    큰 값은 `compact`로 잘라내고, JSON으로 표현할 수 없는 값은 `summarize`로 요약해 기록합니다.
+    """
+
+    def __init__(self, level: int = DEBUG, stream: Optional[IO[str]] = None):
+        self.level = level
+        self.stream = stream
+
+    def handle(self, event_type: str, data: Dict[str, Any]) -> None:
+        record = {
+            "ts": round(time.time(), 6),
+            "level": LEVEL_NAMES[EVENT_LEVELS.get(event_type, INFO)],
+            "event": event_type,
+        }
+        record.update({key: compact(value) for key, value in data.items()})
+        stream = self.stream or sys.stderr
+        stream.write(json.dumps(record, ensure_ascii=False, default=summarize) + "\n")
+
+
+class EventDispatcher:
+    """관찰자 목록으로 이벤트 전달
+
+    이벤트 종류별로 받을 관찰자를 미리 계산해 두므로, 실행 엔진은 `wants(event_type)`가
+    False인 이벤트의 데이터를 만들지 않고 건너뛸 수 있습니다 (관찰자가 없으면 비용 없음).
+    """
+
+    def __init__(self, observers: Sequence[ExecutionObserver] = ()):
+        self.observers = list(observers)
+        self._routes: Dict[str, List[ExecutionObserver]] = {
+            event_type: [
+                observer for observer in self.observers
+                if observer.level <= level and (observer.event_types is None or event_type in observer.event_types)
+            ]
+            for event_type, level in EVENT_LEVELS.items()
+        }
+
+    def wants(self, event_type: str) -> bool:
+        return bool(self._routes.get(event_type))
+
+    def emit(self, event_type: str, data: Dict[str, Any]) -> None:
+        for observer in self._routes.get(event_type, ()):
+            observer.handle(event_type, data)
+
+
+def default_observers(metrics: bool = False) -> List[ExecutionObserver]:
+    """환경 변수로 기본 관찰자 구성
+
+    - GIL_LOG_LEVEL: `debug`, `info` (기본값), `warning`, `error`, `off`
+    - GIL_LOG_FORMAT: `console` (기본값) 또는 `json`
+    - GIL_TRACE_FILE: 실행/노드 스팬을 OTLP/JSON 줄 형식으로 기록할 파일
+    - GIL_METRICS: `on`이면 노드 타입별 지연 시간 히스토그램 수집 (`metrics=True`와 같음)
+    """
+    observers: List[ExecutionObserver] = []
+    level = parse_level(os.getenv("GIL_LOG_LEVEL", "info"))
+    if level < OFF:
+        if os.getenv("GIL_LOG_FORMAT", "console").lower() == "json":
+            observers.append(JsonLogObserver(level=level))
+        else:
+            observers.append(ConsoleObserver(level=level))
+
+    trace_file = os.getenv("GIL_TRACE_FILE")
+    if metrics or trace_file or os.getenv("GIL_METRICS", "").lower() in ("1", "on", "true"):
+        from .tracing import OtlpJsonFileExporter, TracingObserver
+        observers.append(TracingObserver(exporter=OtlpJsonFileExporter(trace_file) if trace_file else None))
+    return observers
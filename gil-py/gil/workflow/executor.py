@@ -2,75 +2,648 @@
 워크플로우 실행 엔진
 """
 
-from typing import Dict, Any
+import asyncio
+import hashlib
+import time
+import uuid
+from contextvars import ContextVar
+from typing import Callable, Dict, Any, List, Optional, Sequence, Set, Tuple, Union
 from ..core.node import Node
 from ..core.context import Context
+from ..core.deadline import deadline_scope, get_deadline
+from ..core.stream import TokenStream
 from ..yaml_parser import WorkflowConfig
 from ..workflow.node_factory import NodeFactory
+from .compiler import CompiledWorkflow, CompiledNode, ContextReference, NodeOutputReference, WorkflowCompiler
+from .cache import MISS, ResultCache, cache_key, get_result_cache, stable_hash
+from .checkpoint import FAILED, FINISHED, CheckpointStore, RunCheckpoint
+from .events import CallbackObserver, EventDispatcher, ExecutionObserver, default_observers
+from .limits import Limiter, acquire_all, release_all
+from .pool import NodePool, get_node_pool
+from .retry import RetryBudget
+from .workers import ASYNC, run_node
+
+
+def incremental_run_id(key: str) -> str:
+    """증분 실행 체크포인트의 실행 ID (워크플로우 이름이나 파일 경로마다 하나)"""
+    return "incremental-" + hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
+
+
+class NodeTimeoutError(TimeoutError):
+    """노드 실행이 제한 시간을 넘김"""
+
+
+class WorkflowTimeoutError(TimeoutError):
+    """워크플로우 실행 전체가 제한 시간을 넘김"""
+
+
+# 현재 실행 중인 실행 엔진 (노드 태스크까지 전달되어, 하위 흐름을 실행하는 노드가 사용)
+_current_executor: ContextVar[Optional["WorkflowExecutor"]] = ContextVar("gil_current_executor", default=None)
+
+
+def current_executor() -> Optional["WorkflowExecutor"]:
+    """지금 노드를 실행 중인 `WorkflowExecutor` (실행 밖이면 None)"""
+    return _current_executor.get()
+
+
+# 스트리밍 출력 콜백: (node_id, port_name, stream)
+StreamCallback = Callable[[str, str, TokenStream], Any]
+
+# 실행 이벤트 콜백: (event_type, data)
+# event_type: run_started, node_started, node_inputs, node_token, node_finished, node_retry, node_warning, node_failed, run_finished
+EventCallback = Callable[[str, Dict[str, Any]], Any]
 
 
 class WorkflowExecutor:
-    """워크플로우 실행 엔진"""
-    
-    def __init__(self, node_factory: NodeFactory):
+    """워크플로우 실행 엔진
+
+    컴파일된 실행 계획의 의존성 그래프를 따라, 선행 노드가 모두 끝난 노드를
+    asyncio 태스크로 동시에 실행합니다. 동기 `execute`를 가진 노드는 워커 풀에서
+    실행되어 이벤트 루프를 막지 않습니다.
+
+    노드가 `TokenStream`을 출력하면 후행 노드는 스트림이 끝나기 전에 실행을 시작할 수
+    있으며, 실행 결과에는 스트림이 끝난 뒤 모인 전체 내용이 기록됩니다.
+
+    `cache`가 설정된 노드는 타입/설정/입력이 같으면 `result_cache`(기본값: 프로세스 공유 캐시)에
+    저장된 결과를 재사용합니다. JSON으로 표현할 수 없는 `@node.port` 입력(커넥터의 클라이언트 등)은
+    값 대신 그 노드의 지문으로 캐시 키를 만듭니다.
+
+    `@node.port` 입력은 컴파일 시 바인딩된 출력 슬롯(노드 인덱스)에서 바로 값을 가져옵니다.
+
+    실행 과정은 출력 대신 `observers`(기본값: GIL_LOG_LEVEL/GIL_LOG_FORMAT 환경 변수로 구성)에
+    이벤트로 전달되며, 받을 관찰자가 없는 이벤트는 데이터를 만들지 않습니다.
+
+    `checkpoints`가 설정되면 노드가 끝날 때마다 결과와 컨텍스트 스냅샷을 저장하고,
+    `execute(..., resume=run_id)`는 저장된 실행을 이어서 입력이 바뀌지 않은 노드를 건너뜁니다.
+    `execute(..., incremental=True)`는 같은 워크플로우의 이전 증분 실행에서 지문이 같은 노드의 결과를
+    재사용하고, 바뀐 노드와 그 후행 노드만 다시 실행합니다.
+
+    노드 인스턴스는 `node_pool`(기본값: 프로세스 공유 풀)에서 빌려 쓰므로, 같은 워크플로우를
+    반복 실행하면 노드 생성과 `setup()`을 다시 하지 않습니다.
+    """
+
+    def __init__(
+        self,
+        node_factory: NodeFactory,
+        compiler: Optional[WorkflowCompiler] = None,
+        result_cache: Optional[ResultCache] = None,
+        observers: Optional[Sequence[ExecutionObserver]] = None,
+        checkpoints: Optional[CheckpointStore] = None,
+        node_pool: Optional[NodePool] = None,
+    ):
         self.node_factory = node_factory
+        self.compiler = compiler or WorkflowCompiler(node_factory)
+        self.result_cache = result_cache
+        self.observers: List[ExecutionObserver] = list(observers) if observers is not None else default_observers()
         self.execution_results: Dict[str, Any] = {}
-    
-    async def execute(self, workflow: WorkflowConfig, context: Context) -> Dict[str, Any]:
-        """워크플로우 실행"""
+        # 실행 계획의 노드 인덱스별 출력 (`@node.port` 참조가 바로 조회)
+        self._slots: List[Any] = []
+        self.cache_stats: Dict[str, int] = {"hits": 0, "misses": 0}
+        self._pending_cache_writes: List[Tuple[str, str, Optional[float]]] = []
+        self.checkpoints = checkpoints
+        self.node_pool = node_pool or get_node_pool()
+        # 재개 중인 실행의 저장된 상태와, 스트림이 끝난 뒤 저장할 (노드, 지문)
+        self._checkpoint: Optional[RunCheckpoint] = None
+        self._pending_checkpoints: List[Tuple[str, str]] = []
+        # 노드 인덱스별 지문과, 이번 실행에서 저장된 결과를 재사용한 노드
+        self._fingerprints: List[Optional[str]] = []
+        self._track_fingerprints = False
+        self.reused_nodes: List[str] = []
+        # 제한 시간이 지나도 워커에서 계속 실행 중일 수 있어 풀로 돌려보내지 않을 노드 인덱스
+        self._discarded: Set[int] = set()
+        # 실행 시작 시의 컨텍스트 (스냅샷에는 노드가 바꾼 값만 저장)
+        self._initial_context: Dict[str, Any] = {}
+        self._streams: List[Tuple[str, str, TokenStream]] = []
+        self._stream_forwarders: List["asyncio.Future[None]"] = []
+        self._on_stream: Optional[StreamCallback] = None
+        self._events = EventDispatcher()
+        self.run_id: Optional[str] = None
+        # 추적 ID는 실행할 때마다 새로 생성 (재개/증분 실행은 실행 ID를 이어받지만 추적은 따로 기록)
+        self.trace_id: Optional[str] = None
+        self.retry_budget = RetryBudget()
+        self._wall_offset_ns = 0
+
+    async def execute(
+        self,
+        workflow: Union[WorkflowConfig, CompiledWorkflow],
+        context: Context,
+        on_stream: Optional[StreamCallback] = None,
+        on_event: Optional[EventCallback] = None,
+        resume: Optional[str] = None,
+        incremental: Union[bool, str] = False,
+    ) -> Dict[str, Any]:
+        """워크플로우 실행
+
+        `on_stream`은 노드가 스트리밍 출력을 내보낼 때 `(node_id, port_name, stream)`으로 호출됩니다.
+        `on_event`는 이번 실행에 한해 INFO 레벨 이상의 진행 상황(노드 시작/종료, 출력, 소요 시간,
+        스트리밍 청크)을 `(event_type, data)`로 전달받습니다.
+
+        워크플로우 `timeout`(또는 호출한 쪽의 `deadline_scope`)이 지나면 실행 중인 노드를 취소하고
+        `WorkflowTimeoutError`를 발생시킵니다.
+
+        `resume`에 이전 실행 ID를 주면 체크포인트에 저장된 노드 중 타입/설정/해결된 입력이 같은
+        노드는 실행하지 않고 저장된 결과를 사용하며, 실행 ID도 그대로 이어받습니다.
+
+        `incremental`이 참이면 워크플로우 이름(문자열이면 그 값)마다 하나씩 유지되는 체크포인트를
+        사용해, 지문(노드 정의, 선행 노드 지문, 컨텍스트 입력 값)이 바뀐 노드만 다시 실행합니다.
+        """
         self.execution_results = {}
-        
-        # 노드 인스턴스 생성
-        instantiated_nodes: Dict[str, Node] = {}
-        for node_id, node_config in workflow.nodes.items():
-            instantiated_nodes[node_id] = self.node_factory.create_node(
-                node_config.type, node_config.config, node_id
-            )
-        
-        print(f"🚀 워크플로우 실행 시작 (노드 {len(instantiated_nodes)}개)")
-        print(f"📋 실행 순서: {' -> '.join(workflow.flow)}")
-        
-        # 순차적으로 노드 실행
-        for node_id in workflow.flow:
-            if node_id not in instantiated_nodes:
-                print(f"⚠️ 노드 '{node_id}'를 찾을 수 없습니다")
-                continue
-            
-            node = instantiated_nodes[node_id]
-            node_config = workflow.nodes[node_id]
-            
-            # 입력 데이터 준비
-            node_inputs = {}
-            for input_name, input_value in node_config.inputs.items():
-                # 컨텍스트 참조 해결
-                resolved_value = context.resolve_reference(input_value)
-                node_inputs[input_name] = resolved_value
-            
-            print(f"⚡ 노드 '{node_id}' 실행 중...")
-            print(f"   📥 입력 데이터: {node_inputs}")
-            
+        self.cache_stats = {"hits": 0, "misses": 0}
+        self._pending_cache_writes = []
+        self._checkpoint = None
+        self._pending_checkpoints = []
+        self.reused_nodes = []
+        self._discarded = set()
+        self._streams = []
+        self._stream_forwarders = []
+        self._on_stream = on_stream
+        observers = self.observers + [CallbackObserver(on_event)] if on_event is not None else self.observers
+        self._events = events = EventDispatcher(observers)
+
+        plan = workflow if isinstance(workflow, CompiledWorkflow) else self.compiler.compile(workflow)
+        self.retry_budget = RetryBudget(plan.retry_budget)
+        self._slots = [None] * len(plan.nodes)
+        self._fingerprints = [None] * len(plan.nodes)
+        self._track_fingerprints = self.checkpoints is not None or plan.uses_cache
+
+        self.run_id = None
+        if resume is not None and incremental:
+            raise ValueError("resume과 incremental은 함께 사용할 수 없습니다")
+        if resume is not None:
+            if self.checkpoints is None:
+                raise ValueError("체크포인트 저장소 없이 실행을 재개할 수 없습니다")
+            self._checkpoint = await self.checkpoints.call("load", resume)
+            if self._checkpoint is None:
+                raise ValueError(f"실행 '{resume}'의 체크포인트를 찾을 수 없습니다")
+        elif incremental:
+            if self.checkpoints is None:
+                raise ValueError("체크포인트 저장소 없이 증분 실행을 할 수 없습니다")
+            # 증분 실행은 워크플로우마다 고정된 실행 ID의 체크포인트를 덮어쓰며 이어감
+            resume = incremental_run_id(plan.name if incremental is True else incremental)
+            self._checkpoint = await self.checkpoints.call("load", resume)
+        self._initial_context = dict(context.to_dict())
+        if self._checkpoint is not None:
+            # 건너뛸 노드가 컨텍스트에 남긴 값 복원 (이번 실행에 주어진 값이 우선)
+            for name, value in self._checkpoint.context.items():
+                if context.get(name, MISS) is MISS:
+                    context.set(name, value)
+        self.run_id = resume or uuid.uuid4().hex
+        self.trace_id = uuid.uuid4().hex
+        if self.checkpoints is not None:
+            await self.checkpoints.call("begin", self.run_id, plan.name)
+
+        # 노드 인스턴스 준비 (풀에 있으면 재사용, 없으면 생성 후 setup)
+        instantiated_nodes: List[Node] = await self.node_pool.acquire_all(plan.nodes)
+        run_started = time.perf_counter()
+        self._wall_offset_ns = time.time_ns() - int(run_started * 1e9)
+        if events.wants("run_started"):
+            events.emit("run_started", {
+                "workflow": plan.name,
+                "run_id": self.run_id,
+                "trace_id": self.trace_id,
+                "nodes": [node.node_id for node in plan.nodes],
+            })
+        for node_id, message in plan.warnings:
+            self._warn(node_id, message)
+
+        remaining = [len(compiled_node.dependencies) for compiled_node in plan.nodes]
+        running: Dict["asyncio.Task[None]", int] = {}
+
+        def launch(i: int) -> None:
+            task = asyncio.ensure_future(self._execute_node(plan.nodes[i], instantiated_nodes[i], context, time.perf_counter()))
+            running[task] = i
+
+        status = "error"
+        # 노드 태스크는 생성 시점의 컨텍스트를 복사하므로 마감 시각이 노드까지 전달됨
+        executor_token = _current_executor.set(self)
+        with deadline_scope(plan.timeout) as deadline:
+            try:
+                for i in (plan.levels[0] if plan.levels else []):
+                    launch(i)
+
+                while running:
+                    done, _ = await asyncio.wait(
+                        running.keys(), timeout=self._time_left(deadline), return_when=asyncio.FIRST_COMPLETED
+                    )
+                    if not done:
+                        for i in running.values():
+                            self.execution_results[plan.nodes[i].node_id] = {"error": "워크플로우 실행 시간이 초과되어 취소되었습니다"}
+                        raise WorkflowTimeoutError(f"워크플로우 '{plan.name}' 실행 시간이 초과되었습니다")
+                    for task in done:
+                        i = running.pop(task)
+                        task.result()
+                        # 선행 노드가 모두 끝난 후행 노드 실행
+                        for dependent in plan.nodes[i].dependents:
+                            remaining[dependent] -= 1
+                            if remaining[dependent] == 0:
+                                launch(dependent)
+
+                try:
+                    await asyncio.wait_for(self._collect_streams(), self._time_left(deadline))
+                except asyncio.TimeoutError:
+                    raise WorkflowTimeoutError(f"워크플로우 '{plan.name}' 스트리밍 출력이 제한 시간 안에 끝나지 않았습니다")
+                await self._flush_cache_writes()
+                await self._flush_checkpoints(context)
+                status = "ok"
+            finally:
+                _current_executor.reset(executor_token)
+                for task in running:
+                    task.cancel()
+                for _, _, stream in self._streams:
+                    stream.cancel()
+                for forwarder in self._stream_forwarders:
+                    forwarder.cancel()
+                # 취소된 노드는 아직 실행 중일 수 있으므로 풀로 돌려보내지 않음
+                abandoned = set(running.values()) | self._discarded
+                await self.node_pool.release_all(
+                    [node for i, node in enumerate(plan.nodes) if i not in abandoned],
+                    [node for i, node in enumerate(instantiated_nodes) if i not in abandoned],
+                )
+                if self.checkpoints is not None:
+                    await self._finish_checkpoint(status)
+                if events.wants("run_span"):
+                    events.emit("run_span", {
+                        "run_id": self.run_id,
+                        "trace_id": self.trace_id,
+                        "workflow": plan.name,
+                        "status": status,
+                        "start_ns": self._wall_ns(run_started),
+                        "end_ns": self._wall_ns(time.perf_counter()),
+                    })
+
+        if events.wants("run_finished"):
+            events.emit("run_finished", {"workflow": plan.name, "duration_ms": self._elapsed_ms(run_started)})
+        return {
+            "node_outputs": self.execution_results,
+            "context": context.to_dict(),
+            "cache": dict(self.cache_stats),
+            "retries": self.retry_budget.used,
+            "run_id": self.run_id,
+            "reused": list(self.reused_nodes),
+        }
+
+    async def _execute_node(self, compiled_node: CompiledNode, node: Node, context: Context, ready: float) -> None:
+        """단일 노드 실행 및 결과 기록
+
+        `ready`는 선행 노드가 모두 끝나 실행 가능해진 시각(`time.perf_counter()`)입니다.
+        """
+        node_id = compiled_node.node_id
+        events = self._events
+        dequeued = time.perf_counter()
+
+        # 입력 데이터 준비 (컨텍스트/노드 출력 참조 해결, 실패하면 노드 실패로 기록)
+        input_error: Optional[Exception] = None
+        try:
+            node_inputs = compiled_node.resolve_inputs(context, self._slots)
+        except Exception as e:
+            node_inputs, input_error = {}, e
+
+        started = time.perf_counter()
+        if events.wants("node_started"):
+            events.emit("node_started", {"node": node_id, "type": compiled_node.node_type})
+        if events.wants("node_inputs"):
+            events.emit("node_inputs", {"node": node_id, "inputs": node_inputs})
+
+        status = "ok"
+        error: Optional[str] = None
+        key = None
+        fingerprint = None
+        if self._track_fingerprints and input_error is None:
+            fingerprint = self._fingerprints[compiled_node.index] = self._fingerprint(compiled_node, node_inputs, context)
+        if compiled_node.cached and input_error is None:
+            key = self._cache_key(compiled_node, node_inputs)
+        cached = MISS
+        if self._checkpoint is not None:
+            found, saved = self._checkpoint.result_for(node_id, fingerprint)
+            if found:
+                status, cached = "reused", saved
+                self.reused_nodes.append(node_id)
+        if cached is MISS and compiled_node.cached and input_error is None:
+            cached = await self._cache_get(node_id, key) if key is not None else MISS
+            if cached is not MISS:
+                status = "cached"
+                self.cache_stats["hits"] += 1
+            else:
+                self.cache_stats["misses"] += 1
+
+        if cached is not MISS:
+            executed = time.perf_counter()
+            self.execution_results[node_id] = self._slots[compiled_node.index] = cached
+            if events.wants("node_finished"):
+                events.emit("node_finished", {
+                    "node": node_id,
+                    "type": compiled_node.node_type,
+                    "duration_ms": self._elapsed_ms(started),
+                    "output": cached,
+                    status: True,
+                })
+            if status == "cached" and fingerprint is not None and self.checkpoints is not None:
+                await self._checkpoint_node(node_id, fingerprint, cached, context)
+        else:
+            try:
+                if input_error is not None:
+                    raise input_error
+                # 노드 실행 (동기 노드는 워커 풀로 오프로드, 재시도 정책에 따라 재실행)
+                result = await self._run_with_retry(compiled_node, node, node_inputs, context)
+                executed = time.perf_counter()
+                self.execution_results[node_id] = self._slots[compiled_node.index] = result
+                self._publish_outputs(node, result)
+                if events.wants("node_finished"):
+                    events.emit("node_finished", {
+                        "node": node_id,
+                        "type": compiled_node.node_type,
+                        "duration_ms": self._elapsed_ms(started),
+                        "output": result,
+                    })
+                has_streams = self._register_streams(node_id, result)
+                if key is not None:
+                    # 스트리밍 출력은 전체 내용이 모인 뒤 저장
+                    if has_streams:
+                        self._pending_cache_writes.append((node_id, key, compiled_node.cache_ttl))
+                    elif self._cacheable(result):
+                        await self._cache_set(node_id, key, result, compiled_node.cache_ttl)
+                if fingerprint is not None and self.checkpoints is not None:
+                    if has_streams:
+                        self._pending_checkpoints.append((node_id, fingerprint))
+                    else:
+                        await self._checkpoint_node(node_id, fingerprint, result, context)
+
+            except Exception as e:
+                executed = time.perf_counter()
+                status = "error"
+                error = str(e)
+                self.execution_results[node_id] = self._slots[compiled_node.index] = {"error": error}
+                if events.wants("node_failed"):
+                    events.emit("node_failed", {
+                        "node": node_id,
+                        "type": compiled_node.node_type,
+                        "duration_ms": self._elapsed_ms(started),
+                        "error": error,
+                    })
+
+            node.last_execution_time = executed - started
+
+        if events.wants("node_span"):
+            finished = time.perf_counter()
+            events.emit("node_span", {
+                "run_id": self.run_id,
+                "trace_id": self.trace_id,
+                "node": node_id,
+                "type": compiled_node.node_type,
+                "status": status,
+                "error": error,
+                "start_ns": self._wall_ns(ready),
+                "end_ns": self._wall_ns(finished),
+                "phases": {
+                    "queue_wait": (self._wall_ns(ready), self._wall_ns(dequeued)),
+                    "resolve_inputs": (self._wall_ns(dequeued), self._wall_ns(started)),
+                    "execute": (self._wall_ns(started), self._wall_ns(executed)),
+                    "propagate_outputs": (self._wall_ns(executed), self._wall_ns(finished)),
+                },
+            })
+
+    async def _run_with_retry(self, compiled_node: CompiledNode, node: Node, node_inputs: Dict[str, Any], context: Context) -> Any:
+        """일시적인 오류는 재시도 정책과 실행 재시도 예산이 허락하는 만큼 대기 후 재실행"""
+        policy = compiled_node.retry
+        attempt = 1
+        while True:
+            try:
+                return await self._run_with_timeout(compiled_node, node, node_inputs, context)
+            except Exception as e:
+                if policy is None or attempt >= policy.max_attempts or not policy.should_retry(e):
+                    raise
+                delay = policy.backoff_delay(attempt)
+                # 대기 중에 마감 시각이 지나면 재시도해도 소용없음
+                time_left = self._time_left(get_deadline())
+                if (time_left is not None and time_left <= delay) or not self.retry_budget.acquire():
+                    raise
+                if self._events.wants("node_retry"):
+                    self._events.emit("node_retry", {
+                        "node": compiled_node.node_id,
+                        "type": compiled_node.node_type,
+                        "attempt": attempt,
+                        "max_attempts": policy.max_attempts,
+                        "delay_ms": round(delay * 1000, 3),
+                        "error": str(e),
+                    })
+                await asyncio.sleep(delay)
+                attempt += 1
+
+    async def _run_with_timeout(self, compiled_node: CompiledNode, node: Node, node_inputs: Dict[str, Any], context: Context) -> Any:
+        """노드 한 번 실행 (노드/실행 마감 시각 중 이른 쪽이 지나면 취소)
+
+        동기 노드는 아직 워커 풀에서 시작되지 않았다면 취소되고, 이미 실행 중이면 결과만 버려집니다.
+        """
+        if compiled_node.timeout is None and get_deadline() is None:
+            return await self._run_limited(compiled_node, node, node_inputs, context)
+
+        run_deadline = get_deadline()
+        with deadline_scope(compiled_node.timeout) as deadline:
+            try:
+                return await asyncio.wait_for(
+                    self._run_limited(compiled_node, node, node_inputs, context),
+                    self._time_left(deadline),
+                )
+            except asyncio.TimeoutError as e:
+                if compiled_node.execution_mode != ASYNC:
+                    self._discarded.add(compiled_node.index)
+                if run_deadline is not None and deadline == run_deadline:
+                    raise NodeTimeoutError("워크플로우 실행 시간이 초과되어 노드가 취소되었습니다") from e
+                raise NodeTimeoutError(f"노드 실행 시간이 초과되었습니다 ({compiled_node.timeout}s)") from e
+
+    async def _run_limited(self, compiled_node: CompiledNode, node: Node, node_inputs: Dict[str, Any], context: Context) -> Any:
+        """노드에 적용되는 동시 실행/호출 빈도 제한을 얻은 뒤 실행
+
+        스트리밍 출력을 내보낸 노드는 스트림이 끝날 때까지 동시 실행 자리를 유지합니다.
+        """
+        limiters = compiled_node.limiters
+        if not limiters:
+            return await run_node(node, node_inputs, context, compiled_node.execution_mode)
+
+        await acquire_all(limiters)
+        try:
+            result = await run_node(node, node_inputs, context, compiled_node.execution_mode)
+        except BaseException:
+            release_all(limiters)
+            raise
+        streams = [value for value in result.values() if isinstance(value, TokenStream)] if isinstance(result, dict) else []
+        if streams:
+            self._stream_forwarders.append(asyncio.ensure_future(self._release_after_streams(limiters, streams)))
+        else:
+            release_all(limiters)
+        return result
+
+    @staticmethod
+    async def _release_after_streams(limiters: Sequence[Limiter], streams: List[TokenStream]) -> None:
+        try:
+            for stream in streams:
+                try:
+                    await stream.collect()
+                except Exception:
+                    pass
+        finally:
+            release_all(limiters)
+
+    @staticmethod
+    def _time_left(deadline: Optional[float]) -> Optional[float]:
+        return None if deadline is None else max(0.0, deadline - time.monotonic())
+
+    @staticmethod
+    def _publish_outputs(node: Node, result: Any) -> None:
+        """노드가 직접 기록하지 않은 출력 값을 출력 포트에 기록"""
+        if not isinstance(result, dict) or not node.output_ports:
+            return
+        for port in node.output_ports:
+            if port.name in result and port.get_data() is None:
+                port.set_data(result[port.name])
+
+    def _warn(self, node_id: str, message: str) -> None:
+        if self._events.wants("node_warning"):
+            self._events.emit("node_warning", {"node": node_id, "message": message})
+
+    @staticmethod
+    def _elapsed_ms(started: float) -> float:
+        return round((time.perf_counter() - started) * 1000, 3)
+
+    def _wall_ns(self, perf_time: float) -> int:
+        """`time.perf_counter()` 값을 Unix 시각(ns)으로 변환"""
+        return self._wall_offset_ns + int(perf_time * 1e9)
+
+    def _cache(self) -> ResultCache:
+        if self.result_cache is None:
+            self.result_cache = get_result_cache()
+        return self.result_cache
+
+    async def _cache_get(self, node_id: str, key: str) -> Any:
+        try:
+            return await self._cache().aget(key)
+        except Exception as e:
+            self._warn(node_id, f"캐시 조회 실패: {e}")
+            return MISS
+
+    async def _cache_set(self, node_id: str, key: str, result: Any, ttl: Optional[float]) -> None:
+        try:
+            await self._cache().aset(key, result, ttl)
+        except Exception as e:
+            self._warn(node_id, f"결과를 캐시에 저장하지 못했습니다: {e}")
+
+    async def _flush_cache_writes(self) -> None:
+        """스트리밍이 끝난 노드 결과를 캐시에 저장 (스트림이 실패한 노드는 제외)"""
+        for node_id, key, ttl in self._pending_cache_writes:
+            result = self.execution_results.get(node_id)
+            if self._cacheable(result):
+                await self._cache_set(node_id, key, result, ttl)
+
+    def _cache_key(self, compiled_node: CompiledNode, node_inputs: Dict[str, Any]) -> Optional[str]:
+        """결과 캐시 키 (JSON으로 표현할 수 없는 노드 출력 입력은 그 노드의 지문으로 대신)"""
+        key = cache_key(compiled_node.node_type, compiled_node.config, node_inputs)
+        if key is not None:
+            return key
+        inputs: Dict[str, Any] = {}
+        for name, value in node_inputs.items():
+            reference = compiled_node.inputs.get(name)
+            if isinstance(reference, NodeOutputReference) and stable_hash(value) is None:
+                upstream = self._fingerprints[reference.index]
+                if upstream is None:
+                    return None
+                value = {"@": reference.raw, "fingerprint": upstream}
+            inputs[name] = value
+        return cache_key(compiled_node.node_type, compiled_node.config, inputs)
+
+    def _fingerprint(self, compiled_node: CompiledNode, node_inputs: Dict[str, Any], context: Context) -> Optional[str]:
+        """노드 지문: 노드 정의, 선행 노드 지문, 컨텍스트에서 가져온 입력 값의 해시 (계산할 수 없으면 None)
+
+        노드 출력 참조 입력은 값 대신 그 노드의 지문으로 대신하므로 큰 출력을 해시하지 않으며,
+        선행 노드가 바뀌면 데이터를 주고받지 않는 후행 노드도 다시 실행됩니다.
+        """
+        if compiled_node.definition is None:
+            return None
+        upstream = [self._fingerprints[i] for i in compiled_node.dependencies]
+        if None in upstream:
+            return None
+        context_inputs = {
+            name: node_inputs[name] for name, value in compiled_node.inputs.items() if isinstance(value, ContextReference)
+        }
+        whole_context = context.to_dict() if getattr(compiled_node.node_class, "reads_context", False) else None
+        return stable_hash([compiled_node.definition, upstream, context_inputs, whole_context])
+
+    async def _checkpoint_node(self, node_id: str, fingerprint: str, result: Any, context: Context) -> None:
+        """완료된 노드 결과와 노드들이 바꾼 컨텍스트 값 저장 (실패해도 실행은 계속)"""
+        if not self._cacheable(result):
+            return
+        assert self.checkpoints is not None and self.run_id is not None
+        try:
+            await self.checkpoints.call("save_node", self.run_id, node_id, fingerprint, result)
+            initial = self._initial_context
+            changes = {name: value for name, value in context.to_dict().items() if initial.get(name, MISS) is not value}
+            await self.checkpoints.call("save_context", self.run_id, changes)
+        except Exception as e:
+            self._warn(node_id, f"체크포인트를 저장하지 못했습니다: {e}")
+
+    async def _flush_checkpoints(self, context: Context) -> None:
+        """스트리밍이 끝난 노드 결과를 체크포인트에 저장"""
+        for node_id, fingerprint in self._pending_checkpoints:
+            await self._checkpoint_node(node_id, fingerprint, self.execution_results.get(node_id), context)
+
+    async def _finish_checkpoint(self, status: str) -> None:
+        """실행 상태 기록 (실패한 노드가 있으면 `failed`)"""
+        assert self.checkpoints is not None and self.run_id is not None
+        failed = status != "ok" or any(not self._cacheable(result) for result in self.execution_results.values())
+        try:
+            await self.checkpoints.call("finish", self.run_id, FAILED if failed else FINISHED)
+        except Exception:
+            # 상태를 기록하지 못해도 저장된 노드 결과로 재개할 수 있음
+            pass
+
+    @staticmethod
+    def _cacheable(result: Any) -> bool:
+        """오류를 담은 결과는 캐시하지 않음"""
+        return not (isinstance(result, dict) and "error" in result)
+
+    def _register_streams(self, node_id: str, result: Any) -> bool:
+        """노드 결과의 스트리밍 출력 등록 (스트리밍 출력이 있으면 True)"""
+        if not isinstance(result, dict):
+            return False
+        has_streams = False
+        for port_name, value in result.items():
+            if isinstance(value, TokenStream):
+                has_streams = True
+                self._streams.append((node_id, port_name, value))
+                if self._on_stream is not None:
+                    self._on_stream(node_id, port_name, value)
+                if self._events.wants("node_token"):
+                    self._stream_forwarders.append(asyncio.ensure_future(self._forward_stream(node_id, port_name, value)))
+        return has_streams
+
+    async def _forward_stream(self, node_id: str, port_name: str, stream: TokenStream) -> None:
+        """스트림 청크를 `node_token` 이벤트로 전달"""
+        try:
+            async for chunk in stream:
+                self._events.emit("node_token", {"node": node_id, "port": port_name, "chunk": chunk})
+        except Exception:
+            # 스트림 실패는 _collect_streams에서 노드 결과로 기록
+            pass
+
+    async def _collect_streams(self) -> None:
+        """모든 스트림이 끝날 때까지 기다린 후 결과를 전체 내용으로 교체"""
+        for node_id, port_name, stream in self._streams:
             try:
-                # 노드 실행
-                result = await node.execute(node_inputs, context)
-                self.execution_results[node_id] = result
-                print(f"✅ 노드 '{node_id}' 완료")
-                
+                self.execution_results[node_id][port_name] = await stream.collect()
             except Exception as e:
-                error_msg = f"❌ 노드 '{node_id}' 실행 실패: {e}"
-                print(error_msg)
                 self.execution_results[node_id] = {"error": str(e)}
-        
-        print("🎉 워크플로우 실행 완료!")
-        return {"node_outputs": self.execution_results, "context": context.to_dict()}
-    
+                if self._events.wants("node_failed"):
+                    self._events.emit("node_failed", {"node": node_id, "port": port_name, "error": f"스트리밍 실패: {e}"})
+        if self._stream_forwarders:
+            await asyncio.gather(*self._stream_forwarders)
+
     def get_node_result(self, node_name: str) -> Any:
         """특정 노드의 실행 결과 조회"""
         return self.execution_results.get(node_name)
-    
+
     def get_all_results(self) -> Dict[str, Any]:
         """모든 노드의 실행 결과 조회"""
         return self.execution_results.copy()
-    
+
     def clear_results(self) -> None:
         """실행 결과 초기화"""
         self.execution_results.clear()
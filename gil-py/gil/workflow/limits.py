@@ -0,0 +1,228 @@
+"""
+이름 있는 동시 실행 제한과 호출 빈도 제한 (같은 워크플로우의 실행끼리, GIL_LIMITS는 프로세스 전체에서 공유)
+"""
+
+import asyncio
+import json
+import os
+import threading
+import time
+import weakref
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import yaml
+
+from ..yaml_parser import LimitConfig, NodeConfig
+
+
+class ConcurrencySlots:
+    """동시 실행 수 제한 (FIFO 순서로 대기)
+
+    특정 이벤트 루프에 묶이지 않으므로 여러 실행과 요청이 같은 인스턴스를 공유할 수 있습니다.
+    """
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.active = 0
+        self._waiters: Deque["asyncio.Future[None]"] = deque()
+
+    async def acquire(self) -> None:
+        if self.active < self.limit and not self._waiters:
+            self.active += 1
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # 자리를 넘겨받은 직후 취소됨: 다음 대기자에게 넘김
+                self.release()
+            elif waiter in self._waiters:
+                self._waiters.remove(waiter)
+            raise
+
+    def release(self) -> None:
+        # 자리를 해제하지 않고 다음 대기자에게 그대로 넘김
+        while self._waiters and self.active <= self.limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self.active -= 1
+
+
+class TokenBucket:
+    """토큰 버킷 호출 빈도 제한 (`per`초마다 `rate`번, 최대 `burst`번까지 몰아서 허용)
+
+    토큰을 미리 예약하고 부족한 만큼만 기다리므로 대기자는 도착 순서대로 통과합니다.
+    """
+
+    def __init__(self, rate: float, per: float = 1.0, burst: Optional[float] = None):
+        self.rate = rate
+        self.per = per
+        self.burst = burst if burst is not None else max(rate, 1.0)
+        self.tokens = self.burst
+        self._updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self._updated) * self.rate / self.per)
+        self._updated = now
+
+    async def acquire(self, cost: float = 1.0) -> None:
+        self._refill()
+        self.tokens -= cost
+        if self.tokens >= 0:
+            return
+        try:
+            await asyncio.sleep(-self.tokens * self.per / self.rate)
+        except asyncio.CancelledError:
+            self.tokens += cost
+            raise
+
+
+class Limiter:
+    """이름 있는 제한 하나 (동시 실행 수와 호출 빈도 중 설정된 것만 적용)
+
+    노드 시도 한 번마다 자리를 먼저 얻은 뒤 토큰을 소비하므로, 자리를 기다리던 시도가
+    한꺼번에 풀려나도 호출 빈도를 넘지 않습니다.
+    """
+
+    def __init__(self, name: str, config: LimitConfig):
+        self.name = name
+        self.config = config
+        self.slots = ConcurrencySlots(config.concurrency) if config.concurrency is not None else None
+        self.bucket = TokenBucket(config.rate, config.per, config.burst) if config.rate is not None else None
+
+    async def acquire(self) -> None:
+        slots = self.slots
+        if slots is not None:
+            await slots.acquire()
+        try:
+            if self.bucket is not None:
+                await self.bucket.acquire()
+        except BaseException:
+            if slots is not None:
+                slots.release()
+            raise
+
+    def release(self) -> None:
+        if self.slots is not None:
+            self.slots.release()
+
+
+async def acquire_all(limiters: Sequence[Limiter]) -> None:
+    """제한을 순서대로 획득 (중간에 실패하면 이미 얻은 것은 해제)"""
+    acquired: List[Limiter] = []
+    try:
+        for limiter in limiters:
+            await limiter.acquire()
+            acquired.append(limiter)
+    except BaseException:
+        release_all(acquired)
+        raise
+
+
+def release_all(limiters: Iterable[Limiter]) -> None:
+    for limiter in limiters:
+        limiter.release()
+
+
+class LimiterRegistry:
+    """이름별 제한 보관소
+
+    `fixed`(환경 변수 GIL_LIMITS)로 정의한 제한은 프로세스의 모든 워크플로우가 공유하며, 워크플로우의
+    `limits`가 같은 이름을 정의해도 바뀌지 않습니다. 워크플로우의 `limits`는 워크플로우 이름과 설정이
+    같은 실행끼리만 공유하므로, 다른 워크플로우가 같은 이름을 다른 설정으로 정의하거나 워크플로우를
+    고쳐 설정을 바꿔도 이미 컴파일된 계획과 실행 중인 실행의 제한은 바뀌지 않습니다.
+    컴파일된 계획이 더 이상 참조하지 않는 제한은 자동으로 정리됩니다.
+    """
+
+    def __init__(self, fixed: Optional[Dict[str, LimitConfig]] = None):
+        self.fixed = {name: Limiter(name, config) for name, config in (fixed or {}).items()}
+        self._limiters: "weakref.WeakValueDictionary[Tuple[str, str, str], Limiter]" = weakref.WeakValueDictionary()
+        self._lock = threading.Lock()
+
+    def get(self, name: str) -> Optional[Limiter]:
+        """프로세스 전체 제한 (GIL_LIMITS)"""
+        return self.fixed.get(name)
+
+    def bind(self, limits: Dict[str, LimitConfig], workflow: str = "") -> Dict[str, Limiter]:
+        """워크플로우 `workflow`의 `limits`에 해당하는 제한을 찾거나 만들고, 적용되는 제한 전체를 반환"""
+        bound = dict(self.fixed)
+        with self._lock:
+            for name, config in limits.items():
+                if name in self.fixed:
+                    continue
+                key = (workflow, name, json.dumps(config.model_dump(), sort_keys=True))
+                limiter = self._limiters.get(key)
+                if limiter is None:
+                    limiter = self._limiters[key] = Limiter(name, config)
+                bound[name] = limiter
+        return bound
+
+
+def select_limiters(node_id: str, nodes: Dict[str, NodeConfig], limiters: Dict[str, Limiter]) -> Tuple[Limiter, ...]:
+    """노드에 적용할 제한 (이름 순)
+
+    - 노드의 `limit`으로 지정한 이름
+    - `node_types`에 노드 타입이 있는 제한
+    - `connectors`에 있는 타입의 노드 출력(`@connector.port`)을 입력으로 받는 노드
+    """
+    node = nodes[node_id]
+    names = set()
+    if node.limit is not None:
+        for name in [node.limit] if isinstance(node.limit, str) else node.limit:
+            if name not in limiters:
+                raise ValueError(f"노드 '{node_id}'의 제한 '{name}'이(가) 정의되지 않았습니다")
+            names.add(name)
+
+    connector_types = {
+        nodes[source].type
+        for source in _referenced_nodes(node.inputs.values())
+        if source in nodes
+    }
+    for name, limiter in limiters.items():
+        if node.type in limiter.config.node_types or connector_types.intersection(limiter.config.connectors):
+            names.add(name)
+    return tuple(limiters[name] for name in sorted(names))
+
+
+def _referenced_nodes(values: Iterable[Any]) -> List[str]:
+    """입력 값에서 `@node_id.port` 형태로 참조한 노드 ID"""
+    return [
+        value[1:].split(".", 1)[0]
+        for value in values
+        if isinstance(value, str) and value.startswith("@")
+    ]
+
+
+def load_limits(text: str) -> Dict[str, LimitConfig]:
+    """YAML/JSON 매핑 또는 그 파일 경로에서 제한 설정 읽기"""
+    if os.path.isfile(text):
+        with open(text, "r", encoding="utf-8") as f:
+            text = f.read()
+    data = yaml.safe_load(text) or {}
+    if not isinstance(data, dict):
+        raise ValueError("GIL_LIMITS는 제한 이름별 설정 매핑이어야 합니다")
+    return {name: LimitConfig(**config) for name, config in data.items()}
+
+
+_default_registry: Optional[LimiterRegistry] = None
+
+
+def get_limiter_registry() -> LimiterRegistry:
+    """프로세스 전체에서 공유하는 기본 제한 레지스트리 (처음 사용할 때 환경 변수 GIL_LIMITS로 생성)"""
+    global _default_registry
+    if _default_registry is None:
+        limits = os.getenv("GIL_LIMITS")
+        _default_registry = LimiterRegistry(load_limits(limits) if limits else None)
+    return _default_registry
+
+
+def set_limiter_registry(registry: Optional[LimiterRegistry]) -> None:
+    """기본 제한 레지스트리 교체 (None이면 다음 사용 시 환경 변수로 다시 생성)"""
+    global _default_registry
+    _default_registry = registry
@@ -1,36 +1,140 @@
 """
 노드 팩토리 - 설치된 노드 패키지에서 동적으로 노드 인스턴스 생성
 """
+import hashlib
 import importlib.metadata
-from typing import Dict, Any, Type, List, Optional
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Dict, Any, Type, List, Optional, Tuple
 
 from ..core.node import Node
 
+ENTRY_POINT_GROUP = "gil.nodes"
+_CACHE_FORMAT_VERSION = 1
+
+# 프로세스 전역 레지스트리: 엔트리 포인트 스캔 결과와 한 번 로드된 노드 클래스
+_discovered_entry_points: Optional[Dict[str, importlib.metadata.EntryPoint]] = None
+_loaded_node_classes: Dict[str, Type[Node]] = {}
+
+
+def _cache_path() -> Optional[Path]:
+    """
+    엔트리 포인트 스캔 결과를 저장할 캐시 파일 경로.
+    `GIL_NODE_CACHE` 환경 변수로 경로를 지정할 수 있으며, 빈 값이면 디스크 캐시를 사용하지 않습니다.
+    """
+    override = os.getenv("GIL_NODE_CACHE")
+    if override is not None:
+        return Path(override) if override else None
+    base = os.getenv("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(base) / "gil-flow" / "node_entry_points.json"
+
+
+def _distributions_fingerprint() -> str:
+    """
+    `sys.path`에 설치된 배포판(dist-info/egg-info) 이름, 버전, 수정 시각으로 만든 지문.
+    패키지를 설치/삭제/재설치하면 값이 바뀌어 디스크 캐시가 무효화됩니다.
+    """
+    entries: List[str] = []
+    for path_entry in sys.path:
+        directory = path_entry or "."
+        try:
+            names = os.listdir(directory)
+        except OSError:
+            continue
+        for name in names:
+            if name.endswith((".dist-info", ".egg-info")):
+                try:
+                    mtime = os.stat(os.path.join(directory, name)).st_mtime_ns
+                except OSError:
+                    mtime = 0
+                entries.append(f"{directory}{os.sep}{name}:{mtime}")
+    entries.sort()
+    return hashlib.sha256("\n".join(entries).encode("utf-8")).hexdigest()
+
+
+def _read_entry_point_cache(fingerprint: str) -> Optional[Dict[str, importlib.metadata.EntryPoint]]:
+    path = _cache_path()
+    if path is None:
+        return None
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+        if cached.get("version") != _CACHE_FORMAT_VERSION or cached.get("fingerprint") != fingerprint:
+            return None
+        return {
+            name: importlib.metadata.EntryPoint(name=name, value=value, group=ENTRY_POINT_GROUP)
+            for name, value in cached["entry_points"].items()
+        }
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return None
+
+
+def _write_entry_point_cache(fingerprint: str, entry_points: Dict[str, importlib.metadata.EntryPoint]) -> None:
+    path = _cache_path()
+    if path is None:
+        return
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                "version": _CACHE_FORMAT_VERSION,
+                "fingerprint": fingerprint,
+                "entry_points": {name: ep.value for name, ep in entry_points.items()},
+            }, f)
+        os.replace(tmp_path, path)
+    except OSError:
+        # 캐시는 최적화일 뿐이므로 저장 실패는 무시
+        pass
+
+
+def discover_entry_points(refresh: bool = False) -> Dict[str, importlib.metadata.EntryPoint]:
+    """
+    `gil.nodes` 엔트리 포인트를 프로세스당 한 번만 스캔합니다 (모듈은 import하지 않음).
+    설치된 배포판이 바뀌지 않았다면 디스크 캐시의 스캔 결과를 재사용합니다.
+    """
+    global _discovered_entry_points
+    if _discovered_entry_points is not None and not refresh:
+        return _discovered_entry_points
+
+    fingerprint = _distributions_fingerprint()
+    discovered = None if refresh else _read_entry_point_cache(fingerprint)
+    if discovered is None:
+        discovered = {}
+        for entry_point in importlib.metadata.entry_points(group=ENTRY_POINT_GROUP):
+            if entry_point.name in discovered:
+                # Handle potential conflicts if multiple packages register the same node type
+                print(f"Warning: Node type '{entry_point.name}' is already registered. Overwriting.")
+            discovered[entry_point.name] = entry_point
+        _write_entry_point_cache(fingerprint, discovered)
+
+    if refresh:
+        _loaded_node_classes.clear()
+    _discovered_entry_points = discovered
+    return discovered
+
+
 class NodeFactory:
     """
     설치된 `gil-node-*` 패키지에서 노드를 동적으로 발견하고 생성하는 팩토리 클래스.
     `setuptools`의 `entry_points` 메커니즘을 사용하여 'gil.nodes' 그룹에 등록된 노드를 찾습니다.
+    엔트리 포인트는 이름만 기록해 두고, 노드 클래스는 해당 타입이 처음 요청될 때 로드합니다.
     """
-    
+
     def __init__(self):
         self._node_registry: Dict[str, Type[Node]] = {}
+        self._entry_points: Dict[str, importlib.metadata.EntryPoint] = {}
+        # 노드 타입별 조회 정보 캐시 (같은 타입이 다른 클래스로 다시 등록되면 무효)
+        self._node_info: Dict[str, Tuple[Type[Node], Dict[str, Any]]] = {}
         self._discover_nodes()
-    
+
     def _discover_nodes(self) -> None:
         """
-        `gil.nodes` entry point를 스캔하여 사용 가능한 모든 노드를 동적으로 등록합니다.
+        `gil.nodes` entry point 목록을 가져옵니다. 스캔 결과는 프로세스 전역에서 공유됩니다.
         """
-        entry_points = importlib.metadata.entry_points(group='gil.nodes')
-
-        for entry_point in entry_points:
-            try:
-                node_class = entry_point.load()
-                # The entry point name is the node_type
-                node_type = entry_point.name
-                self.register(node_type, node_class)
-            except Exception as e:
-                # Log or print a warning that a node could not be loaded
-                print(f"Warning: Could not load node '{entry_point.name}': {e}")
+        self._entry_points = discover_entry_points()
 
     def register(self, node_type: str, node_class: Type[Node]) -> None:
         """
@@ -39,78 +143,83 @@ class NodeFactory:
         if not issubclass(node_class, Node):
             print(f"Warning: Class {node_class.__name__} is not a subclass of Node. Skipping.")
             return
-            
+
         if node_type in self._node_registry:
             # Handle potential conflicts if multiple packages register the same node type
             print(f"Warning: Node type '{node_type}' is already registered. Overwriting.")
-            
+
         self._node_registry[node_type] = node_class
-    
+
+    def _load_entry_point(self, node_type: str) -> Optional[Type[Node]]:
+        """
+        엔트리 포인트에서 노드 클래스를 로드합니다 (프로세스당 타입별 한 번).
+        """
+        if node_type in _loaded_node_classes:
+            return _loaded_node_classes[node_type]
+
+        entry_point = self._entry_points.get(node_type)
+        if entry_point is None:
+            return None
+
+        try:
+            node_class = entry_point.load()
+        except Exception as e:
+            raise ValueError(f"Could not load node '{node_type}': {e}") from e
+
+        if not isinstance(node_class, type) or not issubclass(node_class, Node):
+            raise ValueError(f"Entry point '{node_type}' does not refer to a subclass of Node.")
+
+        _loaded_node_classes[node_type] = node_class
+        return node_class
+
+    def get_node_class(self, node_type: str) -> Type[Node]:
+        """
+        레지스트리에서 노드 타입에 해당하는 노드 클래스를 조회합니다.
+        """
+        node_class = self._node_registry.get(node_type)
+        if node_class is None:
+            node_class = self._load_entry_point(node_type)
+            if node_class is None:
+                raise ValueError(f"Unknown node type: '{node_type}'. Is the corresponding node package installed?")
+            self._node_registry[node_type] = node_class
+        return node_class
+
     def create_node(self, node_type: str, config: Dict[str, Any], name: Optional[str] = None) -> Node:
         """
         레지스트리에서 노드 클래스를 찾아 인스턴스를 생성합니다.
         노드 생성에 필요한 모든 복잡한 로직(API 키 처리 등)은
         각 노드 클래스의 생성자(`__init__`)에서 처리해야 합니다.
         """
-        if node_type not in self._node_registry:
-            raise ValueError(f"Unknown node type: '{node_type}'. Is the corresponding node package installed?")
-        
-        node_class = self._node_registry[node_type]
-        
+        node_class = self.get_node_class(node_type)
+
         # The node's __init__ is now responsible for its own setup from the config.
         return node_class(node_id=name or f"{node_type}_instance", node_config=config)
-    
+
     def get_available_nodes(self) -> List[str]:
         """
-        사용 가능한 모든 노드 타입의 목록을 반환합니다.
+        사용 가능한 모든 노드 타입의 목록을 반환합니다 (노드 모듈을 import하지 않음).
         """
-        return sorted(list(self._node_registry.keys()))
-    
+        return sorted(set(self._node_registry) | set(self._entry_points))
+
     def get_node_info(self, node_type: str) -> Dict[str, Any]:
         """
         특정 노드 타입에 대한 상세 정보(설명, 포트 등)를 조회합니다.
+        포트는 노드 클래스에 선언된 스키마에서 읽으므로 인스턴스를 만들지 않으며, 결과는 타입마다 캐시됩니다.
         """
-        if node_type not in self._node_registry:
-            return {"error": f"Unknown node type: '{node_type}'"}
-        
-        node_class = self._node_registry[node_type]
-        
+        try:
+            node_class = self.get_node_class(node_type)
+        except ValueError as e:
+            return {"error": str(e)}
+
+        cached = self._node_info.get(node_type)
+        if cached is not None and cached[0] is node_class:
+            return dict(cached[1])
+
         info: Dict[str, Any] = {
             "type": node_type,
             "class": node_class.__name__,
             "description": node_class.__doc__ or "No description provided.",
-            "input_ports": [],
-            "output_ports": []
+            **node_class.describe_ports(),
         }
-        
-        # Introspect port information from the node class.
-        # This assumes the node can be instantiated without a complex config.
-        # A more robust solution might be a classmethod on the Node base class.
-        try:
-            # We create a dummy instance to inspect its ports.
-            # The node's __init__ should handle a None or empty config gracefully.
-            dummy_instance = node_class(node_id="dummy_for_introspection", node_config={})
-            
-            info["input_ports"] = [
-                {
-                    "name": port.name,
-                    "type": str(port.data_type), # Use str() to be safe
-                    "required": port.required,
-                    "description": port.description
-                }
-                for port in dummy_instance.input_ports
-            ]
-            
-            info["output_ports"] = [
-                {
-                    "name": port.name, 
-                    "type": str(port.data_type),
-                    "description": port.description
-                }
-                for port in dummy_instance.output_ports
-            ]
-            
-        except Exception as e:
-            info["ports_error"] = f"Could not retrieve port information: {e}"
-        
-        return info
+        self._node_info[node_type] = (node_class, info)
+        return dict(info)
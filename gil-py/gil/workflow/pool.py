@@ -0,0 +1,136 @@
+"""
+노드 인스턴스 풀 - 준비된(setup) 노드를 실행 간에 재사용
+"""
+
+import asyncio
+import inspect
+import os
+import weakref
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type
+
+from ..core.node import Node
+from .cache import stable_hash
+
+PoolKey = Tuple[Type[Node], str, str]
+
+DEFAULT_MAX_IDLE = 8
+
+
+async def _call(method: Any) -> None:
+    """동기/비동기 수명 주기 메서드 호출"""
+    result = method()
+    if inspect.isawaitable(result):
+        await result
+
+
+class NodePool:
+    """타입, 노드 ID, 설정이 같은 노드 인스턴스를 보관해 실행 간에 재사용하는 풀
+
+    노드는 처음 만들 때 한 번 `setup()`되고, 실행이 끝나면 `reset()` 후 풀로 돌아가며,
+    풀에서 밀려나거나 풀을 닫을 때 `teardown()`됩니다. 한 인스턴스는 한 번에 한 실행에서만
+    사용되므로, 같은 노드를 동시에 실행하면 인스턴스가 그만큼 만들어집니다.
+
+    노드가 만든 클라이언트 등은 이벤트 루프에 묶이므로 풀은 이벤트 루프마다 따로 유지됩니다.
+    `max_idle`은 키마다 보관할 유휴 인스턴스 수이며, 0이면 풀을 사용하지 않습니다.
+    """
+
+    def __init__(self, max_idle: int = DEFAULT_MAX_IDLE):
+        self.max_idle = max_idle
+        self._idle: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[PoolKey, List[Node]]]" = weakref.WeakKeyDictionary()
+        self.created = 0
+        self.reused = 0
+
+    def _loop_idle(self) -> Dict[PoolKey, List[Node]]:
+        loop = asyncio.get_running_loop()
+        idle = self._idle.get(loop)
+        if idle is None:
+            idle = self._idle[loop] = {}
+        return idle
+
+    @staticmethod
+    def _key(compiled_node: Any) -> Optional[PoolKey]:
+        """풀 키 (재사용할 수 없는 노드면 None)"""
+        if not getattr(compiled_node.node_class, "poolable", True):
+            return None
+        config_key = stable_hash(compiled_node.config)
+        if config_key is None:
+            return None
+        return (compiled_node.node_class, compiled_node.node_id, config_key)
+
+    async def acquire(self, compiled_node: Any) -> Node:
+        """실행 계획의 노드에 맞는 준비된 인스턴스 (없으면 생성 후 `setup()`)"""
+        key = self._key(compiled_node) if self.max_idle > 0 else None
+        if key is not None:
+            idle = self._loop_idle().get(key)
+            if idle:
+                node = idle.pop()
+                node.input_connections = list(compiled_node.input_connections)
+                node.output_connections = list(compiled_node.output_connections)
+                self.reused += 1
+                return node
+        node = compiled_node.instantiate()
+        await _call(node.setup)
+        self.created += 1
+        return node
+
+    async def release(self, compiled_node: Any, node: Node) -> None:
+        """실행이 끝난 인스턴스를 풀로 반환 (풀이 가득 찼거나 재사용할 수 없으면 `teardown()`)"""
+        key = self._key(compiled_node) if self.max_idle > 0 else None
+        if key is not None:
+            idle = self._loop_idle().setdefault(key, [])
+            if len(idle) < self.max_idle:
+                node.reset()
+                idle.append(node)
+                return
+        await _call(node.teardown)
+
+    async def acquire_all(self, compiled_nodes: Sequence[Any]) -> List[Node]:
+        nodes: List[Node] = []
+        try:
+            for compiled_node in compiled_nodes:
+                nodes.append(await self.acquire(compiled_node))
+        except BaseException:
+            await self.release_all(compiled_nodes[:len(nodes)], nodes)
+            raise
+        return nodes
+
+    async def release_all(self, compiled_nodes: Sequence[Any], nodes: Sequence[Node]) -> None:
+        for compiled_node, node in zip(compiled_nodes, nodes):
+            try:
+                await self.release(compiled_node, node)
+            except Exception:
+                # 정리 실패가 실행 결과를 바꾸지 않도록 무시
+                pass
+
+    def idle_count(self) -> int:
+        """현재 이벤트 루프의 유휴 인스턴스 수"""
+        return sum(len(nodes) for nodes in self._loop_idle().values())
+
+    async def close(self) -> None:
+        """현재 이벤트 루프의 유휴 인스턴스를 모두 `teardown()` (예: 서버 종료 시)"""
+        idle = self._loop_idle()
+        nodes = [node for pooled in idle.values() for node in pooled]
+        idle.clear()
+        for node in nodes:
+            try:
+                await _call(node.teardown)
+            except Exception:
+                pass
+
+
+_default_pool: Optional[NodePool] = None
+
+
+def get_node_pool() -> NodePool:
+    """프로세스 전체에서 공유하는 기본 노드 풀 (`GIL_NODE_POOL_SIZE`: 키마다 보관할 유휴 인스턴스 수, 0이면 사용 안 함)"""
+    global _default_pool
+    if _default_pool is None:
+        value = os.getenv("GIL_NODE_POOL_SIZE")
+        _default_pool = NodePool(max_idle=int(value) if value else DEFAULT_MAX_IDLE)
+    return _default_pool
+
+
+def set_node_pool(pool: Optional[NodePool]) -> None:
+    """기본 노드 풀 교체 (None이면 다음 사용 시 환경 변수로 다시 생성)"""
+    global _default_pool
+    _default_pool = pool
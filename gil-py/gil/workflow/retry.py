@@ -0,0 +1,129 @@
+"""
+노드 재시도 정책과 실행 단위 재시도 예산
+"""
+
+import asyncio
+import random
+from typing import Any, Dict, Optional
+
+BACKOFF_STRATEGIES = ("fixed", "linear", "exponential")
+
+# 일시적인 오류로 보는 HTTP 상태 코드 (5xx 포함)
+RETRYABLE_STATUS_CODES = frozenset({408, 409, 429})
+
+# OpenAI SDK 등에서 일시적인 오류를 나타내는 예외 이름
+RETRYABLE_ERROR_NAMES = frozenset({
+    "APIConnectionError",
+    "APITimeoutError",
+    "RateLimitError",
+    "InternalServerError",
+    "ServiceUnavailableError",
+})
+
+
+def _status_code(error: BaseException) -> Optional[int]:
+    status = getattr(error, "status_code", None)
+    if status is None:
+        status = getattr(getattr(error, "response", None), "status_code", None)
+    return status if isinstance(status, int) else None
+
+
+def is_retryable(error: BaseException) -> bool:
+    """일시적인 오류 여부 (429/408/409, 5xx, 연결/타임아웃 오류)
+
+    노드가 원래 예외를 감싸서 다시 던져도(`raise ... from e`) 원인 체인을 따라가며 판별합니다.
+    """
+    seen = set()
+    current: Optional[BaseException] = error
+    while current is not None and id(current) not in seen:
+        seen.add(id(current))
+        status = _status_code(current)
+        if status is not None:
+            return status in RETRYABLE_STATUS_CODES or status >= 500
+        if type(current).__name__ in RETRYABLE_ERROR_NAMES:
+            return True
+        if isinstance(current, (ConnectionError, TimeoutError, asyncio.TimeoutError)):
+            return True
+        current = current.__cause__ or current.__context__
+    return False
+
+
+class RetryPolicy:
+    """노드 재시도 정책 (YAML `retry` 설정)
+
+    - max_attempts: 최대 시도 횟수 (첫 실행 포함, 기본값 3)
+    - delay: 첫 재시도 전 대기 시간 (ms, 기본값 1000)
+    - backoff: `fixed`, `linear`, `exponential` (기본값)
+    - max_delay: 대기 시간 상한 (ms, 기본값 30000)
+    - jitter: True(기본값)이면 0~계산된 대기 시간 사이에서 무작위로 대기 (full jitter)
+    - retry_on: `transient`(기본값, 일시적인 오류만) 또는 `any`
+    """
+
+    __slots__ = ("max_attempts", "delay", "backoff", "max_delay", "jitter", "retry_on")
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        delay: float = 1.0,
+        backoff: str = "exponential",
+        max_delay: float = 30.0,
+        jitter: bool = True,
+        retry_on: str = "transient",
+    ):
+        if max_attempts < 1:
+            raise ValueError("retry.max_attempts는 1 이상이어야 합니다")
+        if backoff not in BACKOFF_STRATEGIES:
+            raise ValueError(f"지원하지 않는 backoff입니다: '{backoff}' ({', '.join(BACKOFF_STRATEGIES)})")
+        if retry_on not in ("transient", "any"):
+            raise ValueError(f"지원하지 않는 retry_on입니다: '{retry_on}' (transient, any)")
+        self.max_attempts = max_attempts
+        self.delay = delay
+        self.backoff = backoff
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.retry_on = retry_on
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "RetryPolicy":
+        """YAML `retry` 설정에서 생성 (시간 단위는 ms)"""
+        return cls(
+            max_attempts=int(config.get("max_attempts", 3)),
+            delay=float(config.get("delay", 1000)) / 1000,
+            backoff=config.get("backoff", "exponential"),
+            max_delay=float(config.get("max_delay", 30000)) / 1000,
+            jitter=bool(config.get("jitter", True)),
+            retry_on=config.get("retry_on", "transient"),
+        )
+
+    def should_retry(self, error: BaseException) -> bool:
+        return self.retry_on == "any" or is_retryable(error)
+
+    def backoff_delay(self, retry: int) -> float:
+        """`retry`번째 재시도 전 대기 시간 (초)"""
+        if self.backoff == "fixed":
+            delay = self.delay
+        elif self.backoff == "linear":
+            delay = self.delay * retry
+        else:
+            delay = self.delay * (2 ** (retry - 1))
+        delay = min(delay, self.max_delay)
+        return random.uniform(0, delay) if self.jitter else delay
+
+
+class RetryBudget:
+    """실행 하나에서 모든 노드가 함께 쓰는 재시도 횟수 한도 (None이면 제한 없음)
+
+    장애 상황에서 여러 노드의 재시도가 겹쳐 API 호출이 폭증하는 것을 막습니다.
+    """
+
+    __slots__ = ("limit", "used")
+
+    def __init__(self, limit: Optional[int] = None):
+        self.limit = limit
+        self.used = 0
+
+    def acquire(self) -> bool:
+        if self.limit is not None and self.used >= self.limit:
+            return False
+        self.used += 1
+        return True
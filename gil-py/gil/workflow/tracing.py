@@ -0,0 +1,255 @@
+"""
+실행 추적 스팬과 노드 지연 시간 히스토그램
+"""
+
+import bisect
+import json
+import os
+import threading
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .events import DEBUG, ExecutionObserver
+
+# 히스토그램 버킷 상한 (초)
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0,
+)
+
+# 노드 스팬의 단계 (실행 순서)
+PHASES = ("queue_wait", "resolve_inputs", "execute", "propagate_outputs")
+
+
+class LatencyHistogram:
+    """고정 버킷 누적 히스토그램 (Prometheus 방식)"""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)  # 마지막은 +Inf
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+
+    def quantile(self, q: float) -> Optional[float]:
+        """버킷 내 선형 보간으로 분위수 추정 (관측값이 없으면 None)"""
+        if self.count == 0:
+            return None
+        rank = q * self.count
+        cumulative = 0
+        for i, count in enumerate(self.counts):
+            if count and cumulative + count >= rank:
+                lower = self.buckets[i - 1] if i > 0 else 0.0
+                if i == len(self.buckets):
+                    return lower
+                return lower + (self.buckets[i] - lower) * (rank - cumulative) / count
+            cumulative += count
+        return self.buckets[-1]
+
+    def cumulative_counts(self) -> List[int]:
+        result, total = [], 0
+        for count in self.counts:
+            total += count
+            result.append(total)
+        return result
+
+
+class MetricsRegistry:
+    """노드 타입/단계별, 워크플로우별 지연 시간 히스토그램과 실패 횟수"""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self.node_latency: Dict[Tuple[str, str], LatencyHistogram] = {}
+        self.node_failures: Dict[str, int] = {}
+        self.run_latency: Dict[Tuple[str, str], LatencyHistogram] = {}
+
+    def _histogram(self, table: Dict[Tuple[str, str], LatencyHistogram], key: Tuple[str, str]) -> LatencyHistogram:
+        histogram = table.get(key)
+        if histogram is None:
+            histogram = table[key] = LatencyHistogram(self.buckets)
+        return histogram
+
+    def observe_node(self, node_type: str, phase: str, seconds: float) -> None:
+        with self._lock:
+            self._histogram(self.node_latency, (node_type, phase)).observe(seconds)
+
+    def count_failure(self, node_type: str) -> None:
+        with self._lock:
+            self.node_failures[node_type] = self.node_failures.get(node_type, 0) + 1
+
+    def observe_run(self, workflow: str, status: str, seconds: float) -> None:
+        with self._lock:
+            self._histogram(self.run_latency, (workflow, status)).observe(seconds)
+
+    def summary(self, quantiles: Sequence[float] = (0.5, 0.9, 0.99)) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """노드 타입별 단계 지연 시간 요약 (초): `{node_type: {phase: {count, sum, p50, ...}}}`"""
+        with self._lock:
+            result: Dict[str, Dict[str, Dict[str, Any]]] = {}
+            for (node_type, phase), histogram in self.node_latency.items():
+                stats: Dict[str, Any] = {"count": histogram.count, "sum": histogram.sum}
+                for q in quantiles:
+                    stats[f"p{int(q * 100)}"] = histogram.quantile(q)
+                result.setdefault(node_type, {})[phase] = stats
+            return result
+
+    def reset(self) -> None:
+        with self._lock:
+            self.node_latency.clear()
+            self.node_failures.clear()
+            self.run_latency.clear()
+
+    def to_prometheus(self) -> str:
+        """Prometheus 텍스트 노출 형식"""
+        lines: List[str] = []
+        with self._lock:
+            lines.append("# HELP gil_node_duration_seconds Node latency by node type and phase.")
+            lines.append("# TYPE gil_node_duration_seconds histogram")
+            for (node_type, phase), histogram in sorted(self.node_latency.items()):
+                labels = f'node_type="{_escape(node_type)}",phase="{phase}"'
+                self._histogram_lines(lines, "gil_node_duration_seconds", labels, histogram)
+
+            lines.append("# HELP gil_node_failures_total Failed node executions by node type.")
+            lines.append("# TYPE gil_node_failures_total counter")
+            for node_type, count in sorted(self.node_failures.items()):
+                lines.append(f'gil_node_failures_total{{node_type="{_escape(node_type)}"}} {count}')
+
+            lines.append("# HELP gil_workflow_duration_seconds Workflow run latency by workflow and status.")
+            lines.append("# TYPE gil_workflow_duration_seconds histogram")
+            for (workflow, status), histogram in sorted(self.run_latency.items()):
+                labels = f'workflow="{_escape(workflow)}",status="{status}"'
+                self._histogram_lines(lines, "gil_workflow_duration_seconds", labels, histogram)
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _histogram_lines(lines: List[str], name: str, labels: str, histogram: LatencyHistogram) -> None:
+        cumulative = histogram.cumulative_counts()
+        for bound, count in zip(histogram.buckets, cumulative):
+            lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {count}')
+        lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {cumulative[-1]}')
+        lines.append(f"{name}_sum{{{labels}}} {histogram.sum}")
+        lines.append(f"{name}_count{{{labels}}} {histogram.count}")
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+_default_registry = MetricsRegistry()
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """프로세스 전체에서 공유하는 기본 메트릭 레지스트리"""
+    return _default_registry
+
+
+class OtlpJsonFileExporter:
+    """실행 하나의 스팬을 OTLP/JSON `ExportTraceServiceRequest` 한 줄로 파일에 추가
+
+    OpenTelemetry Collector의 `otlpjsonfile` 수신기 등으로 읽을 수 있는 형식입니다.
+    """
+
+    def __init__(self, path: str, service_name: str = "gil"):
+        self.path = path
+        self.service_name = service_name
+        self._lock = threading.Lock()
+
+    def export(self, spans: List[Dict[str, Any]]) -> None:
+        request = {
+            "resourceSpans": [{
+                "resource": {"attributes": [_attribute("service.name", self.service_name)]},
+                "scopeSpans": [{"scope": {"name": "gil.workflow"}, "spans": spans}],
+            }]
+        }
+        line = json.dumps(request, ensure_ascii=False, separators=(",", ":")) + "\n"
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line)
+
+
+def _attribute(key: str, value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"key": key, "value": {"boolValue": value}}
+    if isinstance(value, int):
+        return {"key": key, "value": {"intValue": str(value)}}
+    if isinstance(value, float):
+        return {"key": key, "value": {"doubleValue": value}}
+    return {"key": key, "value": {"stringValue": str(value)}}
+
+
+def _span(trace_id: str, name: str, start_ns: int, end_ns: int, parent_id: Optional[str] = None,
+          attributes: Optional[Dict[str, Any]] = None, error: Optional[str] = None) -> Dict[str, Any]:
+    span: Dict[str, Any] = {
+        "traceId": trace_id,
+        "spanId": os.urandom(8).hex(),
+        "name": name,
+        "kind": 1,  # SPAN_KIND_INTERNAL
+        "startTimeUnixNano": str(start_ns),
+        "endTimeUnixNano": str(end_ns),
+        "attributes": [_attribute(key, value) for key, value in (attributes or {}).items()],
+        "status": {"code": 2, "message": error} if error is not None else {"code": 1},
+    }
+    if parent_id is not None:
+        span["parentSpanId"] = parent_id
+    return span
+
+
+class TracingObserver(ExecutionObserver):
+    """`node_span`/`run_span` 이벤트로 히스토그램을 갱신하고, 내보내기가 설정되면 스팬을 기록
+
+    노드 스팬은 실행 스팬의 자식이며, 단계(대기/입력 해결/실행/출력 전달)는 노드 스팬의 자식입니다.
+    스팬은 실행이 끝날 때 한 번에 내보냅니다.
+    """
+
+    level = DEBUG
+    event_types = frozenset({"node_span", "run_span"})
+
+    def __init__(self, metrics: Optional[MetricsRegistry] = None, exporter: Optional[OtlpJsonFileExporter] = None):
+        self.metrics = metrics or get_metrics_registry()
+        self.exporter = exporter
+        self._pending: Dict[str, List[Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+
+    def handle(self, event_type: str, data: Dict[str, Any]) -> None:
+        if event_type == "node_span":
+            self._on_node_span(data)
+        elif event_type == "run_span":
+            self._on_run_span(data)
+
+    def _on_node_span(self, data: Dict[str, Any]) -> None:
+        node_type = data["type"]
+        for phase, (start_ns, end_ns) in data["phases"].items():
+            self.metrics.observe_node(node_type, phase, (end_ns - start_ns) / 1e9)
+        self.metrics.observe_node(node_type, "total", (data["end_ns"] - data["start_ns"]) / 1e9)
+        if data["status"] == "error":
+            self.metrics.count_failure(node_type)
+
+        if self.exporter is not None:
+            with self._lock:
+                self._pending.setdefault(data["trace_id"], []).append(data)
+
+    def _on_run_span(self, data: Dict[str, Any]) -> None:
+        self.metrics.observe_run(data["workflow"], data["status"], (data["end_ns"] - data["start_ns"]) / 1e9)
+
+        if self.exporter is None:
+            return
+        with self._lock:
+            node_spans = self._pending.pop(data["trace_id"], [])
+
+        trace_id = data["trace_id"]
+        run_span = _span(trace_id, f"workflow {data['workflow']}", data["start_ns"], data["end_ns"],
+                         attributes={"gil.workflow": data["workflow"], "gil.run_id": data["run_id"]},
+                         error="run failed" if data["status"] == "error" else None)
+        spans = [run_span]
+        for node in node_spans:
+            node_span = _span(trace_id, f"node {node['node']}", node["start_ns"], node["end_ns"], parent_id=run_span["spanId"],
+                              attributes={"gil.node": node["node"], "gil.node_type": node["type"], "gil.status": node["status"]},
+                              error=node["error"] if node["status"] == "error" else None)
+            spans.append(node_span)
+            for phase in PHASES:
+                if phase in node["phases"]:
+                    start_ns, end_ns = node["phases"][phase]
+                    spans.append(_span(trace_id, phase, start_ns, end_ns, parent_id=node_span["spanId"]))
+        self.exporter.export(spans)
@@ -0,0 +1,106 @@
+"""
+동기 노드 실행용 워커 풀
+"""
+
+import asyncio
+import contextvars
+import functools
+import inspect
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, Any, Optional, Type
+
+from ..core.node import Node
+from ..core.context import Context
+
+# 실행 방식
+ASYNC = "async"
+THREAD = "thread"
+PROCESS = "process"
+
+_execution_modes: Dict[Type[Node], str] = {}
+_thread_pool: Optional[ThreadPoolExecutor] = None
+_process_pool: Optional[ProcessPoolExecutor] = None
+_max_threads: Optional[int] = None
+_max_processes: Optional[int] = None
+
+
+def execution_mode(node_class: Type[Node]) -> str:
+    """노드 클래스의 `execute` 실행 방식 판별 (클래스당 한 번)"""
+    mode = _execution_modes.get(node_class)
+    if mode is None:
+        if inspect.iscoroutinefunction(node_class.execute):
+            mode = ASYNC
+        elif getattr(node_class, "cpu_bound", False):
+            mode = PROCESS
+        else:
+            mode = THREAD
+        _execution_modes[node_class] = mode
+    return mode
+
+
+def configure_worker_pools(max_threads: Optional[int] = None, max_processes: Optional[int] = None) -> None:
+    """워커 풀 크기 설정 (이미 생성된 풀은 종료 후 다음 사용 시 다시 생성)"""
+    global _max_threads, _max_processes
+    _max_threads = max_threads
+    _max_processes = max_processes
+    shutdown_worker_pools(wait=False)
+
+
+def shutdown_worker_pools(wait: bool = True) -> None:
+    """워커 풀 종료"""
+    global _thread_pool, _process_pool
+    if _thread_pool is not None:
+        _thread_pool.shutdown(wait=wait)
+        _thread_pool = None
+    if _process_pool is not None:
+        _process_pool.shutdown(wait=wait)
+        _process_pool = None
+
+
+def _env_int(name: str) -> Optional[int]:
+    value = os.getenv(name)
+    return int(value) if value else None
+
+
+def get_thread_pool() -> ThreadPoolExecutor:
+    """동기 노드용 공유 스레드 풀 (`GIL_MAX_THREADS`로 크기 지정)"""
+    global _thread_pool
+    if _thread_pool is None:
+        max_workers = _max_threads or _env_int("GIL_MAX_THREADS") or min(32, (os.cpu_count() or 1) + 4)
+        _thread_pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="gil-node")
+    return _thread_pool
+
+
+def get_process_pool() -> ProcessPoolExecutor:
+    """CPU 바운드 노드용 공유 프로세스 풀 (`GIL_MAX_PROCESSES`로 크기 지정)"""
+    global _process_pool
+    if _process_pool is None:
+        max_workers = _max_processes or _env_int("GIL_MAX_PROCESSES") or (os.cpu_count() or 1)
+        _process_pool = ProcessPoolExecutor(max_workers=max_workers)
+    return _process_pool
+
+
+def _execute_sync(node: Node, data: Dict[str, Any], context: Context) -> Dict[str, Any]:
+    return node.execute(data, context)  # type: ignore[return-value]
+
+
+async def run_node(node: Node, data: Dict[str, Any], context: Context, mode: Optional[str] = None) -> Dict[str, Any]:
+    """노드 실행: 비동기 노드는 직접 await, 동기 노드는 워커 풀에서 실행
+
+    프로세스 풀에서 실행되는 노드(`cpu_bound = True`)는 노드와 컨텍스트의 복사본으로 실행되므로
+    컨텍스트 변경 사항이 호출자에게 반영되지 않습니다.
+    """
+    mode = mode or execution_mode(type(node))
+    if mode == ASYNC:
+        return await node.execute(data, context)
+
+    loop = asyncio.get_running_loop()
+    pool: Executor
+    if mode == PROCESS:
+        pool = get_process_pool()
+        call = functools.partial(_execute_sync, node, data, context)
+    else:
+        pool = get_thread_pool()
+        call = functools.partial(contextvars.copy_context().run, _execute_sync, node, data, context)
+    return await loop.run_in_executor(pool, call)
@@ -3,46 +3,55 @@
 Gil 워크플로우 클래스
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Union
 from pathlib import Path
 from ..core.node import Node
 from ..core.context import Context
-from ..yaml_parser import YamlWorkflowParser, WorkflowConfig
+from ..yaml_parser import WorkflowConfig
+from .compiler import CompiledWorkflow, WorkflowCompiler
 from .executor import WorkflowExecutor
 from .node_factory import NodeFactory
 
 
 class GilWorkflow:
     """Gil 워크플로우 클래스"""
+
+    # 모든 워크플로우 인스턴스가 공유하는 컴파일 캐시
+    _compiler: Optional[WorkflowCompiler] = None
     
     def __init__(self, name: str = "Gil Workflow"):
         self.name = name
         self.nodes: Dict[str, Node] = {}
         self.connections: List[Dict[str, str]] = []
         self.config: Optional[WorkflowConfig] = None
-        self.executor = WorkflowExecutor(node_factory=NodeFactory())
+        self.compiled: Optional[CompiledWorkflow] = None
+        compiler = self.get_compiler()
+        self.executor = WorkflowExecutor(node_factory=compiler.node_factory, compiler=compiler)
+
+    @classmethod
+    def get_compiler(cls) -> WorkflowCompiler:
+        """공유 워크플로우 컴파일러 조회"""
+        if GilWorkflow._compiler is None:
+            GilWorkflow._compiler = WorkflowCompiler(node_factory=NodeFactory())
+        return GilWorkflow._compiler
     
     @classmethod
     def from_yaml(cls, yaml_path: str | Path) -> 'GilWorkflow':
         """YAML 파일에서 워크플로우 생성"""
-        parser = YamlWorkflowParser()
-        config = parser.parse_file(yaml_path)
-        
-        workflow = cls(name=config.name)
-        workflow.config = config
-        workflow._build_from_config(config)
-        
-        return workflow
+        return cls.from_compiled(cls.get_compiler().compile_file(yaml_path))
     
     @classmethod 
     def from_dict(cls, config_dict: Dict[str, Any]) -> 'GilWorkflow':
         """딕셔너리에서 워크플로우 생성"""
-        parser = YamlWorkflowParser()
-        config = parser.parse_dict(config_dict)
-        
-        workflow = cls(name=config.name)
-        workflow.config = config
-        workflow._build_from_config(config)
+        return cls.from_compiled(cls.get_compiler().compile_dict(config_dict))
+
+    @classmethod
+    def from_compiled(cls, compiled: CompiledWorkflow) -> 'GilWorkflow':
+        """컴파일된 실행 계획에서 워크플로우 생성"""
+        workflow = cls(name=compiled.name)
+        workflow.config = compiled.config
+        workflow.compiled = compiled
+        workflow._build_from_config(compiled.config)
         
         return workflow
     
@@ -63,10 +72,8 @@ class GilWorkflow:
     
     def _build_from_config(self, config: WorkflowConfig) -> None:
         """설정에서 워크플로우 구축"""
-        # 노드 팩토리를 통해 노드 생성
-        from .node_factory import NodeFactory
-        
-        factory = NodeFactory()
+        # 실행 엔진과 같은 노드 팩토리를 통해 노드 생성
+        factory = self.executor.node_factory
         
         # 노드 생성
         for node_name, node_config in config.nodes.items():
@@ -117,8 +124,13 @@ class GilWorkflow:
                 if node_name:
                     prev_nodes = [node_name]
     
-    async def run(self, inputs: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        """워크플로우 실행"""
+    async def run(self, inputs: Optional[Dict[str, Any]] = None, resume: Optional[str] = None,
+                  incremental: Union[bool, str] = False) -> Dict[str, Any]:
+        """워크플로우 실행
+
+        `resume`(이어서 실행할 이전 실행 ID)과 `incremental`(바뀐 노드만 다시 실행)은
+        실행 엔진에 체크포인트 저장소가 필요합니다.
+        """
         if not self.nodes:
             raise ValueError("워크플로우에 노드가 없습니다")
         
@@ -128,25 +140,16 @@ class GilWorkflow:
         if not self.config:
             raise ValueError("워크플로우 설정이 로드되지 않았습니다.")
 
+        if self.compiled is None:
+            self.compiled = self.executor.compiler.compile(self.config)
+
         context = Context({
             "input": inputs,
             "environment": self.config.environment
         })
-            
-        # 노드별 입력 설정 적용
-        for node_name, node_config in self.config.nodes.items():
-            if node_config.inputs and node_name in self.nodes:
-                node_inputs = {}
-                parser = YamlWorkflowParser()
-                
-                for input_name, input_value in node_config.inputs.items():
-                    resolved_value = parser.resolve_references(input_value, context.to_dict())
-                    node_inputs[input_name] = resolved_value
-                
-                inputs[node_name] = node_inputs
         
-        # 워크플로우 실행
-        return await self.executor.execute(self.config, context)
+        # 워크플로우 실행 (노드 입력 참조는 컴파일 시점에 파싱되어 실행 엔진이 해결)
+        return await self.executor.execute(self.compiled, context, resume=resume, incremental=incremental)
     
     def validate(self) -> Dict[str, Any]:
         """워크플로우 유효성 검증"""
@@ -1,12 +1,32 @@
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Union
 from pathlib import Path
 import yaml
 from pydantic import BaseModel, Field
 
+class LimitConfig(BaseModel):
+    # 동시 실행 수 상한
+    concurrency: Optional[int] = Field(default=None, ge=1)
+    # `per`초마다 허용하는 시도 횟수 (토큰 버킷)
+    rate: Optional[float] = Field(default=None, gt=0)
+    per: float = Field(default=1.0, gt=0)
+    # 한 번에 몰아서 허용하는 최대 횟수 (기본값: rate)
+    burst: Optional[float] = Field(default=None, ge=1)
+    # 자동 적용 대상: 노드 타입, 또는 이 타입의 커넥터 출력을 입력으로 받는 노드
+    node_types: List[str] = Field(default_factory=list)
+    connectors: List[str] = Field(default_factory=list)
+
 class NodeConfig(BaseModel):
     type: str
     config: Dict[str, Any] = Field(default_factory=dict)
     inputs: Dict[str, Any] = Field(default_factory=dict)
+    # 결과 캐시: true 또는 {ttl: 만료 시간(ms)}
+    cache: Union[bool, Dict[str, Any]] = False
+    # 재시도: {max_attempts, delay(ms), backoff, max_delay(ms), jitter, retry_on}
+    retry: Optional[Dict[str, Any]] = None
+    # 시도 한 번의 제한 시간 (ms)
+    timeout: Optional[float] = None
+    # 적용할 제한 이름 (`limits`에 정의)
+    limit: Union[str, List[str], None] = None
 
 class WorkflowConfig(BaseModel):
     version: str
@@ -14,6 +34,12 @@ class WorkflowConfig(BaseModel):
     nodes: Dict[str, NodeConfig]
     flow: List[Any]
     environment: Dict[str, Any] = Field(default_factory=dict)
+    # 실행 하나에서 허용하는 전체 재시도 횟수 (None이면 제한 없음)
+    retry_budget: Optional[int] = None
+    # 실행 전체의 제한 시간 (ms)
+    timeout: Optional[float] = None
+    # 이름 있는 동시 실행/호출 빈도 제한 (프로세스 전체에서 공유)
+    limits: Dict[str, LimitConfig] = Field(default_factory=dict)
 
 class YamlWorkflowParser:
     def parse_file(self, yaml_path: str | Path) -> WorkflowConfig:
@@ -0,0 +1,277 @@
+import ast
+import functools
+import re
+import threading
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Iterator, List, Optional
+
+# Functions available inside expressions
+SAFE_FUNCTIONS: Dict[str, Any] = {
+    "abs": abs, "all": all, "any": any, "bool": bool, "dict": dict, "enumerate": enumerate,
+    "float": float, "int": int, "len": len, "list": list, "max": max, "min": min,
+    "round": round, "set": set, "sorted": sorted, "str": str, "sum": sum, "tuple": tuple,
+    "zip": zip, "True": True, "False": False, "None": None,
+}
+
+# Attributes (mostly str/dict/list methods) that expressions may use.
+# `format`/`format_map` are left out on purpose: format strings can reach arbitrary attributes.
+# Padding methods (`zfill`, `ljust`, `rjust`, `center`, `expandtabs`) are left out because a
+# single call can build an arbitrarily long string.
+SAFE_ATTRIBUTES: FrozenSet[str] = frozenset({
+    "get", "keys", "values", "items", "count", "index",
+    "upper", "lower", "strip", "lstrip", "rstrip", "split", "rsplit", "splitlines", "join",
+    "replace", "startswith", "endswith", "find", "rfind", "title", "capitalize", "casefold",
+    "isdigit", "isalpha", "isalnum", "isspace", "real", "imag",
+})
+
+_ALLOWED_NODES = (
+    ast.Expression, ast.BoolOp, ast.BinOp, ast.UnaryOp, ast.Compare, ast.IfExp,
+    ast.Dict, ast.List, ast.Tuple, ast.Set, ast.ListComp, ast.SetComp, ast.DictComp, ast.GeneratorExp,
+    ast.comprehension, ast.Subscript, ast.Slice, ast.Attribute, ast.Name, ast.Constant, ast.Call,
+    ast.keyword, ast.JoinedStr, ast.FormattedValue, ast.Starred,
+    ast.Load, ast.Store,
+    ast.And, ast.Or, ast.Not, ast.Invert, ast.UAdd, ast.USub,
+    ast.Add, ast.Sub, ast.Mult, ast.Div, ast.FloorDiv, ast.Mod, ast.Pow,
+    ast.Eq, ast.NotEq, ast.Lt, ast.LtE, ast.Gt, ast.GtE, ast.In, ast.NotIn, ast.Is, ast.IsNot,
+)
+
+# Upper bounds that keep a single expression from exhausting memory or CPU
+MAX_EXPONENT = 10_000
+# Size in bits of an integer built by `**` or `*`
+MAX_INTEGER_BITS = 1_000_000
+# Total length of the strings and sequences built by one evaluation through `*`, `+`, `%`,
+# f-strings, `join` and `replace`
+MAX_SEQUENCE_LENGTH = 10_000_000
+# Comprehension iterations in one evaluation, nested loops included
+MAX_ITERATIONS = 1_000_000
+# Width and precision in f-string format specs and %-formatting
+MAX_FORMAT_WIDTH = 10_000
+
+_FORMAT_NUMBER = re.compile(r"\d+")
+_PERCENT_SPEC = re.compile(r"%(?:\([^)]*\))?[-#0 +]*(\*|\d+)?(?:\.(\*|\d+))?")
+
+
+class ExpressionError(ValueError):
+    """Raised for expressions that are invalid or use something outside the allowed subset."""
+
+
+class _Budget(threading.local):
+    """Work done by the evaluation running on this thread (reset at the start of every call)."""
+
+    def __init__(self) -> None:
+        self.size = 0
+        self.iterations = 0
+
+
+_budget = _Budget()
+
+
+def _charge(size: int, what: str) -> None:
+    _budget.size += size
+    if _budget.size > MAX_SEQUENCE_LENGTH:
+        raise ExpressionError(f"{what} would be too long")
+
+
+def _check_width(number: str) -> None:
+    if len(number) > 9 or int(number) > MAX_FORMAT_WIDTH:
+        raise ExpressionError(f"Format width or precision {number} is too large")
+
+
+def _check_bits(bits: int, what: str) -> None:
+    if bits > MAX_INTEGER_BITS:
+        raise ExpressionError(f"{what} would be too large")
+
+
+def _safe_pow(base: Any, exponent: Any) -> Any:
+    if isinstance(exponent, (int, float)) and abs(exponent) > MAX_EXPONENT:
+        raise ExpressionError(f"Exponent {exponent} is too large")
+    if isinstance(base, int) and isinstance(exponent, int) and exponent > 0:
+        _check_bits(base.bit_length() * exponent, "Power")
+    return base ** exponent
+
+
+def _safe_mult(left: Any, right: Any) -> Any:
+    if isinstance(left, int) and isinstance(right, int):
+        _check_bits(left.bit_length() + right.bit_length(), "Product")
+    for sequence, count in ((left, right), (right, left)):
+        if isinstance(sequence, (str, bytes, list, tuple)) and isinstance(count, int):
+            _charge(len(sequence) * max(count, 0), "Repeated sequence")
+    return left * right
+
+
+def _safe_add(left: Any, right: Any) -> Any:
+    if isinstance(left, (str, bytes, list, tuple)) and isinstance(right, (str, bytes, list, tuple)):
+        _charge(len(left) + len(right), "Concatenated sequence")
+    return left + right
+
+
+def _safe_mod(left: Any, right: Any) -> Any:
+    if isinstance(left, (str, bytes)):
+        pattern = left if isinstance(left, str) else left.decode("latin-1")
+        for match in _PERCENT_SPEC.finditer(pattern):
+            for number in match.groups():
+                if number == "*":
+                    raise ExpressionError("'*' widths are not allowed in %-formatting")
+                if number:
+                    _check_width(number)
+        result = left % right
+        _charge(len(result), "Formatted string")
+        return result
+    return left % right
+
+
+def _safe_format(value: Any, conversion: int, spec: str) -> str:
+    if conversion == ord("r"):
+        value = repr(value)
+    elif conversion == ord("s"):
+        value = str(value)
+    elif conversion == ord("a"):
+        value = ascii(value)
+    for number in _FORMAT_NUMBER.findall(spec):
+        _check_width(number)
+    text = format(value, spec)
+    _charge(len(text), "Formatted string")
+    return text
+
+
+def _safe_method(obj: Any, name: str, *args: Any, **kwargs: Any) -> Any:
+    """`join`/`replace` with the length of the result charged before it is built."""
+    if isinstance(obj, (str, bytes)) and name == "join" and args:
+        items = list(args[0])
+        args = (items,) + args[1:]
+        size = sum(len(item) for item in items if isinstance(item, (str, bytes)))
+        _charge(size + len(obj) * max(len(items) - 1, 0), "Joined string")
+    elif isinstance(obj, (str, bytes)) and name == "replace" and len(args) >= 2:
+        old, new = args[0], args[1]
+        count = args[2] if len(args) > 2 else kwargs.get("count", -1)
+        if isinstance(old, (str, bytes)) and isinstance(new, (str, bytes)):
+            occurrences = len(obj) + 1 if not old else obj.count(old)
+            if isinstance(count, int) and count >= 0:
+                occurrences = min(occurrences, count)
+            _charge(len(obj) + occurrences * max(len(new) - len(old), 0), "Replaced string")
+    return getattr(obj, name)(*args, **kwargs)
+
+
+def _bounded_iter(iterable: Iterable[Any]) -> Iterator[Any]:
+    budget = _budget
+    for item in iterable:
+        budget.iterations += 1
+        if budget.iterations > MAX_ITERATIONS:
+            raise ExpressionError(f"Comprehensions ran more than {MAX_ITERATIONS} iterations")
+        yield item
+
+
+def _safe_sum(iterable: Iterable[Any], start: Any = 0) -> Any:
+    # Adding up lists or tuples with a `start` value copies the result on every step
+    if not isinstance(start, (int, float)):
+        raise ExpressionError("sum() only adds numbers")
+    return sum(iterable, start)
+
+
+# Helpers are bound under names that are not identifiers, so expressions cannot refer to or rebind them
+_HELPERS = {
+    "gil:pow": _safe_pow, "gil:mult": _safe_mult, "gil:add": _safe_add, "gil:mod": _safe_mod,
+    "gil:format": _safe_format, "gil:method": _safe_method, "gil:iter": _bounded_iter,
+}
+
+# Methods whose result can be much longer than the object they are called on
+_GUARDED_METHODS = frozenset({"join", "replace"})
+
+
+class _Validator(ast.NodeVisitor):
+    """Rejects any syntax, name or attribute outside the expression subset."""
+
+    def __init__(self, parameters: FrozenSet[str]):
+        self.names = set(parameters) | set(SAFE_FUNCTIONS)
+
+    def generic_visit(self, node: ast.AST) -> None:
+        if not isinstance(node, _ALLOWED_NODES):
+            raise ExpressionError(f"'{type(node).__name__}' is not allowed in expressions")
+        super().generic_visit(node)
+
+    def _visit_comprehension(self, node: ast.AST) -> None:
+        # Names bound by `for` targets become available inside the comprehension (the targets
+        # themselves are checked by visit_Name, so they cannot take reserved names)
+        for generator in node.generators:  # type: ignore[attr-defined]
+            for target in ast.walk(generator.target):
+                if isinstance(target, ast.Name):
+                    self.names.add(target.id)
+        self.generic_visit(node)
+
+    visit_ListComp = visit_SetComp = visit_DictComp = visit_GeneratorExp = _visit_comprehension
+
+    def visit_Name(self, node: ast.Name) -> None:
+        if node.id.startswith(("_gil", "__")):
+            raise ExpressionError(f"Name '{node.id}' is reserved")
+        if node.id not in self.names:
+            raise ExpressionError(f"Unknown name '{node.id}'")
+
+    def visit_Attribute(self, node: ast.Attribute) -> None:
+        if node.attr not in SAFE_ATTRIBUTES:
+            raise ExpressionError(f"Attribute '{node.attr}' is not allowed in expressions")
+        self.generic_visit(node)
+
+
+def _helper_call(helper: str, args: List[ast.expr], node: ast.AST, keywords: Optional[List[ast.keyword]] = None) -> ast.Call:
+    return ast.copy_location(ast.Call(func=ast.Name(id=helper, ctx=ast.Load()), args=args, keywords=keywords or []), node)
+
+
+class _Guard(ast.NodeTransformer):
+    """Routes operations that can build large results or loop for long through bounding helpers."""
+
+    def visit_BinOp(self, node: ast.BinOp) -> ast.AST:
+        self.generic_visit(node)
+        helper = {ast.Pow: "gil:pow", ast.Mult: "gil:mult", ast.Add: "gil:add", ast.Mod: "gil:mod"}.get(type(node.op))
+        if helper is None:
+            return node
+        return _helper_call(helper, [node.left, node.right], node)
+
+    def visit_FormattedValue(self, node: ast.FormattedValue) -> ast.AST:
+        self.generic_visit(node)
+        spec = node.format_spec if node.format_spec is not None else ast.Constant(value="")
+        value = _helper_call("gil:format", [node.value, ast.Constant(value=node.conversion), spec], node)
+        return ast.copy_location(ast.FormattedValue(value=value, conversion=-1, format_spec=None), node)
+
+    def visit_Call(self, node: ast.Call) -> ast.AST:
+        self.generic_visit(node)
+        if isinstance(node.func, ast.Attribute) and node.func.attr in _GUARDED_METHODS:
+            args = [node.func.value, ast.Constant(value=node.func.attr), *node.args]
+            return _helper_call("gil:method", args, node, node.keywords)
+        return node
+
+    def visit_comprehension(self, node: ast.comprehension) -> ast.AST:
+        self.generic_visit(node)
+        node.iter = _helper_call("gil:iter", [node.iter], node.iter)
+        return node
+
+
+@functools.lru_cache(maxsize=256)
+def compile_expression(source: str, parameters: FrozenSet[str] = frozenset({"data"})) -> Callable[..., Any]:
+    """
+    Compiles an expression over `parameters` into a function taking them as keyword arguments.
+    The expression is a restricted Python subset: literals, operators, comparisons, conditional
+    expressions, comprehensions, subscripts, f-strings, SAFE_FUNCTIONS and SAFE_ATTRIBUTES.
+    Compiled functions are cached by source, so nodes with the same expression share one.
+    Each call may build at most MAX_SEQUENCE_LENGTH items of strings and sequences and run at
+    most MAX_ITERATIONS comprehension iterations; going over raises ExpressionError.
+    """
+    try:
+        tree = ast.parse(source.strip(), mode="eval")
+    except SyntaxError as e:
+        raise ExpressionError(f"Invalid expression '{source}': {e.msg}") from e
+    _Validator(parameters).visit(tree)
+
+    body = _Guard().visit(tree).body
+    arguments = ast.arguments(
+        posonlyargs=[], args=[], vararg=None, kwonlyargs=[ast.arg(arg=name) for name in sorted(parameters)],
+        kw_defaults=[None] * len(parameters), kwarg=None, defaults=[],
+    )
+    function = ast.Expression(body=ast.Lambda(args=arguments, body=body))
+    ast.fix_missing_locations(function)
+    code = compile(function, "<expression>", "eval")
+    evaluate = eval(code, {"__builtins__": {}, **SAFE_FUNCTIONS, "sum": _safe_sum, **_HELPERS})
+
+    def bounded(**kwargs: Any) -> Any:
+        _budget.size = _budget.iterations = 0
+        return evaluate(**kwargs)
+
+    return bounded
@@ -0,0 +1,263 @@
+import asyncio
+import codecs
+import mmap
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, AsyncIterator, Callable, Optional, TypeVar, Union
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+DEFAULT_PREFETCH = 2
+DETECTION_SAMPLE_SIZE = 64 * 1024
+
+T = TypeVar("T")
+
+_io_pool: Optional[ThreadPoolExecutor] = None
+
+
+def get_io_pool() -> ThreadPoolExecutor:
+    """
+    Thread pool for blocking file calls (`GIL_IO_THREADS` sets its size). Kept apart from the
+    node worker pool so slow disks cannot starve other nodes of threads, and vice versa.
+    """
+    global _io_pool
+    if _io_pool is None:
+        max_workers = int(os.getenv("GIL_IO_THREADS") or 8)
+        _io_pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="gil-data-io")
+    return _io_pool
+
+
+def shutdown_io_pool(wait: bool = True) -> None:
+    global _io_pool
+    if _io_pool is not None:
+        _io_pool.shutdown(wait=wait)
+        _io_pool = None
+
+
+async def run_io(func: Callable[..., T], *args: Any) -> T:
+    """Runs a blocking file call on the I/O pool without blocking the event loop."""
+    return await asyncio.wrap_future(get_io_pool().submit(func, *args))
+
+# Checked in order: the UTF-32 LE mark starts with the UTF-16 LE mark
+_BOMS = (
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+
+
+def detect_encoding(sample: bytes) -> str:
+    """
+    Guesses the text encoding of a file from its first bytes: a byte order mark, then
+    UTF-8, then charset-normalizer or chardet when installed, and finally latin-1.
+    """
+    for bom, encoding in _BOMS:
+        if sample.startswith(bom):
+            return encoding
+    try:
+        sample.decode("utf-8")
+        return "utf-8"
+    except UnicodeDecodeError as e:
+        # The sample may end in the middle of a multi-byte character
+        if e.start >= len(sample) - 3 and e.reason == "unexpected end of data":
+            return "utf-8"
+
+    try:
+        from charset_normalizer import from_bytes
+        best = from_bytes(sample).best()
+        if best is not None:
+            return best.encoding
+    except ImportError:
+        try:
+            import chardet
+            guess = chardet.detect(sample).get("encoding")
+            if guess:
+                return guess
+        except ImportError:
+            pass
+    return "latin-1"
+
+
+def read_sample(path: str, offset: int = 0, size: int = DETECTION_SAMPLE_SIZE) -> bytes:
+    with open(path, "rb") as f:
+        f.seek(offset)
+        return f.read(size)
+
+
+def resolve_encoding(path: str, encoding: Optional[str], offset: int = 0) -> Optional[str]:
+    """Returns the encoding to decode with; `auto` detects it from the file, None means raw bytes."""
+    if encoding == "auto":
+        return detect_encoding(read_sample(path, offset))
+    return encoding
+
+
+def read_range(path: str, offset: int = 0, length: Optional[int] = None) -> bytes:
+    """Reads `length` bytes (or up to the end of the file) starting at `offset`."""
+    with open(path, "rb") as f:
+        f.seek(offset)
+        return f.read() if length is None else f.read(length)
+
+
+def map_file(path: str, offset: int = 0, length: Optional[int] = None) -> memoryview:
+    """
+    Memory-maps a byte range of the file read-only. Pages are loaded on access, so
+    slicing a large file does not read it into memory. The map stays open as long as
+    the returned view (or a slice of it) is referenced.
+    """
+    size = os.path.getsize(path)
+    end = size if length is None else min(size, offset + length)
+    if end <= offset:
+        return memoryview(b"")
+    # mmap offsets must be aligned to the allocation granularity
+    aligned = offset - offset % mmap.ALLOCATIONGRANULARITY
+    with open(path, "rb") as f:
+        mapped = mmap.mmap(f.fileno(), end - aligned, offset=aligned, access=mmap.ACCESS_READ)
+    return memoryview(mapped)[offset - aligned:]
+
+
+class FileChunks:
+    """
+    Lazily reads a file (or a byte range of it) as an async iterable of chunks or lines,
+    holding at most `prefetch` chunks in memory. Reads run on the I/O pool and the next
+    `prefetch` chunks are read ahead while the consumer works on the current one. Each
+    `async for` reads the file again from the start of the range, so several downstream
+    nodes can consume the same output.
+
+    - mode `chunks`: pieces of about `chunk_size` bytes (decoded to str when `encoding` is set)
+    - mode `lines`: lines without their line terminator (str, or bytes without `encoding`)
+    """
+
+    def __init__(
+        self,
+        path: str,
+        mode: str = "chunks",
+        encoding: Optional[str] = None,
+        errors: str = "strict",
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        offset: int = 0,
+        length: Optional[int] = None,
+        prefetch: int = DEFAULT_PREFETCH,
+    ):
+        if mode not in ("chunks", "lines"):
+            raise ValueError(f"Unsupported FileChunks mode: '{mode}'")
+        if prefetch < 0:
+            raise ValueError("prefetch must not be negative")
+        self.path = path
+        self.mode = mode
+        self.encoding = encoding
+        self.errors = errors
+        self.chunk_size = chunk_size
+        self.offset = offset
+        self.length = length
+        self.prefetch = prefetch
+
+    def __repr__(self) -> str:
+        return f"FileChunks(path={self.path!r}, mode={self.mode!r}, offset={self.offset}, length={self.length})"
+
+    def __aiter__(self) -> AsyncIterator[Union[str, bytes]]:
+        if self.mode == "lines":
+            return self._lines()
+        return self._chunks()
+
+    def _read_sizes(self):
+        remaining = self.length
+        while remaining is None or remaining > 0:
+            size = self.chunk_size if remaining is None else min(self.chunk_size, remaining)
+            if remaining is not None:
+                remaining -= size
+            yield size
+
+    async def _raw_chunks(self) -> AsyncIterator[bytes]:
+        f = await run_io(open, self.path, "rb")
+        # The read still running in the pool, if any; the file is closed once it completes
+        in_flight: Optional[Future] = None
+        try:
+            await run_io(f.seek, self.offset)
+            if self.prefetch == 0:
+                for size in self._read_sizes():
+                    in_flight = get_io_pool().submit(f.read, size)
+                    chunk = await asyncio.wrap_future(in_flight)
+                    if not chunk:
+                        break
+                    yield chunk
+                return
+
+            # Read ahead: a reader task keeps up to `prefetch` chunks queued
+            queue: asyncio.Queue = asyncio.Queue(maxsize=self.prefetch)
+
+            async def read_ahead() -> None:
+                nonlocal in_flight
+                try:
+                    for size in self._read_sizes():
+                        in_flight = get_io_pool().submit(f.read, size)
+                        chunk = await asyncio.wrap_future(in_flight)
+                        if not chunk:
+                            break
+                        await queue.put(chunk)
+                except Exception as e:
+                    await queue.put(e)
+                    return
+                await queue.put(None)
+
+            reader = asyncio.ensure_future(read_ahead())
+            try:
+                while True:
+                    item = await queue.get()
+                    if item is None:
+                        break
+                    if isinstance(item, Exception):
+                        raise item
+                    yield item
+            finally:
+                reader.cancel()
+                await asyncio.gather(reader, return_exceptions=True)
+        finally:
+            if in_flight is not None and not in_flight.done():
+                in_flight.add_done_callback(lambda _: f.close())
+            else:
+                f.close()
+
+    async def _chunks(self) -> AsyncIterator[Union[str, bytes]]:
+        raw = self._raw_chunks()
+        try:
+            if self.encoding is None:
+                async for chunk in raw:
+                    yield chunk
+                return
+            decoder = codecs.getincrementaldecoder(self.encoding)(self.errors)
+            async for chunk in raw:
+                text = decoder.decode(chunk)
+                if text:
+                    yield text
+            text = decoder.decode(b"", final=True)
+            if text:
+                yield text
+        finally:
+            # Stop the read-ahead right away when the consumer leaves the loop early
+            await raw.aclose()
+
+    async def _lines(self) -> AsyncIterator[Any]:
+        text = self.encoding is not None
+        newline: Any = "\n" if text else b"\n"
+        carriage_return: Any = "\r" if text else b"\r"
+        empty = newline[:0]
+        # Pieces of a line that spans several chunks
+        pending: list = []
+        chunks = self._chunks()
+        try:
+            async for chunk in chunks:
+                parts = chunk.split(newline)
+                if len(parts) == 1:
+                    pending.append(chunk)
+                    continue
+                parts[0] = empty.join(pending) + parts[0]
+                last = parts.pop()
+                pending = [last] if last else []
+                for line in parts:
+                    yield line[:-1] if line.endswith(carriage_return) else line
+        finally:
+            await chunks.aclose()
+        if pending:
+            line = empty.join(pending)
+            yield line[:-1] if line.endswith(carriage_return) else line
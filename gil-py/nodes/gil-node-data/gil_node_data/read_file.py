@@ -1,29 +1,72 @@
+import os
+from typing import Optional
+
 from gil_py.core.node import Node
-from gil_py.core.port import Port
+from gil_py.core.port import InputPort, OutputPort
 from gil_py.core.data_types import DataType
+from gil_py.core.context import Context
+from .files import DEFAULT_CHUNK_SIZE, DEFAULT_PREFETCH, FileChunks, map_file, read_range, resolve_encoding, run_io
+
+READ_MODES = ("text", "binary", "lines", "chunks", "mmap")
+
 
 class DataReadFileNode(Node):
     """
     Reads content from a specified file path.
-    Currently supports reading text files.
+    The `mode` config selects how the content is produced:
+    - `text` (default): the whole file (or byte range) decoded to a string
+    - `binary`: the whole file (or byte range) as bytes
+    - `lines` / `chunks`: a FileChunks async iterable that reads lazily in constant memory
+    - `mmap`: a read-only memory-mapped view of the file (or byte range)
+    `encoding` may be `auto` to detect it from the file; `offset`/`length` select a byte range.
+    Blocking file calls run on the data I/O pool, so reads overlap with other nodes in the run.
     """
 
-    def __init__(self, node_id: str, node_config: dict):
-        super().__init__(node_id, node_config)
-
-        self.add_input_port(Port(
+    input_port_schema = (
+        InputPort(
             name="file_path",
             data_type=DataType.TEXT,
             description="The absolute path to the file to read.",
             required=True
-        ))
-        self.add_output_port(Port(
+        ),
+        InputPort(
+            name="offset",
+            data_type=DataType.NUMBER,
+            description="Byte offset to start reading at (overrides the config).",
+            required=False
+        ),
+        InputPort(
+            name="length",
+            data_type=DataType.NUMBER,
+            description="Number of bytes to read (overrides the config; default: to the end of the file).",
+            required=False
+        ),
+    )
+    output_port_schema = (
+        OutputPort(
             name="content",
+            data_type=DataType.ANY,
+            description="The content read from the file (text, bytes, a FileChunks iterable or a memory map, per `mode`)."
+        ),
+        OutputPort(
+            name="encoding",
             data_type=DataType.TEXT,
-            description="The content read from the file."
-        ))
+            description="The encoding used to decode the content (None for bytes)."
+        ),
+    )
+
+    def __init__(self, node_id: str, node_config: dict):
+        super().__init__(node_id=node_id, node_config=node_config)
 
-    def execute(self, data: dict) -> dict:
+        self.mode = self.node_config.get("mode", "text")
+        if self.mode not in READ_MODES:
+            raise ValueError(f"Unsupported mode '{self.mode}' in config for {self.node_id} ({', '.join(READ_MODES)})")
+
+        # The declared `content` type is ANY; narrow it for the configured mode
+        content_type = DataType.TEXT if self.mode == "text" else DataType.BINARY if self.mode in ("binary", "mmap") else DataType.ANY
+        self.get_output_port("content").data_type = content_type.value
+
+    async def execute(self, data: dict, context: Context) -> dict:
         """
         Reads the file content and returns it.
         """
@@ -32,11 +75,44 @@ class DataReadFileNode(Node):
         if not file_path:
             raise ValueError("File path is not provided.")
 
+        offset = data.get("offset")
+        offset = int(offset if offset is not None else self.node_config.get("offset", 0))
+        length = data.get("length")
+        length = length if length is not None else self.node_config.get("length")
+        length = int(length) if length is not None else None
+
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            return {"content": content}
+            return await run_io(self._read, file_path, offset, length)
         except FileNotFoundError:
             raise FileNotFoundError(f"File not found at: {file_path}")
         except Exception as e:
             raise RuntimeError(f"Failed to read file {file_path}: {e}") from e
+
+    def _read(self, file_path: str, offset: int, length: Optional[int]) -> dict:
+        """The blocking part of `execute`, run on the I/O pool."""
+        if not os.path.isfile(file_path):
+            raise FileNotFoundError(file_path)
+
+        if self.mode == "binary":
+            return {"content": read_range(file_path, offset, length), "encoding": None}
+        if self.mode == "mmap":
+            return {"content": map_file(file_path, offset, length), "encoding": None}
+
+        default_encoding = "utf-8" if self.mode == "text" else None
+        encoding = resolve_encoding(file_path, self.node_config.get("encoding", default_encoding), offset)
+        errors = self.node_config.get("errors", "strict")
+        if self.mode == "text":
+            content = read_range(file_path, offset, length).decode(encoding, errors)
+            return {"content": content, "encoding": encoding}
+
+        chunks = FileChunks(
+            file_path,
+            mode=self.mode,
+            encoding=encoding,
+            errors=errors,
+            chunk_size=int(self.node_config.get("chunk_size", DEFAULT_CHUNK_SIZE)),
+            offset=offset,
+            length=length,
+            prefetch=int(self.node_config.get("prefetch", DEFAULT_PREFETCH)),
+        )
+        return {"content": chunks, "encoding": encoding}
@@ -1,42 +1,78 @@
 from gil_py.core.node import Node
-from gil_py.core.port import Port
+from gil_py.core.port import InputPort, OutputPort
 from gil_py.core.data_types import DataType
+from gil_py.core.context import Context
+from .expressions import ExpressionError, compile_expression
+
+RECORD_PARAMETERS = frozenset({"data", "index"})
+
 
 class DataTransformNode(Node):
     """
     Transforms input data using a specified transformation logic.
     The transformation logic can be defined in the node's configuration.
+    `transform_expression` is a sandboxed expression (see gil_node_data.expressions)
+    compiled once when the node is created. With `for_each: true`, the input must be a
+    list and the expression is applied to every element (`data` is the element, `index`
+    its position); an optional `where` expression keeps only the matching elements.
     """
 
-    def __init__(self, node_id: str, node_config: dict):
-        super().__init__(node_id, node_config)
-
-        self.transform_expression = self.node_config.get("transform_expression")
-        if not self.transform_expression:
-            raise ValueError(f"Missing 'transform_expression' in config for {self.node_id}")
-
-        self.add_input_port(Port(
+    input_port_schema = (
+        InputPort(
             name="input_data",
             data_type=DataType.ANY,
             description="The data to be transformed.",
             required=True
-        ))
-        self.add_output_port(Port(
+        ),
+    )
+    output_port_schema = (
+        OutputPort(
             name="output_data",
             data_type=DataType.ANY,
             description="The transformed data."
-        ))
+        ),
+    )
+
+    def __init__(self, node_id: str, node_config: dict):
+        super().__init__(node_id=node_id, node_config=node_config)
+
+        self.transform_expression = self.node_config.get("transform_expression")
+        if not self.transform_expression:
+            raise ValueError(f"Missing 'transform_expression' in config for {self.node_id}")
+
+        self.for_each = bool(self.node_config.get("for_each", False))
+        self.where_expression = self.node_config.get("where")
+        if self.where_expression and not self.for_each:
+            raise ValueError(f"'where' requires 'for_each: true' in config for {self.node_id}")
+
+        parameters = RECORD_PARAMETERS if self.for_each else frozenset({"data"})
+        try:
+            self._transform = compile_expression(self.transform_expression, parameters)
+            self._where = compile_expression(self.where_expression, parameters) if self.where_expression else None
+        except ExpressionError as e:
+            raise ValueError(f"Invalid expression in config for {self.node_id}: {e}") from e
 
-    def execute(self, data: dict) -> dict:
+    def execute(self, data: dict, context: Context) -> dict:
         """
         Applies the transformation expression to the input data.
         """
         input_data = data.get("input_data")
 
         try:
-            # For simplicity, we'll use eval. In a real scenario, consider safer alternatives
-            # like a sandboxed environment or a dedicated transformation engine.
-            transformed_data = eval(self.transform_expression, {'data': input_data})
+            if not self.for_each:
+                transformed_data = self._transform(data=input_data)
+            else:
+                if not isinstance(input_data, (list, tuple)):
+                    raise TypeError(f"'for_each' expects a list, got {type(input_data).__name__}")
+                transform, where = self._transform, self._where
+                if where is None:
+                    transformed_data = [transform(data=record, index=i) for i, record in enumerate(input_data)]
+                else:
+                    transformed_data = [
+                        transform(data=record, index=i)
+                        for i, record in enumerate(input_data)
+                        if where(data=record, index=i)
+                    ]
             return {"output_data": transformed_data}
         except Exception as e:
             raise RuntimeError(f"Failed to transform data with expression '{self.transform_expression}': {e}") from e
@@ -0,0 +1,113 @@
+
+import asyncio
+import importlib.util
+import weakref
+from typing import Any, Dict, Optional, Tuple
+
+import httpx
+from openai import AsyncOpenAI
+
+# Default settings for the shared HTTP connection pool.
+DEFAULT_POOL_CONFIG: Dict[str, Any] = {
+    "max_connections": 100,
+    "max_keepalive_connections": 20,
+    "keepalive_expiry": 30.0,
+    "http2": False,
+    "timeout": 600.0,
+}
+
+PoolKey = Tuple[int, int, float, bool, float]
+ClientKey = Tuple[Optional[str], Optional[str], Optional[str], PoolKey]
+
+# httpx connections belong to the event loop that opened them, so pools are
+# shared per loop. `None` holds clients created outside of a running loop.
+_http_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[PoolKey, httpx.AsyncClient]]" = weakref.WeakKeyDictionary()
+_openai_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[ClientKey, AsyncOpenAI]]" = weakref.WeakKeyDictionary()
+_loopless_http_clients: Dict[PoolKey, httpx.AsyncClient] = {}
+_loopless_openai_clients: Dict[ClientKey, AsyncOpenAI] = {}
+
+
+def _current_loop() -> Optional[asyncio.AbstractEventLoop]:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+def _registry(registries: "weakref.WeakKeyDictionary", loopless: Dict) -> Dict:
+    loop = _current_loop()
+    if loop is None:
+        return loopless
+    registry = registries.get(loop)
+    if registry is None:
+        registry = registries[loop] = {}
+    return registry
+
+
+def _pool_key(pool_config: Optional[Dict[str, Any]]) -> PoolKey:
+    config = {**DEFAULT_POOL_CONFIG, **(pool_config or {})}
+    http2 = bool(config["http2"])
+    if http2 and importlib.util.find_spec("h2") is None:
+        print("Warning: HTTP/2 requested for the OpenAI connection pool but the 'h2' package is not installed. Falling back to HTTP/1.1.")
+        http2 = False
+    return (
+        int(config["max_connections"]),
+        int(config["max_keepalive_connections"]),
+        float(config["keepalive_expiry"]),
+        http2,
+        float(config["timeout"]),
+    )
+
+
+def get_http_client(pool_config: Optional[Dict[str, Any]] = None) -> httpx.AsyncClient:
+    """Returns the process-wide httpx client for the given pool settings."""
+    key = _pool_key(pool_config)
+    clients = _registry(_http_clients, _loopless_http_clients)
+    client = clients.get(key)
+    if client is None or client.is_closed:
+        max_connections, max_keepalive, keepalive_expiry, http2, timeout = key
+        client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive,
+                keepalive_expiry=keepalive_expiry,
+            ),
+            timeout=httpx.Timeout(timeout, connect=min(timeout, 5.0)),
+            http2=http2,
+        )
+        clients[key] = client
+    return client
+
+
+def get_async_client(
+    api_key: str,
+    organization: Optional[str] = None,
+    base_url: Optional[str] = None,
+    pool_config: Optional[Dict[str, Any]] = None,
+) -> AsyncOpenAI:
+    """
+    Returns a shared AsyncOpenAI client for the given credentials.
+    Clients with the same credentials and pool settings are reused across nodes, runs and requests.
+    """
+    pool_key = _pool_key(pool_config)
+    key: ClientKey = (api_key, organization, base_url, pool_key)
+    clients = _registry(_openai_clients, _loopless_openai_clients)
+    client = clients.get(key)
+    if client is None or client.is_closed():
+        client = AsyncOpenAI(
+            api_key=api_key,
+            organization=organization,
+            base_url=base_url,
+            http_client=get_http_client(pool_config),
+        )
+        clients[key] = client
+    return client
+
+
+async def close_shared_clients() -> None:
+    """Closes every pooled HTTP client owned by the running event loop (e.g. on server shutdown)."""
+    clients = _registry(_http_clients, _loopless_http_clients)
+    for client in list(clients.values()):
+        await client.aclose()
+    clients.clear()
+    _registry(_openai_clients, _loopless_openai_clients).clear()
@@ -1,52 +1,70 @@
 
 import os
-from openai import OpenAI
 from gil_py.core.node import Node
-from gil_py.core.port import Port
+from gil_py.core.port import OutputPort
 from gil_py.core.data_types import DataType
+from gil_py.core.context import Context
+from .client_pool import get_async_client
 
 class OpenAIConnectorNode(Node):
     """
     Manages the connection and authentication with the OpenAI API.
-    It initializes the OpenAI client and provides it through an output port.
+    It provides an AsyncOpenAI client through an output port. Clients share a
+    process-wide HTTP connection pool, configurable through the `pool` config.
+    The API key is checked on creation; the client is acquired once in `setup()`,
+    so pooled instances reuse it across runs. `teardown()` only releases this node's
+    reference, since other nodes may share the client; `close_shared_clients()` closes
+    the pooled connections themselves (e.g. on server shutdown).
     """
 
+    output_port_schema = (
+        OutputPort(
+            name="client",
+            data_type=DataType.ANY,
+            description="The initialized AsyncOpenAI client instance."
+        ),
+    )
+
     def __init__(self, node_id: str, node_config: dict):
-        super().__init__(node_id, node_config)
+        super().__init__(node_id=node_id, node_config=node_config)
         self.client = None
-        
-        # Define ports
-        self.add_output_port(Port(
-            name="client",
-            data_type=DataType.OBJECT,
-            description="The initialized OpenAI client instance."
-        ))
 
-        # Initialize client on creation
-        self._initialize_client()
+        # Fail fast on a missing key; the client itself is created in setup()
+        self.api_key = self._resolve_api_key()
 
-    def _initialize_client(self):
-        """Initializes the OpenAI client using provided config or environment variables."""
+    def _resolve_api_key(self) -> str:
+        """Reads the API key from the config (`${VAR_NAME}` refers to an env var) or OPENAI_API_KEY."""
         api_key = self.node_config.get("api_key")
-        
+
         # If api_key is specified as an env var like ${VAR_NAME}
         if api_key and api_key.startswith("${") and api_key.endswith("}"):
             env_var_name = api_key[2:-1]
             api_key = os.getenv(env_var_name)
-        
+
         # Fallback to default environment variable if no key is provided
         if not api_key:
             api_key = os.getenv("OPENAI_API_KEY")
 
         if not api_key:
             raise ValueError(f"API key for {self.node_id} is not found. Please provide it in the node config or set the OPENAI_API_KEY environment variable.")
+        return api_key
 
-        self.client = OpenAI(
-            api_key=api_key,
+    async def setup(self) -> None:
+        """Acquires the shared AsyncOpenAI client (and its HTTP pool) for the running event loop."""
+        self.client = get_async_client(
+            api_key=self.api_key,
             organization=self.node_config.get("organization"),
             base_url=self.node_config.get("base_url"),
+            pool_config=self.node_config.get("pool"),
         )
 
-    def execute(self, data: dict) -> dict:
+    async def teardown(self) -> None:
+        """Releases the shared client; it is reacquired by `setup()` if the node runs again."""
+        self.client = None
+
+    async def execute(self, data: dict, context: Context) -> dict:
         """Provides the initialized client to the output port."""
+        if self.client is None:
+            await self.setup()
+        self.get_output_port("client").set_data(self.client)
         return {"client": self.client}
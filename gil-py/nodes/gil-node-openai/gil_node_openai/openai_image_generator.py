@@ -1,8 +1,10 @@
 
+import inspect
 from gil_py.core.node import Node
 from gil_py.core.port import InputPort, OutputPort
 from gil_py.core.data_types import DataType
 from gil_py.core.context import Context
+from gil_py.core.deadline import remaining_time
 
 class OpenAIGenerateImageNode(Node):
     """
@@ -10,27 +12,27 @@ class OpenAIGenerateImageNode(Node):
     This node requires a connection to an OpenAIConnector.
     """
 
-    def __init__(self, node_id: str, node_config: dict):
-        super().__init__(node_id=node_id, node_config=node_config)
-        
-        # Define ports
-        self.add_input_port(InputPort(
+    input_port_schema = (
+        InputPort(
             name="client",
             data_type=DataType.ANY,
             description="The OpenAI client instance from an OpenAIConnector.",
             required=True
-        ))
-        self.add_input_port(InputPort(
+        ),
+        InputPort(
             name="prompt",
             data_type=DataType.TEXT,
             description="The text prompt to generate the image from.",
             required=True
-        ))
-        self.add_output_port(OutputPort(
+        ),
+    )
+    output_port_schema = (
+        OutputPort(
             name="image_url",
             data_type=DataType.TEXT,
             description="The URL of the generated image."
-        ))
+        ),
+    )
 
     async def execute(self, data: dict, context: Context) -> dict:
         """
@@ -45,13 +47,21 @@ class OpenAIGenerateImageNode(Node):
             raise ValueError("Prompt is not provided.")
 
         try:
-            response = client.images.generate(
-                model=self.node_config.get("model", "dall-e-3"),
-                prompt=prompt,
-                size=self.node_config.get("size", "1024x1024"),
-                quality=self.node_config.get("quality", "standard"),
-                n=1,
-            )
+            request = {
+                "model": self.node_config.get("model", "dall-e-3"),
+                "prompt": prompt,
+                "size": self.node_config.get("size", "1024x1024"),
+                "quality": self.node_config.get("quality", "standard"),
+                "n": 1,
+            }
+            # Let the HTTP request give up before the executor cancels the node
+            timeout = remaining_time()
+            if timeout is not None:
+                request["timeout"] = timeout
+            response = client.images.generate(**request)
+            # AsyncOpenAI clients (from OpenAI-Connector) return a coroutine
+            if inspect.isawaitable(response):
+                response = await response
             
             image_url = response.data[0].url
             self.get_output_port("image_url").set_data(image_url)
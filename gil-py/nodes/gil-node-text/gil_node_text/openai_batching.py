@@ -0,0 +1,157 @@
+import asyncio
+import inspect
+import json
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+from gil_py.core.batching import MicroBatcher
+
+# Batching modes
+AUTO = "auto"                # COMPLETIONS for models the Completions API serves, CHAT otherwise
+COMPLETIONS = "completions"  # One Completions request with a list of prompts
+CHAT = "chat"                # Concurrent Chat Completions requests, one per prompt
+BATCH_API = "batch_api"      # One Batch API job of Chat Completions requests (can take hours; opt-in only)
+
+# Models served by the legacy Completions endpoint (fine-tuned variants are `ft:<base>:...`)
+COMPLETIONS_MODELS = ("gpt-3.5-turbo-instruct", "davinci-002", "babbage-002")
+
+DEFAULT_BATCH_CONFIG: Dict[str, Any] = {
+    "mode": AUTO,
+    "window_ms": 20,
+    "max_size": 20,
+    "poll_interval": 5.0,
+}
+
+_FINAL_BATCH_STATUSES = frozenset({"completed", "failed", "expired", "cancelled"})
+
+_batchers: Dict[Tuple[str, float, int, float], MicroBatcher] = {}
+
+
+class BatchItemError(RuntimeError):
+    """Raised for a single prompt that failed inside an otherwise successful batch."""
+
+
+async def _maybe_await(value: Any) -> Any:
+    # Sync clients (and test doubles) return results directly
+    if inspect.isawaitable(value):
+        return await value
+    return value
+
+
+def batch_config(config: Any) -> Optional[Dict[str, Any]]:
+    """Normalizes the node's `batch` config (`true` or a mapping); None when batching is off."""
+    if not config:
+        return None
+    settings = {**DEFAULT_BATCH_CONFIG, **(config if isinstance(config, dict) else {})}
+    modes = (AUTO, COMPLETIONS, CHAT, BATCH_API)
+    if settings["mode"] not in modes:
+        raise ValueError(f"Unsupported batch mode: '{settings['mode']}' ({', '.join(modes)})")
+    return settings
+
+
+def supports_completions(model: str) -> bool:
+    """Whether the Completions API serves the model (chat models are not)."""
+    if model.startswith("ft:"):
+        model = model[len("ft:"):]
+    return model.startswith(COMPLETIONS_MODELS)
+
+
+async def generate_batched(client: Any, model: str, prompt: str, settings: Dict[str, Any]) -> str:
+    """Queues the prompt to be sent together with concurrent calls that share the client, model and batch settings."""
+    mode = settings["mode"]
+    if mode == AUTO:
+        mode = COMPLETIONS if supports_completions(model) else CHAT
+    elif mode == COMPLETIONS and not supports_completions(model):
+        raise ValueError(
+            f"Batch mode '{COMPLETIONS}' needs a Completions model ({', '.join(COMPLETIONS_MODELS)}), "
+            f"not '{model}'; use mode '{CHAT}' or '{BATCH_API}' for chat models."
+        )
+    window = float(settings["window_ms"]) / 1000
+    max_size = int(settings["max_size"])
+    poll_interval = float(settings["poll_interval"])
+
+    batcher_key = (mode, window, max_size, poll_interval)
+    batcher = _batchers.get(batcher_key)
+    if batcher is None:
+        if mode == COMPLETIONS:
+            flush = _flush_completions
+        elif mode == CHAT:
+            flush = _flush_chat
+        else:
+            async def flush(key: Hashable, prompts: List[str]) -> List[Any]:
+                return await _flush_batch_api(key, prompts, poll_interval)
+        batcher = _batchers[batcher_key] = MicroBatcher(flush, window=window, max_size=max_size)
+    return await batcher.submit((client, model), prompt)
+
+
+async def _flush_completions(key: Hashable, prompts: List[str]) -> List[Any]:
+    """Sends all prompts in one Completions request; choices are matched back by their index."""
+    client, model = key
+    response = await _maybe_await(client.completions.create(model=model, prompt=prompts))
+    results: List[Any] = [BatchItemError("No completion returned for this prompt") for _ in prompts]
+    for choice in response.choices:
+        results[choice.index] = choice.text
+    return results
+
+
+async def _flush_chat(key: Hashable, prompts: List[str]) -> List[Any]:
+    """Sends one Chat Completions request per prompt, all at once; a failed request fails only its prompt."""
+    client, model = key
+    responses = await asyncio.gather(*(
+        _maybe_await(client.chat.completions.create(model=model, messages=[{"role": "user", "content": prompt}]))
+        for prompt in prompts
+    ), return_exceptions=True)
+    return [
+        response if isinstance(response, BaseException) else response.choices[0].message.content
+        for response in responses
+    ]
+
+
+async def _flush_batch_api(key: Hashable, prompts: List[str], poll_interval: float) -> List[Any]:
+    """Submits the prompts as one Batch API job, waits for it and matches results back by custom_id."""
+    client, model = key
+    lines = [
+        json.dumps({
+            "custom_id": str(i),
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": {"model": model, "messages": [{"role": "user", "content": prompt}]},
+        }, ensure_ascii=False)
+        for i, prompt in enumerate(prompts)
+    ]
+    input_file = await _maybe_await(client.files.create(
+        file=("gil-batch.jsonl", "\n".join(lines).encode("utf-8")),
+        purpose="batch",
+    ))
+    batch = await _maybe_await(client.batches.create(
+        input_file_id=input_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h",
+    ))
+    try:
+        while batch.status not in _FINAL_BATCH_STATUSES:
+            await asyncio.sleep(poll_interval)
+            batch = await _maybe_await(client.batches.retrieve(batch.id))
+    except asyncio.CancelledError:
+        await _maybe_await(client.batches.cancel(batch.id))
+        raise
+
+    results: List[Any] = [
+        BatchItemError(f"Batch {batch.id} returned no result for this prompt ({batch.status})") for _ in prompts
+    ]
+    for file_id in (batch.output_file_id, batch.error_file_id):
+        if not file_id:
+            continue
+        content = await _maybe_await(client.files.content(file_id))
+        for line in content.text.splitlines():
+            if line.strip():
+                record = json.loads(line)
+                results[int(record["custom_id"])] = _batch_result(record)
+    return results
+
+
+def _batch_result(record: Dict[str, Any]) -> Any:
+    response = record.get("response") or {}
+    if record.get("error") or response.get("status_code", 200) >= 400:
+        error = record.get("error") or response.get("body", {}).get("error")
+        return BatchItemError(f"Batch request failed: {error}")
+    return response["body"]["choices"][0]["message"]["content"]
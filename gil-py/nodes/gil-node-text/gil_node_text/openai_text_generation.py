@@ -1,42 +1,50 @@
+import inspect
 from gil_py.core.node import Node
-from gil_py.core.port import Port, InputPort, OutputPort
+from gil_py.core.port import InputPort, OutputPort
 from gil_py.core.data_types import DataType
 from gil_py.core.context import Context
+from gil_py.core.deadline import remaining_time
+from gil_py.core.stream import TokenStream
+from .openai_batching import batch_config, generate_batched
 
 class OpenAIGenerateTextNode(Node):
     """
     Generates text using the OpenAI Chat Completions API.
     This node requires a connection to an OpenAI-Connector.
+    With `stream: true` in the config, `generated_text` is a TokenStream that
+    yields tokens as they arrive instead of the complete text.
+    With `batch` in the config, prompts from concurrent runs that share the
+    client and model are coalesced into one request (see openai_batching).
     """
 
-    def __init__(self, node_id: str, node_config: dict):
-        super().__init__(node_id=node_id, node_config=node_config)
-        
-        # Define ports
-        self.add_input_port(InputPort(
+    input_port_schema = (
+        InputPort(
             name="client",
             data_type=DataType.ANY,
             description="The OpenAI client instance from an OpenAI-Connector.",
             required=True
-        ))
-        self.add_input_port(InputPort(
+        ),
+        InputPort(
             name="prompt",
             data_type=DataType.TEXT,
             description="The text prompt for generation.",
             required=True
-        ))
-        self.add_input_port(Port(
+        ),
+        InputPort(
             name="model",
             data_type=DataType.TEXT,
             description="The OpenAI model to use (e.g., gpt-4, gpt-3.5-turbo).",
             required=False,
             default_value="gpt-3.5-turbo"
-        ))
-        self.add_output_port(OutputPort(
+        ),
+    )
+    output_port_schema = (
+        OutputPort(
             name="generated_text",
             data_type=DataType.TEXT,
             description="The text generated by the OpenAI model."
-        ))
+        ),
+    )
 
     async def execute(self, data: dict, context: Context) -> dict:
         """
@@ -51,13 +59,38 @@ class OpenAIGenerateTextNode(Node):
         if not prompt:
             raise ValueError("Prompt is not provided.")
 
+        stream = bool(self.node_config.get("stream", False))
+        batch = batch_config(self.node_config.get("batch"))
+        if batch and stream:
+            raise ValueError("`batch` and `stream` cannot be used together.")
+
         try:
-            response = client.chat.completions.create(
-                model=model,
-                messages=[
+            if batch:
+                generated_text = await generate_batched(client, model, prompt, batch)
+                self.get_output_port("generated_text").set_data(generated_text)
+                return {"generated_text": generated_text}
+
+            request = {
+                "model": model,
+                "messages": [
                     {"role": "user", "content": prompt}
-                ]
-            )
+                ],
+            }
+            if stream:
+                request["stream"] = True
+            # Let the HTTP request give up before the executor cancels the node
+            timeout = remaining_time()
+            if timeout is not None:
+                request["timeout"] = timeout
+            response = client.chat.completions.create(**request)
+            # AsyncOpenAI clients (from OpenAI-Connector) return a coroutine
+            if inspect.isawaitable(response):
+                response = await response
+
+            if stream:
+                token_stream = TokenStream.from_source(response, self._extract_token)
+                self.get_output_port("generated_text").set_data(token_stream)
+                return {"generated_text": token_stream}
             
             generated_text = response.choices[0].message.content
             self.get_output_port("generated_text").set_data(generated_text)
@@ -65,3 +98,10 @@ class OpenAIGenerateTextNode(Node):
         
         except Exception as e:
             raise RuntimeError(f"Failed to generate text: {e}") from e
+
+    @staticmethod
+    def _extract_token(chunk):
+        """Returns the text delta of a streamed chat completion chunk, or None."""
+        if not chunk.choices:
+            return None
+        return chunk.choices[0].delta.content or None
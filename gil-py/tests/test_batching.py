@@ -0,0 +1,69 @@
+import asyncio
+
+import pytest
+
+from gil_py.core.batching import MicroBatcher
+from gil_py.core.deadline import deadline_scope, get_deadline
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_are_coalesced_per_key():
+    calls = []
+
+    async def flush(key, items):
+        calls.append((key, list(items)))
+        return [f"{key}:{item}" for item in items]
+
+    batcher = MicroBatcher(flush, window=0.02)
+    results = await asyncio.gather(
+        batcher.submit("a", 1), batcher.submit("b", 2), batcher.submit("a", 3),
+    )
+
+    assert results == ["a:1", "b:2", "a:3"]
+    assert sorted(calls) == [("a", [1, 3]), ("b", [2])]
+
+
+@pytest.mark.asyncio
+async def test_item_errors_fail_only_their_caller():
+    async def flush(key, items):
+        return [ValueError("bad") if item < 0 else item * 2 for item in items]
+
+    batcher = MicroBatcher(flush, window=0.01)
+    results = await asyncio.gather(batcher.submit("k", 1), batcher.submit("k", -1), return_exceptions=True)
+
+    assert results[0] == 2
+    assert isinstance(results[1], ValueError)
+
+
+@pytest.mark.asyncio
+async def test_full_batch_is_sent_without_waiting_and_outside_caller_deadline():
+    seen_deadlines = []
+
+    async def flush(key, items):
+        seen_deadlines.append(get_deadline())
+        return items
+
+    batcher = MicroBatcher(flush, window=10, max_size=2)
+    with deadline_scope(5):
+        results = await asyncio.wait_for(asyncio.gather(batcher.submit("k", 1), batcher.submit("k", 2)), 1)
+
+    assert results == [1, 2]
+    assert seen_deadlines == [None]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_calls_are_dropped_from_the_batch():
+    sent = []
+
+    async def flush(key, items):
+        sent.extend(items)
+        return items
+
+    batcher = MicroBatcher(flush, window=0.02)
+    cancelled = asyncio.ensure_future(batcher.submit("k", "cancelled"))
+    kept = asyncio.ensure_future(batcher.submit("k", "kept"))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+
+    assert await kept == "kept"
+    assert sent == ["kept"]
@@ -0,0 +1,150 @@
+import time
+from typing import ClassVar
+
+import pytest
+
+from gil_py.core.node import Node
+from gil_py.core.context import Context
+from gil_py.workflow.cache import MISS, MemoryResultCache, SQLiteResultCache, ShelveResultCache, cache_key
+from gil_py.workflow.executor import WorkflowExecutor
+from gil_py.workflow.node_factory import NodeFactory
+from gil_py.yaml_parser import YamlWorkflowParser
+
+
+class CountingNode(Node):
+    """Upper-cases its input and counts how often it actually ran."""
+
+    calls: ClassVar[int] = 0
+
+    async def execute(self, data: dict, context: Context) -> dict:
+        CountingNode.calls += 1
+        return {"output": data["input"].upper()}
+
+
+def make_workflow(cache, text: str = "hello"):
+    return YamlWorkflowParser().parse_dict({
+        "version": "1.0",
+        "name": "cache test",
+        "nodes": {"upper": {"type": "Test-Counting", "config": {"mode": "upper"}, "inputs": {"input": text}, "cache": cache}},
+        "flow": ["upper"],
+    })
+
+
+def make_executor(result_cache) -> WorkflowExecutor:
+    factory = NodeFactory()
+    factory.register("Test-Counting", CountingNode)
+    return WorkflowExecutor(node_factory=factory, result_cache=result_cache)
+
+
+@pytest.mark.asyncio
+async def test_cached_node_is_reused_across_runs():
+    CountingNode.calls = 0
+    executor = make_executor(MemoryResultCache())
+
+    first = await executor.execute(make_workflow(True), Context({}))
+    second = await executor.execute(make_workflow(True), Context({}))
+    other_input = await executor.execute(make_workflow(True, "bye"), Context({}))
+
+    assert CountingNode.calls == 2
+    assert first["cache"] == {"hits": 0, "misses": 1}
+    assert second["cache"] == {"hits": 1, "misses": 0}
+    assert second["node_outputs"]["upper"] == {"output": "HELLO"}
+    assert other_input["node_outputs"]["upper"] == {"output": "BYE"}
+
+
+@pytest.mark.asyncio
+async def test_nodes_without_cache_setting_always_run():
+    CountingNode.calls = 0
+    executor = make_executor(MemoryResultCache())
+
+    await executor.execute(make_workflow(False), Context({}))
+    result = await executor.execute(make_workflow(False), Context({}))
+
+    assert CountingNode.calls == 2
+    assert result["cache"] == {"hits": 0, "misses": 0}
+
+
+def test_memory_cache_expires_and_evicts():
+    cache = MemoryResultCache(max_size=2)
+    cache.set("a", 1, ttl=0.05)
+    cache.set("b", 2)
+    cache.set("c", 3)
+
+    assert cache.get("a") is MISS
+    assert cache.get("c") == 3
+
+    cache.set("d", 4, ttl=0.05)
+    time.sleep(0.1)
+    assert cache.get("d") is MISS
+
+
+@pytest.mark.parametrize("cache_class, name", [(SQLiteResultCache, "cache.db"), (ShelveResultCache, "cache")])
+def test_disk_caches_persist_between_instances(tmp_path, cache_class, name):
+    path = str(tmp_path / name)
+    cache = cache_class(path)
+    cache.set("key", {"output": "HELLO"})
+    cache.close()
+
+    cache = cache_class(path)
+    assert cache.get("key") == {"output": "HELLO"}
+    assert cache.get("missing") is MISS
+    cache.close()
+
+
+def test_cache_key_is_stable_and_skips_unhashable_inputs():
+    assert cache_key("T", {"a": 1, "b": 2}, {"x": "y"}) == cache_key("T", {"b": 2, "a": 1}, {"x": "y"})
+    assert cache_key("T", {}, {"x": "y"}) != cache_key("U", {}, {"x": "y"})
+    assert cache_key("T", {}, {"x": object()}) is None
+
+
+class ClientNode(Node):
+    """Stands in for a connector: outputs a client object that cannot be serialized."""
+
+    async def execute(self, data: dict, context: Context) -> dict:
+        return {"client": object()}
+
+
+class GenerateNode(Node):
+    calls: ClassVar[int] = 0
+
+    async def execute(self, data: dict, context: Context) -> dict:
+        GenerateNode.calls += 1
+        return {"text": data["prompt"].upper()}
+
+
+@pytest.mark.asyncio
+async def test_client_inputs_from_connectors_do_not_prevent_caching():
+    GenerateNode.calls = 0
+    factory = NodeFactory()
+    factory.register("Test-Client", ClientNode)
+    factory.register("Test-Generate", GenerateNode)
+    executor = WorkflowExecutor(node_factory=factory, result_cache=MemoryResultCache(), observers=[])
+
+    def workflow(api_key):
+        return YamlWorkflowParser().parse_dict({
+            "version": "1.0",
+            "name": "connector cache test",
+            "nodes": {
+                "connector": {"type": "Test-Client", "config": {"api_key": api_key}},
+                "generate": {"type": "Test-Generate", "inputs": {"client": "@connector.client", "prompt": "hi"}, "cache": True},
+            },
+            "flow": ["connector", "generate"],
+        })
+
+    first = await executor.execute(workflow("sk-a"), Context({}))
+    second = await executor.execute(workflow("sk-a"), Context({}))
+    other_connector = await executor.execute(workflow("sk-b"), Context({}))
+
+    assert first["cache"] == {"hits": 0, "misses": 1}
+    assert second["cache"] == {"hits": 1, "misses": 0}
+    assert second["node_outputs"]["generate"] == {"text": "HI"}
+    # A differently configured connector is a different client
+    assert other_connector["cache"] == {"hits": 0, "misses": 1}
+    assert GenerateNode.calls == 2
+
+
+def test_cache_ttl_is_given_in_milliseconds():
+    executor = make_executor(MemoryResultCache())
+    plan = executor.compiler.compile(make_workflow({"ttl": 1500}))
+
+    assert plan.nodes[0].cache_ttl == 1.5
@@ -0,0 +1,172 @@
+import threading
+from typing import ClassVar, Dict
+
+import pytest
+
+from gil_py.core.node import Node
+from gil_py.core.context import Context
+from gil_py.workflow.checkpoint import FAILED, FINISHED, MemoryCheckpointStore, SQLiteCheckpointStore
+from gil_py.workflow.compiler import WorkflowCompiler
+from gil_py.workflow.executor import WorkflowExecutor
+from gil_py.workflow.node_factory import NodeFactory
+
+
+class StepNode(Node):
+    """Counts its runs; fails while `fail` is listed in the context."""
+
+    runs: ClassVar[Dict[str, int]] = {}
+
+    async def execute(self, data: dict, context: Context) -> dict:
+        StepNode.runs[self.node_id] = StepNode.runs.get(self.node_id, 0) + 1
+        if self.node_id in context.get("fail", []):
+            raise RuntimeError("upstream API failed")
+        context.set(f"seen_{self.node_id}", True)
+        return {"output": f"{self.node_id}({data.get('value', '')})"}
+
+
+def make_executor(store) -> WorkflowExecutor:
+    factory = NodeFactory()
+    factory.register("Test-Step", StepNode)
+    return WorkflowExecutor(node_factory=factory, compiler=WorkflowCompiler(factory), observers=[], checkpoints=store)
+
+
+def chain(last_config=None):
+    return {
+        "version": "1.0",
+        "name": "checkpoint test",
+        "nodes": {
+            "a": {"type": "Test-Step"},
+            "b": {"type": "Test-Step", "inputs": {"value": "@a.output"}},
+            "c": {"type": "Test-Step", "config": last_config or {}, "inputs": {"value": "@b.output"}},
+        },
+        "flow": ["a", "b", "c"],
+    }
+
+
+@pytest.fixture(autouse=True)
+def reset_runs():
+    StepNode.runs = {}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("make_store", [MemoryCheckpointStore, lambda: None])
+async def test_resume_skips_completed_nodes(make_store, tmp_path):
+    store = make_store() or SQLiteCheckpointStore(str(tmp_path / "checkpoints.db"))
+    executor = make_executor(store)
+    plan = executor.compiler.compile_dict(chain())
+
+    first = await executor.execute(plan, Context({"fail": ["c"]}))
+    assert "error" in first["node_outputs"]["c"]
+    assert store.load(first["run_id"]).status == FAILED
+
+    second = await make_executor(store).execute(plan, Context({}), resume=first["run_id"])
+
+    assert second["run_id"] == first["run_id"]
+    assert second["node_outputs"]["c"] == {"output": "c(b(a()))"}
+    assert StepNode.runs == {"a": 1, "b": 1, "c": 2}
+    # Context values set by skipped nodes are restored
+    assert second["context"]["seen_b"] is True
+    assert store.load(first["run_id"]).status == FINISHED
+
+
+@pytest.mark.asyncio
+async def test_resume_reruns_nodes_whose_config_changed():
+    store = MemoryCheckpointStore()
+    executor = make_executor(store)
+    first = await executor.execute(executor.compiler.compile_dict(chain()), Context({}))
+
+    await executor.execute(executor.compiler.compile_dict(chain({"style": "new"})), Context({}), resume=first["run_id"])
+
+    assert StepNode.runs == {"a": 1, "b": 1, "c": 2}
+
+
+@pytest.mark.asyncio
+async def test_resume_unknown_run_fails():
+    executor = make_executor(MemoryCheckpointStore())
+
+    with pytest.raises(ValueError):
+        await executor.execute(executor.compiler.compile_dict(chain()), Context({}), resume="missing")
+
+
+def diamond(b_config=None):
+    return {
+        "version": "1.0",
+        "name": "incremental test",
+        "nodes": {
+            "a": {"type": "Test-Step", "inputs": {"value": "$topic"}},
+            "b": {"type": "Test-Step", "config": b_config or {}, "inputs": {"value": "@a.output"}},
+            "c": {"type": "Test-Step", "inputs": {"value": "@a.output"}},
+            "d": {"type": "Test-Step", "inputs": {"value": "@b.output"}},
+        },
+        "flow": ["a", ["b", "c"], "d"],
+    }
+
+
+@pytest.mark.asyncio
+async def test_incremental_reruns_only_the_dirty_subgraph():
+    store = MemoryCheckpointStore()
+    executor = make_executor(store)
+
+    await executor.execute(executor.compiler.compile_dict(diamond()), Context({"topic": "x"}), incremental=True)
+    result = await executor.execute(executor.compiler.compile_dict(diamond({"tone": "formal"})), Context({"topic": "x"}), incremental=True)
+
+    assert sorted(result["reused"]) == ["a", "c"]
+    assert StepNode.runs == {"a": 1, "b": 2, "c": 1, "d": 2}
+
+    # A changed context input dirties everything downstream of the node reading it
+    result = await executor.execute(executor.compiler.compile_dict(diamond({"tone": "formal"})), Context({"topic": "y"}), incremental=True)
+    assert result["reused"] == []
+    assert result["node_outputs"]["d"] == {"output": "d(b(a(y)))"}
+
+
+class ClientNode(Node):
+    """Outputs a client that cannot be pickled, like a connector."""
+
+    runs: ClassVar[int] = 0
+
+    async def execute(self, data: dict, context: Context) -> dict:
+        ClientNode.runs += 1
+        return {"client": threading.Lock()}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("make_store", [MemoryCheckpointStore, lambda: None])
+async def test_unpicklable_outputs_are_skipped_without_warnings(make_store, tmp_path):
+    store = make_store() or SQLiteCheckpointStore(str(tmp_path / "checkpoints.db"))
+    executor = make_executor(store)
+    executor.node_factory.register("Test-Client", ClientNode)
+    ClientNode.runs = 0
+    plan = executor.compiler.compile_dict({
+        "version": "1.0",
+        "name": "connector checkpoint test",
+        "nodes": {
+            "client": {"type": "Test-Client"},
+            "a": {"type": "Test-Step", "inputs": {"value": "@client.client"}},
+            "b": {"type": "Test-Step", "inputs": {"value": "@a.output"}},
+        },
+        "flow": ["client", "a", "b"],
+    })
+    events = []
+
+    first = await executor.execute(plan, Context({"fail": ["b"]}), on_event=lambda event, data: events.append(event))
+    assert "warning" not in events
+    assert sorted(store.load(first["run_id"]).nodes) == ["a"]
+
+    # The connector runs again; the node that used its client is still reused
+    second = await make_executor(store).execute(plan, Context({}), resume=first["run_id"])
+    assert second["reused"] == ["a"]
+    assert ClientNode.runs == 2
+    assert StepNode.runs == {"a": 1, "b": 2}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("make_store", [lambda: MemoryCheckpointStore(max_runs=2), lambda: None])
+async def test_store_keeps_only_the_most_recent_runs(make_store, tmp_path):
+    store = make_store() or SQLiteCheckpointStore(str(tmp_path / "checkpoints.db"), max_runs=2)
+    executor = make_executor(store)
+    plan = executor.compiler.compile_dict(chain())
+
+    run_ids = [(await executor.execute(plan, Context({})))["run_id"] for _ in range(3)]
+
+    assert [run.run_id for run in store.list_runs()] == run_ids[:0:-1]
+    assert store.load(run_ids[0]) is None
@@ -0,0 +1,138 @@
+import pytest
+
+from gil_py.core.node import Node
+from gil_py.core.context import Context
+from gil_py.workflow.compiler import WorkflowCompiler
+from gil_py.workflow.executor import WorkflowExecutor
+from gil_py.workflow.node_factory import NodeFactory
+
+
+class EchoNode(Node):
+    """Returns its inputs unchanged."""
+
+    async def execute(self, data: dict, context: Context) -> dict:
+        return dict(data)
+
+
+WORKFLOW_YAML = """
+version: "1.0"
+name: compiler test
+nodes:
+  init:
+    type: Test-Echo
+  a:
+    type: Test-Echo
+    inputs:
+      value: "$user"
+  b:
+    type: Test-Echo
+  merge:
+    type: Test-Echo
+flow:
+  - init
+  - [a, b, ghost]
+  - merge
+"""
+
+
+def make_compiler() -> WorkflowCompiler:
+    factory = NodeFactory()
+    factory.register("Test-Echo", EchoNode)
+    return WorkflowCompiler(node_factory=factory, max_size=2)
+
+
+def test_compile_yaml_builds_levels_and_skips_missing_nodes():
+    compiled = make_compiler().compile_yaml(WORKFLOW_YAML)
+
+    assert compiled.missing_nodes == ["ghost"]
+    assert [[compiled.nodes[i].node_id for i in level] for level in compiled.levels] == [["init"], ["a", "b"], ["merge"]]
+    assert compiled.nodes[compiled.index["a"]].node_class is EchoNode
+    assert compiled.nodes[compiled.index["a"]].resolve_inputs(Context({"user": "gil"})) == {"value": "gil"}
+
+
+@pytest.mark.asyncio
+async def test_compile_warnings_are_emitted_as_events(capsys):
+    compiler = make_compiler()
+    compiled = compiler.compile_dict({
+        "version": "1.0",
+        "name": "warnings test",
+        "nodes": {"a": {"type": "Test-Echo"}, "b": {"type": "Test-Echo"}},
+        "flow": ["a", "ghost", {"node": "b", "depends_on": ["a", "phantom"]}],
+    })
+    assert capsys.readouterr().out == ""
+    assert [node_id for node_id, _ in compiled.warnings] == ["b", "ghost"]
+
+    events = []
+    executor = WorkflowExecutor(node_factory=compiler.node_factory, compiler=compiler, observers=[])
+    await executor.execute(compiled, Context({}), on_event=lambda event, data: events.append((event, data)))
+
+    warnings = [data for event, data in events if event == "node_warning"]
+    assert [data["node"] for data in warnings] == ["b", "ghost"]
+    assert "phantom" in warnings[0]["message"]
+
+
+def test_compile_cache_reuses_plans_and_evicts_least_recently_used():
+    compiler = make_compiler()
+
+    first = compiler.compile_yaml(WORKFLOW_YAML)
+    assert compiler.compile_yaml(WORKFLOW_YAML) is first
+    assert (compiler.hits, compiler.misses) == (1, 1)
+
+    compiler.compile_yaml(WORKFLOW_YAML.replace("compiler test", "second"))
+    compiler.compile_yaml(WORKFLOW_YAML.replace("compiler test", "third"))
+    assert compiler.compile_yaml(WORKFLOW_YAML) is not first
+
+
+def test_compile_rejects_unknown_node_type():
+    with pytest.raises(ValueError):
+        make_compiler().compile_yaml(WORKFLOW_YAML.replace("type: Test-Echo", "type: Test-Unknown"))
+
+
+DATAFLOW_YAML = """
+version: "1.0"
+name: dataflow test
+nodes:
+  source:
+    type: Test-Echo
+    inputs:
+      text: "$user"
+  upper:
+    type: Test-Echo
+    inputs:
+      value: "@source.text"
+      everything: "@source"
+      handle: "@ not a reference"
+flow:
+  - [source, upper]
+"""
+
+
+@pytest.mark.asyncio
+async def test_output_references_become_connections_and_dependencies():
+    compiler = make_compiler()
+    compiled = compiler.compile_yaml(DATAFLOW_YAML)
+    upper = compiled.nodes[compiled.index["upper"]]
+
+    # The reference orders `upper` after `source` even though the flow runs them in parallel
+    assert [[compiled.nodes[i].node_id for i in level] for level in compiled.levels] == [["source"], ["upper"]]
+    assert [str(c) for c in upper.input_connections] == ["source:text -> upper:value", "source:* -> upper:everything"]
+    assert upper.instantiate().input_connections == list(upper.input_connections)
+
+    result = await WorkflowExecutor(compiler.node_factory, compiler, observers=[]).execute(compiled, Context({"user": "gil"}))
+
+    assert result["node_outputs"]["upper"] == {"value": "gil", "everything": {"text": "gil"}, "handle": "@ not a reference"}
+
+
+@pytest.mark.asyncio
+async def test_reference_to_failed_or_missing_port_fails_the_node():
+    compiler = make_compiler()
+    compiled = compiler.compile_yaml(DATAFLOW_YAML.replace("@source.text", "@source.missing"))
+
+    result = await WorkflowExecutor(compiler.node_factory, compiler, observers=[]).execute(compiled, Context({"user": "gil"}))
+
+    assert "'missing'" in result["node_outputs"]["upper"]["error"]
+
+
+def test_reference_to_unknown_node_is_rejected():
+    with pytest.raises(ValueError, match="ghost"):
+        make_compiler().compile_yaml(DATAFLOW_YAML.replace("@source.text", "@ghost.text"))
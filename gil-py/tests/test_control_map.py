@@ -0,0 +1,103 @@
+import asyncio
+import time
+from typing import ClassVar
+
+import pytest
+
+from gil_py.core.context import Context
+from gil_py.core.control.map import ControlMapNode
+from gil_py.core.node import Node
+from gil_py.workflow.executor import WorkflowExecutor
+from gil_py.workflow.node_factory import NodeFactory
+
+
+class SquareNode(Node):
+    """Squares `value` after a short delay; fails for negative values."""
+
+    active: ClassVar[int] = 0
+    peak: ClassVar[int] = 0
+
+    async def execute(self, data: dict, context: Context) -> dict:
+        SquareNode.active += 1
+        SquareNode.peak = max(SquareNode.peak, SquareNode.active)
+        try:
+            value = data["value"]
+            await asyncio.sleep(0.05 if value != 1 else 0.15)
+            if value < 0:
+                raise ValueError(f"negative value {value}")
+            return {"output": value * value, "index": context.get("index")}
+        finally:
+            SquareNode.active -= 1
+
+
+def make_executor() -> WorkflowExecutor:
+    factory = NodeFactory()
+    factory.register("Test-Square", SquareNode)
+    factory.register("Control-Map", ControlMapNode)
+    return WorkflowExecutor(node_factory=factory, observers=[])
+
+
+async def run_map(items, **config):
+    config.setdefault("node", {"type": "Test-Square", "inputs": {"value": "$item"}})
+    workflow = {
+        "version": "1.0",
+        "name": "map test",
+        "nodes": {"map": {"type": "Control-Map", "config": config, "inputs": {"items": "$items"}}},
+        "flow": ["map"],
+    }
+    executor = make_executor()
+    result = await executor.execute(executor.compiler.compile_dict(workflow), Context({"items": items}))
+    return result["node_outputs"]["map"]
+
+
+@pytest.fixture(autouse=True)
+def reset_counter():
+    SquareNode.active = 0
+    SquareNode.peak = 0
+
+
+@pytest.mark.asyncio
+async def test_map_runs_node_per_element_with_concurrency_limit():
+    started = time.perf_counter()
+    output = await run_map([1, 2, 3, 4], output="output", concurrency=2)
+
+    assert output == {"results": [1, 4, 9, 16], "errors": []}
+    assert SquareNode.peak == 2
+    assert time.perf_counter() - started < 0.4
+
+
+@pytest.mark.asyncio
+async def test_unordered_results_follow_completion_order():
+    output = await run_map([1, 2, 3], output="output", ordered=False)
+
+    assert output["results"] == [4, 9, 1]
+
+
+@pytest.mark.asyncio
+async def test_partial_failures():
+    skipped = await run_map([2, -1, 3], output="output", on_error="skip")
+    nulled = await run_map([2, -1, 3], output="output", on_error="null")
+    failed = await run_map([2, -1, 3], output="output")
+
+    assert skipped["results"] == [4, 9]
+    assert skipped["errors"][0]["index"] == 1 and "negative value" in skipped["errors"][0]["error"]
+    assert nulled["results"] == [4, None, 9]
+    assert "Element 1 failed" in failed["error"]
+
+
+@pytest.mark.asyncio
+async def test_map_runs_a_sub_workflow():
+    output = await run_map(
+        [2, 3],
+        node=None,
+        workflow={
+            "nodes": {
+                "first": {"type": "Test-Square", "inputs": {"value": "$item"}},
+                "second": {"type": "Test-Square", "inputs": {"value": "$index"}},
+            },
+            "flow": [["first", "second"]],
+        },
+        output="second",
+    )
+
+    assert output["results"] == [{"output": 0, "index": 0}, {"output": 1, "index": 1}]
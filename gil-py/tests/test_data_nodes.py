@@ -0,0 +1,164 @@
+import pytest
+
+from gil_node_data.expressions import ExpressionError, compile_expression
+from gil_node_data.files import detect_encoding
+from gil_node_data.read_file import DataReadFileNode
+from gil_node_data.transform import DataTransformNode
+from gil_py.core.context import Context
+
+
+def transform(input_data, **config):
+    node = DataTransformNode(node_id="transform", node_config=config)
+    return node.execute({"input_data": input_data}, Context({}))["output_data"]
+
+
+def test_transform_expression_is_compiled_once_and_shared():
+    assert transform(5, transform_expression="data * 2") == 10
+    assert compile_expression("data * 2") is compile_expression("data * 2")
+
+
+def test_transform_supports_records_and_comprehensions():
+    records = [{"name": "a", "age": 31}, {"name": "b", "age": 25}]
+
+    assert transform(records, transform_expression="[r['name'].upper() for r in data if r['age'] > 30]") == ["A"]
+    assert transform(
+        records,
+        transform_expression="{'id': index, 'label': f\"{data['name']}-{data['age']}\"}",
+        for_each=True,
+        where="data.get('age', 0) >= 25",
+    ) == [{"id": 0, "label": "a-31"}, {"id": 1, "label": "b-25"}]
+
+
+@pytest.mark.parametrize("expression", [
+    "__import__('os')",
+    "data.__class__",
+    "open('/etc/passwd')",
+    "(lambda: 1)()",
+    "'{0.__class__}'.format(data)",
+    "[x := 1]",
+])
+def test_unsafe_expressions_are_rejected_at_construction(expression):
+    with pytest.raises(ValueError):
+        DataTransformNode(node_id="transform", node_config={"transform_expression": expression})
+
+
+def test_runaway_results_are_bounded():
+    with pytest.raises(RuntimeError, match="too large"):
+        transform(10, transform_expression="data ** data ** data")
+    with pytest.raises(ExpressionError):
+        compile_expression("'x' * 10 ** 9")(data=None)
+
+
+@pytest.mark.parametrize("expression", [
+    "f'{1:>100000000}'",
+    "f'{1:>{data}}'",
+    "f'{1.5:.100000000f}'",
+    "'%100000000d' % 1",
+    "'%*d' % (data, 1)",
+    "[0 for a in [0] * 10000 for b in [0] * 10000]",
+    "['x' * 1000000 for a in [0] * 100]",
+    "''.join(['x' * 10000] * 100000)",
+    "('x' * 10000).replace('', 'y' * 10000)",
+    "sum([[0] * 1000] * 10000, [])",
+    "(9 ** 9999) ** 9999",
+    "(9 ** 9999) * (9 ** 9999) * (9 ** 9999) * (9 ** 9999) * (9 ** 9999) * (9 ** 9999) * (9 ** 9999) * (9 ** 9999)"
+    " * (9 ** 9999) * (9 ** 9999) * (9 ** 9999) * (9 ** 9999) * (9 ** 9999) * (9 ** 9999) * (9 ** 9999) * (9 ** 9999)"
+    " * (9 ** 9999) * (9 ** 9999) * (9 ** 9999) * (9 ** 9999) * (9 ** 9999) * (9 ** 9999) * (9 ** 9999) * (9 ** 9999)"
+    " * (9 ** 9999) * (9 ** 9999) * (9 ** 9999) * (9 ** 9999) * (9 ** 9999) * (9 ** 9999) * (9 ** 9999) * (9 ** 9999)",
+])
+def test_expressions_cannot_build_huge_results(expression):
+    with pytest.raises(ExpressionError):
+        compile_expression(expression)(data=100000000)
+
+
+@pytest.mark.parametrize("expression", [
+    "[[0 for b in data for c in data for d in data] for _gil_iter in [list]]",
+    "_gil_iter",
+    "[x for __class__ in data]",
+    "data << 100000000",
+])
+def test_guards_cannot_be_rebound_or_bypassed(expression):
+    with pytest.raises(ExpressionError):
+        compile_expression(expression)
+
+
+def test_padding_methods_are_not_available():
+    with pytest.raises(ExpressionError, match="zfill"):
+        compile_expression("'a'.zfill(10 ** 8)")
+
+
+def test_bounded_operations_keep_their_results():
+    assert compile_expression("f'{data!r:>6}|{data:.2f}|' + '%03d' % 7")(data=1.5) == "   1.5|1.50|007"
+    assert compile_expression("'-'.join(x.replace('a', 'b') for x in data)")(data=["ab", "ca"]) == "bb-cb"
+    assert compile_expression("sum(x * 2 for x in data) + len([0] * 3)")(data=[1, 2]) == 9
+    assert compile_expression("[_ for _ in data]")(data=[1, 2]) == [1, 2]
+    assert compile_expression("(9 ** 999) ** 2 * 3")(data=None) == 9 ** 1998 * 3
+
+
+async def read_file(path, **config):
+    node = DataReadFileNode(node_id="read", node_config=config)
+    return await node.execute({"file_path": str(path)}, Context({}))
+
+
+async def collect(chunks):
+    return [chunk async for chunk in chunks]
+
+
+@pytest.mark.asyncio
+async def test_read_file_streams_lines_and_chunks(tmp_path):
+    path = tmp_path / "data.txt"
+    path.write_bytes("first\r\nsecond line\nthird é".encode("utf-8"))
+
+    lines = (await read_file(path, mode="lines", encoding="utf-8", chunk_size=4))["content"]
+    assert await collect(lines) == ["first", "second line", "third é"]
+    # Each iteration reads the file again
+    assert await collect(lines) == ["first", "second line", "third é"]
+
+    chunks = (await read_file(path, mode="chunks", chunk_size=5))["content"]
+    assert b"".join(await collect(chunks)) == path.read_bytes()
+
+
+@pytest.mark.asyncio
+async def test_read_file_byte_range_and_mmap(tmp_path):
+    path = tmp_path / "data.bin"
+    path.write_bytes(bytes(range(256)) * 64)
+
+    assert (await read_file(path, mode="binary", offset=10, length=4))["content"] == bytes([10, 11, 12, 13])
+    view = (await read_file(path, mode="mmap", offset=5000, length=3))["content"]
+    assert bytes(view) == bytes([5000 % 256, 5001 % 256, 5002 % 256])
+    assert b"".join(await collect((await read_file(path, mode="chunks", offset=250, length=8))["content"])) == bytes(
+        [250, 251, 252, 253, 254, 255, 0, 1]
+    )
+
+
+@pytest.mark.asyncio
+async def test_read_file_detects_encoding(tmp_path):
+    path = tmp_path / "utf16.txt"
+    path.write_text("안녕하세요", encoding="utf-16")
+
+    result = await read_file(path, encoding="auto")
+    assert result == {"content": "안녕하세요", "encoding": "utf-16"}
+    assert detect_encoding("abc é".encode("utf-8")[:-1]) == "utf-8"
+    assert detect_encoding(b"caf\xe9 au lait") != "utf-8"
+
+
+@pytest.mark.asyncio
+async def test_read_file_reports_missing_file(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        await read_file(tmp_path / "missing.txt", mode="lines")
+
+
+@pytest.mark.asyncio
+async def test_file_chunks_read_ahead_and_stop_early(tmp_path):
+    path = tmp_path / "data.txt"
+    path.write_text("".join(f"line {i}\n" for i in range(1000)))
+
+    lines = (await read_file(path, mode="lines", encoding="utf-8", chunk_size=16, prefetch=4))["content"]
+    assert len(await collect(lines)) == 1000
+
+    # Leaving the loop early stops the read-ahead task and closes the file
+    iterator = lines.__aiter__()
+    assert await iterator.__anext__() == "line 0"
+    await iterator.aclose()
+    unbuffered = (await read_file(path, mode="chunks", chunk_size=64, prefetch=0))["content"]
+    assert b"".join(await collect(unbuffered)) == path.read_bytes()
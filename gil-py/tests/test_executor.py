@@ -0,0 +1,181 @@
+import asyncio
+import io
+import json
+import time
+
+import pytest
+
+from gil_py.core.node import Node
+from gil_py.core.context import Context
+from gil_py.core.stream import TokenStream
+from gil_py.workflow.events import DEBUG, ERROR, INFO, EventDispatcher, ExecutionObserver, JsonLogObserver
+from gil_py.workflow.executor import WorkflowExecutor
+from gil_py.workflow.node_factory import NodeFactory
+from gil_py.yaml_parser import YamlWorkflowParser
+
+
+class SleepNode(Node):
+    """Sleeps for `delay` seconds and records its start/end order."""
+
+    async def execute(self, data: dict, context: Context) -> dict:
+        events = context.get("events")
+        events.append(("start", self.node_id))
+        await asyncio.sleep(self.node_config.get("delay", 0))
+        events.append(("end", self.node_id))
+        return {"output": self.node_id}
+
+
+class BlockingSleepNode(Node):
+    """Synchronous node that blocks its thread for `delay` seconds."""
+
+    def execute(self, data: dict, context: Context) -> dict:
+        time.sleep(self.node_config.get("delay", 0))
+        return {"output": self.node_id}
+
+
+class StreamingNode(Node):
+    """Streams three tokens, 0.1 seconds apart."""
+
+    async def execute(self, data: dict, context: Context) -> dict:
+        async def tokens():
+            for token in ["a", "b", "c"]:
+                await asyncio.sleep(0.1)
+                yield token
+        return {"output": TokenStream.from_source(tokens())}
+
+
+def make_executor() -> WorkflowExecutor:
+    factory = NodeFactory()
+    factory.register("Test-Sleep", SleepNode)
+    factory.register("Test-BlockingSleep", BlockingSleepNode)
+    factory.register("Test-Streaming", StreamingNode)
+    return WorkflowExecutor(node_factory=factory)
+
+
+def parse(nodes: dict, flow: list, node_type: str = "Test-Sleep"):
+    return YamlWorkflowParser().parse_dict({
+        "version": "1.0",
+        "name": "executor test",
+        "nodes": {node_id: {"type": node_type, "config": config} for node_id, config in nodes.items()},
+        "flow": flow,
+    })
+
+
+@pytest.mark.asyncio
+async def test_parallel_group_runs_concurrently():
+    workflow = parse(
+        {"init": {}, "a": {"delay": 0.2}, "b": {"delay": 0.2}, "c": {"delay": 0.2}, "merge": {}},
+        ["init", ["a", "b", "c"], "merge"],
+    )
+    context = Context({"events": []})
+
+    started = time.perf_counter()
+    result = await make_executor().execute(workflow, context)
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < 0.5
+    assert set(result["node_outputs"]) == {"init", "a", "b", "c", "merge"}
+    events = context.get("events")
+    assert events[0] == ("start", "init")
+    assert events[-1] == ("end", "merge")
+
+
+@pytest.mark.asyncio
+async def test_depends_on_orders_nodes():
+    workflow = parse(
+        {"slow": {"delay": 0.1}, "fast": {}, "after_slow": {}},
+        ["slow", {"node": "fast", "depends_on": []}, {"node": "after_slow", "depends_on": ["slow"]}],
+    )
+    context = Context({"events": []})
+
+    await make_executor().execute(workflow, context)
+
+    events = context.get("events")
+    assert events.index(("end", "fast")) < events.index(("end", "slow"))
+    assert events.index(("end", "slow")) < events.index(("start", "after_slow"))
+
+
+@pytest.mark.asyncio
+async def test_dependency_cycle_is_rejected():
+    workflow = parse(
+        {"a": {}, "b": {}},
+        [{"node": "a", "depends_on": ["b"]}, {"node": "b", "depends_on": ["a"]}],
+    )
+
+    with pytest.raises(ValueError):
+        await make_executor().execute(workflow, Context({"events": []}))
+
+
+@pytest.mark.asyncio
+async def test_sync_nodes_are_offloaded_to_worker_threads():
+    workflow = parse({"a": {"delay": 0.2}, "b": {"delay": 0.2}, "c": {"delay": 0.2}}, [["a", "b", "c"]], "Test-BlockingSleep")
+
+    started = time.perf_counter()
+    result = await make_executor().execute(workflow, Context({}))
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < 0.5
+    assert result["node_outputs"] == {"a": {"output": "a"}, "b": {"output": "b"}, "c": {"output": "c"}}
+
+
+@pytest.mark.asyncio
+async def test_streaming_outputs_unblock_dependents_and_are_collected():
+    workflow = YamlWorkflowParser().parse_dict({
+        "version": "1.0",
+        "name": "streaming test",
+        "nodes": {"writer": {"type": "Test-Streaming"}, "after": {"type": "Test-Sleep"}},
+        "flow": ["writer", "after"],
+    })
+    context = Context({"events": []})
+    streamed = []
+
+    def on_stream(node_id, port_name, stream):
+        streamed.append((node_id, port_name, stream.done))
+
+    result = await make_executor().execute(workflow, context, on_stream=on_stream)
+
+    assert streamed == [("writer", "output", False)]
+    assert ("end", "after") in context.get("events")
+    assert result["node_outputs"]["writer"] == {"output": "abc"}
+
+
+class RecordingObserver(ExecutionObserver):
+    def __init__(self, level):
+        self.level = level
+        self.events = []
+
+    def handle(self, event_type, data):
+        self.events.append((event_type, data))
+
+
+@pytest.mark.asyncio
+async def test_observers_receive_events_at_their_level():
+    workflow = parse({"a": {}}, ["a"])
+    info, debug = RecordingObserver(INFO), RecordingObserver(DEBUG)
+    executor = make_executor()
+    executor.observers = [info, debug]
+
+    await executor.execute(workflow, Context({"events": []}))
+
+    assert [event for event, _ in info.events] == ["run_started", "node_started", "node_finished", "run_finished"]
+    assert ("node_inputs", {"node": "a", "inputs": {}}) in debug.events
+
+
+def test_event_dispatcher_skips_events_without_observers():
+    dispatcher = EventDispatcher([RecordingObserver(ERROR)])
+
+    assert not dispatcher.wants("node_inputs")
+    assert not dispatcher.wants("node_finished")
+    assert dispatcher.wants("node_failed")
+    assert not EventDispatcher().wants("node_failed")
+
+
+def test_json_log_observer_writes_compact_records():
+    stream = io.StringIO()
+    JsonLogObserver(stream=stream).handle("node_inputs", {"node": "reader", "inputs": {"content": "x" * 10000, "image": b"\0" * 5}})
+
+    record = json.loads(stream.getvalue())
+    assert record["event"] == "node_inputs"
+    assert record["level"] == "debug"
+    assert record["inputs"]["image"] == "<5 bytes>"
+    assert len(record["inputs"]["content"]) < 300
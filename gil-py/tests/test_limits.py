@@ -0,0 +1,144 @@
+import asyncio
+import time
+from typing import ClassVar
+
+import pytest
+
+from gil_py.core.node import Node
+from gil_py.core.context import Context
+from gil_py.workflow.compiler import WorkflowCompiler
+from gil_py.workflow.executor import WorkflowExecutor
+from gil_py.workflow.limits import ConcurrencySlots, LimiterRegistry, TokenBucket, load_limits
+from gil_py.workflow.node_factory import NodeFactory
+
+
+class CountingNode(Node):
+    """Tracks how many instances run at the same time."""
+
+    active: ClassVar[int] = 0
+    peak: ClassVar[int] = 0
+
+    async def execute(self, data: dict, context: Context) -> dict:
+        CountingNode.active += 1
+        CountingNode.peak = max(CountingNode.peak, CountingNode.active)
+        await asyncio.sleep(0.05)
+        CountingNode.active -= 1
+        return {"output": time.perf_counter()}
+
+
+class ConnectorNode(Node):
+    async def execute(self, data: dict, context: Context) -> dict:
+        return {"client": "client"}
+
+
+def make_executor(registry: LimiterRegistry) -> WorkflowExecutor:
+    factory = NodeFactory()
+    factory.register("Test-Counting", CountingNode)
+    factory.register("Test-Connector", ConnectorNode)
+    return WorkflowExecutor(node_factory=factory, compiler=WorkflowCompiler(factory, limiters=registry), observers=[])
+
+
+def workflow(limits: dict, width: int = 6, **node_settings) -> dict:
+    nodes = {f"n{i}": {"type": "Test-Counting", **node_settings} for i in range(width)}
+    return {"version": "1.0", "name": "limits test", "nodes": nodes, "flow": [list(nodes)], "limits": limits}
+
+
+@pytest.fixture(autouse=True)
+def reset_counter():
+    CountingNode.active = 0
+    CountingNode.peak = 0
+
+
+@pytest.mark.asyncio
+async def test_concurrency_limit_by_node_type():
+    executor = make_executor(LimiterRegistry())
+    plan = executor.compiler.compile_dict(workflow({"counting": {"concurrency": 2, "node_types": ["Test-Counting"]}}))
+
+    await executor.execute(plan, Context({}))
+
+    assert CountingNode.peak == 2
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_spaces_out_attempts():
+    executor = make_executor(LimiterRegistry())
+    plan = executor.compiler.compile_dict(workflow({"api": {"rate": 20, "burst": 1}}, width=4, limit="api"))
+
+    result = await executor.execute(plan, Context({}))
+
+    finished = sorted(output["output"] for output in result["node_outputs"].values())
+    # Three refills at 20 per second: about 0.15s, minus timer jitter
+    assert finished[-1] - finished[0] >= 0.12
+
+
+@pytest.mark.asyncio
+async def test_limit_applies_to_nodes_using_a_connector():
+    registry = LimiterRegistry(load_limits("openai: {concurrency: 1, connectors: [Test-Connector]}"))
+    executor = make_executor(registry)
+    plan = executor.compiler.compile_dict({
+        "version": "1.0",
+        "name": "connector test",
+        "nodes": {
+            "conn": {"type": "Test-Connector"},
+            "a": {"type": "Test-Counting", "inputs": {"client": "@conn.client"}},
+            "b": {"type": "Test-Counting", "inputs": {"client": "@conn.client"}},
+            "free": {"type": "Test-Counting"},
+        },
+        "flow": ["conn", ["a", "b", "free"]],
+        # Limits from the environment cannot be changed by a workflow
+        "limits": {"openai": {"concurrency": 10}},
+    })
+
+    await executor.execute(plan, Context({}))
+
+    assert [node.node_id for node in plan.nodes if node.limiters] == ["a", "b"]
+    assert registry.get("openai").config.concurrency == 1
+    assert CountingNode.peak == 2
+
+
+def test_workflow_limits_are_scoped_to_the_workflow_and_its_settings():
+    executor = make_executor(LimiterRegistry())
+    compile_dict = executor.compiler.compile_dict
+
+    def limiter(plan):
+        return plan.nodes[0].limiters[0]
+
+    first = compile_dict(workflow({"api": {"concurrency": 2}}, width=1, limit="api"))
+    # Another run of the same workflow shares the limiter
+    assert limiter(compile_dict(workflow({"api": {"concurrency": 2}}, width=2, limit="api"))) is limiter(first)
+
+    # Another workflow, or the same workflow with new settings, gets its own limiter
+    other = compile_dict({**workflow({"api": {"concurrency": 8}}, width=1, limit="api"), "name": "other"})
+    edited = compile_dict(workflow({"api": {"concurrency": 8}}, width=1, limit="api"))
+    assert limiter(other) is not limiter(first) and limiter(edited) is not limiter(first)
+    assert limiter(first).config.concurrency == 2
+    assert limiter(first).slots.limit == 2
+
+
+def test_undefined_limit_is_rejected():
+    with pytest.raises(ValueError, match="missing"):
+        make_executor(LimiterRegistry()).compiler.compile_dict(workflow({}, width=1, limit="missing"))
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_leak_a_slot():
+    slots = ConcurrencySlots(1)
+    await slots.acquire()
+    waiter = asyncio.ensure_future(slots.acquire())
+    await asyncio.sleep(0)
+    waiter.cancel()
+    await asyncio.gather(waiter, return_exceptions=True)
+    slots.release()
+
+    assert slots.active == 0
+    await asyncio.wait_for(slots.acquire(), 0.1)
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_allows_burst_then_waits():
+    bucket = TokenBucket(rate=10, burst=3)
+    started = time.perf_counter()
+    for _ in range(4):
+        await bucket.acquire()
+
+    assert 0.08 <= time.perf_counter() - started < 0.3
@@ -0,0 +1,52 @@
+from gil_py.core.connection import Connection
+from gil_py.core.context import Context
+from gil_py.core.data_types import DataType
+from gil_py.core.node import Node
+from gil_py.core.port import InputPort, OutputPort
+from gil_py.core.util.log_message import UtilLogMessageNode
+
+
+class EchoNode(Node):
+    def __init__(self, node_id: str, node_config: dict):
+        super().__init__(node_id=node_id, node_config=node_config)
+        self.greeting = self.node_config.get("greeting", "hi")
+        self.add_input_port(InputPort(name="text", data_type=DataType.TEXT, required=False, default_value=""))
+        self.add_output_port(OutputPort(name="echo", data_type=DataType.TEXT))
+
+    async def execute(self, data: dict, context: Context) -> dict:
+        return {"echo": f"{self.greeting} {data.get('text', '')}"}
+
+
+def test_node_fields_and_port_lookup():
+    node = EchoNode(node_id="echo", node_config={"greeting": "hello"})
+
+    assert (node.name, node.node_type, node.greeting) == ("echo", "EchoNode", "hello")
+    assert node.get_input_port("text").default_value == ""
+    assert node.get_input_port("echo") is None
+    assert node.get_output_port("echo") is node.output_ports[0]
+    # DataType members are stored as their values
+    assert node.get_output_port("echo").data_type == "text"
+    assert node.get_output_port("echo").to_dict()["required"] is False
+
+
+def test_node_extra_fields_and_defaults():
+    node = EchoNode.__new__(EchoNode)
+    Node.__init__(node, node_config=None, label="extra")
+
+    assert node.node_id and node.name == node.node_id
+    assert node.node_config == {}
+    assert node.label == "extra"
+
+
+def test_connection_id_is_created_once_on_access():
+    connection = Connection(source_node_id="a", source_port="out", target_node_id="b", target_port="in")
+
+    assert connection.connection_id == connection.connection_id
+    assert str(connection) == "a:out -> b:in"
+
+
+def test_positional_node_config_is_not_taken_as_name():
+    node = UtilLogMessageNode("log", {"prefix": ">"})
+
+    assert node.node_config == {"prefix": ">"}
+    assert node.name == "log"
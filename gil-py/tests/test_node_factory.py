@@ -0,0 +1,90 @@
+import importlib.metadata
+import sys
+
+import pytest
+
+from gil_py.workflow import node_factory as node_factory_module
+from gil_py.workflow.node_factory import NodeFactory, discover_entry_points
+
+LAZY_NODE_SOURCE = '''
+from gil_py.core.node import Node
+
+
+class LazyNode(Node):
+    """Node used to check lazy entry point loading."""
+
+    async def execute(self, data, context):
+        return {"output": data.get("input")}
+'''
+
+
+@pytest.fixture
+def lazy_entry_point(tmp_path, monkeypatch):
+    (tmp_path / "gil_lazy_test_node.py").write_text(LAZY_NODE_SOURCE, encoding="utf-8")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setenv("GIL_NODE_CACHE", str(tmp_path / "cache" / "nodes.json"))
+    monkeypatch.delitem(sys.modules, "gil_lazy_test_node", raising=False)
+
+    entry_points = [importlib.metadata.EntryPoint(name="Test-Lazy", value="gil_lazy_test_node:LazyNode", group="gil.nodes")]
+    monkeypatch.setattr(node_factory_module.importlib.metadata, "entry_points", lambda group: entry_points)
+    monkeypatch.setattr(node_factory_module, "_discovered_entry_points", None)
+    monkeypatch.setattr(node_factory_module, "_loaded_node_classes", {})
+    yield tmp_path
+    sys.modules.pop("gil_lazy_test_node", None)
+
+
+def test_discovery_does_not_import_node_modules(lazy_entry_point):
+    factory = NodeFactory()
+
+    assert "Test-Lazy" in factory.get_available_nodes()
+    assert "gil_lazy_test_node" not in sys.modules
+
+    node = factory.create_node("Test-Lazy", {}, "lazy")
+    assert type(node).__name__ == "LazyNode"
+    assert "gil_lazy_test_node" in sys.modules
+
+
+def test_scan_result_is_shared_and_persisted(lazy_entry_point, monkeypatch):
+    assert NodeFactory()._entry_points is NodeFactory()._entry_points
+    assert (lazy_entry_point / "cache" / "nodes.json").exists()
+
+    def fail_scan(group):
+        raise AssertionError("entry points should come from the disk cache")
+
+    monkeypatch.setattr(node_factory_module.importlib.metadata, "entry_points", fail_scan)
+    monkeypatch.setattr(node_factory_module, "_discovered_entry_points", None)
+
+    assert "Test-Lazy" in discover_entry_points()
+
+
+@pytest.mark.parametrize("node_type", ["Test-Transform", "Test-SetVariable", "Test-Connector"])
+def test_node_info_does_not_instantiate_nodes(node_type, monkeypatch):
+    from gil_node_data.transform import DataTransformNode
+    from gil_node_openai.openai_connector import OpenAIConnectorNode
+    from gil_py.core.util.set_variable import UtilSetVariableNode
+
+    # These nodes require config (or an API key) and raise when created without it
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    factory = NodeFactory()
+    factory.register("Test-Transform", DataTransformNode)
+    factory.register("Test-SetVariable", UtilSetVariableNode)
+    factory.register("Test-Connector", OpenAIConnectorNode)
+
+    info = factory.get_node_info(node_type)
+
+    assert "ports_error" not in info
+    assert info["input_ports"] or info["output_ports"]
+    assert factory.get_node_info(node_type) == info
+
+
+def test_declared_ports_are_copied_per_instance():
+    from gil_node_data.read_file import DataReadFileNode
+
+    first = DataReadFileNode(node_id="a", node_config={"mode": "binary"})
+    second = DataReadFileNode(node_id="b", node_config={})
+    first.get_output_port("content").set_data(b"x")
+
+    assert second.get_output_port("content").get_data() is None
+    assert (first.get_output_port("content").data_type, second.get_output_port("content").data_type) == ("binary", "text")
+    assert DataReadFileNode.describe_ports()["output_ports"][0]["type"] == "any"
+    assert [port.name for port in second.input_ports] == ["file_path", "offset", "length"]
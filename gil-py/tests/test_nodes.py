@@ -1,9 +1,12 @@
+import asyncio
 import pytest
-from unittest.mock import MagicMock
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
 
 
 from gil_node_text.openai_text_generation import OpenAIGenerateTextNode
 from gil_node_openai.openai_image_generator import OpenAIGenerateImageNode
+from gil_node_openai.openai_connector import OpenAIConnectorNode
 from gil_py.core.context import Context
 
 @pytest.mark.asyncio
@@ -41,4 +44,161 @@ async def test_image_analysis_node_placeholder():
     await node.execute(input_data, context)
 
     expected_result = "Image at /path/to/image.jpg analyzed: This is a placeholder result."
-    assert node.get_output_port("image_url").get_data() == expected_result
\ No newline at end of file
+    assert node.get_output_port("image_url").get_data() == expected_result
+
+@pytest.mark.asyncio
+async def test_text_generation_node_awaits_async_client():
+    node = OpenAIGenerateTextNode(node_id="test_text_gen_node_async", node_config={})
+    context = Context({})
+    mock_client = MagicMock()
+    mock_client.chat.completions.create = AsyncMock()
+    mock_client.chat.completions.create.return_value.choices[0].message.content = "async world"
+    input_data = {"prompt": "world", "client": mock_client}
+
+    await node.execute(input_data, context)
+
+    mock_client.chat.completions.create.assert_awaited_once()
+    assert node.get_output_port("generated_text").get_data() == "async world"
+
+@pytest.mark.asyncio
+async def test_openai_connectors_share_async_client_and_pool():
+    from openai import AsyncOpenAI
+
+    first = OpenAIConnectorNode(node_id="connector_a", node_config={"api_key": "sk-test", "pool": {"max_connections": 10}})
+    second = OpenAIConnectorNode(node_id="connector_b", node_config={"api_key": "sk-test", "pool": {"max_connections": 10}})
+    other = OpenAIConnectorNode(node_id="connector_c", node_config={"api_key": "sk-other", "pool": {"max_connections": 10}})
+    await second.setup()
+    await other.setup()
+
+    result = await first.execute({}, Context({}))
+
+    assert isinstance(result["client"], AsyncOpenAI)
+    assert first.client is second.client
+    assert other.client is not first.client
+    assert other.client._client is first.client._client
+
+@pytest.mark.asyncio
+async def test_openai_connector_teardown_and_closing_shared_clients():
+    from gil_node_openai.client_pool import close_shared_clients
+
+    first = OpenAIConnectorNode(node_id="connector_a", node_config={"api_key": "sk-test"})
+    second = OpenAIConnectorNode(node_id="connector_b", node_config={"api_key": "sk-test"})
+    await first.setup()
+    await second.setup()
+    shared = first.client
+
+    # Tearing one node down leaves the client usable by the other
+    await first.teardown()
+    assert first.client is None
+    assert not shared.is_closed()
+
+    await close_shared_clients()
+    assert shared.is_closed()
+    await first.setup()
+    assert first.client is not shared and not first.client.is_closed()
+    await close_shared_clients()
+
+@pytest.mark.asyncio
+async def test_text_generation_node_streams_tokens():
+    node = OpenAIGenerateTextNode(node_id="test_text_gen_node_stream", node_config={"stream": True})
+    context = Context({})
+
+    async def completion_chunks():
+        for token in ["Hello", ", ", None, "Gil"]:
+            yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=token))])
+        yield SimpleNamespace(choices=[])
+
+    mock_client = MagicMock()
+    mock_client.chat.completions.create = AsyncMock(return_value=completion_chunks())
+    input_data = {"prompt": "greet", "client": mock_client}
+
+    result = await node.execute(input_data, context)
+
+    assert mock_client.chat.completions.create.await_args.kwargs["stream"] is True
+    assert [token async for token in result["generated_text"]] == ["Hello", ", ", "Gil"]
+    assert await node.get_output_port("generated_text").get_data().collect() == "Hello, Gil"
+
+@pytest.mark.asyncio
+async def test_text_generation_node_batches_concurrent_prompts():
+    node = OpenAIGenerateTextNode(node_id="batched", node_config={"batch": {"mode": "completions", "window_ms": 10}})
+    mock_client = MagicMock()
+    mock_client.completions.create = AsyncMock(return_value=SimpleNamespace(choices=[
+        SimpleNamespace(index=1, text="second"),
+        SimpleNamespace(index=0, text="first"),
+    ]))
+
+    results = await asyncio.gather(
+        node.execute({"prompt": "one", "client": mock_client, "model": "gpt-3.5-turbo-instruct"}, Context({})),
+        node.execute({"prompt": "two", "client": mock_client, "model": "gpt-3.5-turbo-instruct"}, Context({})),
+    )
+
+    assert [result["generated_text"] for result in results] == ["first", "second"]
+    mock_client.completions.create.assert_awaited_once_with(model="gpt-3.5-turbo-instruct", prompt=["one", "two"])
+
+@pytest.mark.asyncio
+async def test_text_generation_node_batch_api_demultiplexes_results():
+    node = OpenAIGenerateTextNode(node_id="batch_api", node_config={"batch": {"mode": "batch_api", "window_ms": 10, "poll_interval": 0}})
+    output = "\n".join([
+        '{"custom_id": "1", "response": {"status_code": 200, "body": {"choices": [{"message": {"content": "B"}}]}}}',
+        '{"custom_id": "0", "response": {"status_code": 400, "body": {"error": {"message": "bad prompt"}}}}',
+    ])
+    mock_client = MagicMock()
+    mock_client.files.create.return_value.id = "file-in"
+    mock_client.batches.create.return_value = SimpleNamespace(id="batch-1", status="in_progress")
+    mock_client.batches.retrieve.return_value = SimpleNamespace(id="batch-1", status="completed", output_file_id="file-out", error_file_id=None)
+    mock_client.files.content.return_value.text = output
+
+    results = await asyncio.gather(
+        node.execute({"prompt": "a", "client": mock_client, "model": "gpt-4o-mini"}, Context({})),
+        node.execute({"prompt": "b", "client": mock_client, "model": "gpt-4o-mini"}, Context({})),
+        return_exceptions=True,
+    )
+
+    assert isinstance(results[0], RuntimeError) and "bad prompt" in str(results[0])
+    assert results[1] == {"generated_text": "B"}
+    assert mock_client.batches.create.call_count == 1
+
+@pytest.mark.asyncio
+async def test_text_generation_node_batches_chat_models_without_the_batch_api():
+    node = OpenAIGenerateTextNode(node_id="batched_chat", node_config={"batch": True})
+    mock_client = MagicMock()
+
+    async def create(model, messages):
+        if messages[0]["content"] == "bad":
+            raise RuntimeError("rejected")
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=messages[0]["content"].upper()))])
+
+    mock_client.chat.completions.create = AsyncMock(side_effect=create)
+
+    results = await asyncio.gather(
+        node.execute({"prompt": "a", "client": mock_client, "model": "gpt-4o-mini"}, Context({})),
+        node.execute({"prompt": "bad", "client": mock_client, "model": "gpt-4o-mini"}, Context({})),
+        return_exceptions=True,
+    )
+
+    assert results[0] == {"generated_text": "A"}
+    assert isinstance(results[1], RuntimeError) and "rejected" in str(results[1])
+    assert mock_client.chat.completions.create.await_count == 2
+    mock_client.completions.create.assert_not_called()
+    mock_client.batches.create.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_text_generation_node_rejects_chat_models_in_completions_batches():
+    node = OpenAIGenerateTextNode(node_id="batched", node_config={"batch": {"mode": "completions"}})
+    mock_client = MagicMock()
+
+    with pytest.raises(RuntimeError, match="Completions model"):
+        await node.execute({"prompt": "one", "client": mock_client, "model": "gpt-4o-mini"}, Context({}))
+    mock_client.completions.create.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_missing_batch_results_fail_with_separate_errors():
+    from gil_node_text.openai_batching import _flush_completions
+
+    mock_client = MagicMock()
+    mock_client.completions.create = AsyncMock(return_value=SimpleNamespace(choices=[]))
+
+    results = await _flush_completions((mock_client, "gpt-3.5-turbo-instruct"), ["one", "two"])
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert results[0] is not results[1]
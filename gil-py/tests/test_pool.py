@@ -0,0 +1,104 @@
+from typing import ClassVar, List
+
+import pytest
+
+from gil_py.core.node import Node
+from gil_py.core.context import Context
+from gil_py.core.data_types import DataType
+from gil_py.core.port import OutputPort
+from gil_py.workflow.compiler import WorkflowCompiler
+from gil_py.workflow.executor import WorkflowExecutor
+from gil_py.workflow.node_factory import NodeFactory
+from gil_py.workflow.pool import NodePool
+
+
+class WarmNode(Node):
+    """Records its lifecycle calls; `setup()` stands in for creating an expensive client."""
+
+    events: ClassVar[List[str]] = []
+
+    def __init__(self, node_id: str, node_config: dict):
+        super().__init__(node_id=node_id, node_config=node_config)
+        self.add_output_port(OutputPort(name="output", data_type=DataType.TEXT))
+
+    async def setup(self) -> None:
+        WarmNode.events.append(f"setup:{self.node_id}")
+
+    async def teardown(self) -> None:
+        WarmNode.events.append(f"teardown:{self.node_id}")
+
+    async def execute(self, data: dict, context: Context) -> dict:
+        return {"output": f"{self.node_id}:{id(self)}"}
+
+
+class ColdNode(WarmNode):
+    poolable: ClassVar[bool] = False
+
+
+def make_executor(pool: NodePool) -> WorkflowExecutor:
+    factory = NodeFactory()
+    factory.register("Test-Warm", WarmNode)
+    factory.register("Test-Cold", ColdNode)
+    return WorkflowExecutor(node_factory=factory, compiler=WorkflowCompiler(factory), observers=[], node_pool=pool)
+
+
+def workflow(node_type="Test-Warm", config=None):
+    return {
+        "version": "1.0",
+        "name": "pool test",
+        "nodes": {"a": {"type": node_type, "config": config or {}}},
+        "flow": ["a"],
+    }
+
+
+@pytest.fixture(autouse=True)
+def reset_events():
+    WarmNode.events = []
+
+
+@pytest.mark.asyncio
+async def test_repeated_runs_reuse_warm_instance():
+    pool = NodePool()
+    executor = make_executor(pool)
+    plan = executor.compiler.compile_dict(workflow())
+
+    first = await executor.execute(plan, Context({}))
+    second = await executor.execute(plan, Context({}))
+
+    assert first["node_outputs"]["a"] == second["node_outputs"]["a"]
+    assert WarmNode.events == ["setup:a"]
+    assert (pool.created, pool.reused) == (1, 1)
+
+    # Pooled instances start each run with empty ports
+    node = pool._loop_idle()[NodePool._key(plan.nodes[0])][0]
+    assert [port.get_data() for port in node.output_ports] == [None]
+
+    await pool.close()
+    assert WarmNode.events == ["setup:a", "teardown:a"]
+    assert pool.idle_count() == 0
+
+
+@pytest.mark.asyncio
+async def test_different_config_gets_its_own_instance():
+    pool = NodePool()
+    executor = make_executor(pool)
+
+    await executor.execute(executor.compiler.compile_dict(workflow(config={"model": "x"})), Context({}))
+    await executor.execute(executor.compiler.compile_dict(workflow(config={"model": "y"})), Context({}))
+
+    assert (pool.created, pool.reused) == (2, 0)
+    assert pool.idle_count() == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("node_type, max_idle", [("Test-Cold", 8), ("Test-Warm", 0)])
+async def test_unpooled_nodes_are_torn_down_after_each_run(node_type, max_idle):
+    pool = NodePool(max_idle=max_idle)
+    executor = make_executor(pool)
+    plan = executor.compiler.compile_dict(workflow(node_type))
+
+    await executor.execute(plan, Context({}))
+    await executor.execute(plan, Context({}))
+
+    assert WarmNode.events == ["setup:a", "teardown:a", "setup:a", "teardown:a"]
+    assert pool.reused == 0
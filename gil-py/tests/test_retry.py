@@ -0,0 +1,86 @@
+from typing import ClassVar, Dict
+
+import pytest
+
+from gil_py.core.node import Node
+from gil_py.core.context import Context
+from gil_py.workflow.executor import WorkflowExecutor
+from gil_py.workflow.node_factory import NodeFactory
+from gil_py.workflow.retry import RetryPolicy, is_retryable
+from gil_py.yaml_parser import YamlWorkflowParser
+
+
+class RateLimited(Exception):
+    status_code = 429
+
+
+class FlakyNode(Node):
+    """Fails `failures` times (with `error`) before succeeding."""
+
+    attempts: ClassVar[Dict[str, int]] = {}
+
+    async def execute(self, data: dict, context: Context) -> dict:
+        count = FlakyNode.attempts[self.node_id] = FlakyNode.attempts.get(self.node_id, 0) + 1
+        if count <= self.node_config["failures"]:
+            if self.node_config.get("error") == "value":
+                raise ValueError("bad input")
+            raise RuntimeError("Failed to generate text") from RateLimited("rate limited")
+        return {"output": count}
+
+
+def run(nodes: dict, retry_budget=None):
+    FlakyNode.attempts = {}
+    factory = NodeFactory()
+    factory.register("Test-Flaky", FlakyNode)
+    workflow = YamlWorkflowParser().parse_dict({
+        "version": "1.0",
+        "name": "retry test",
+        "nodes": {
+            node_id: {"type": "Test-Flaky", "config": config, "retry": {"max_attempts": 3, "delay": 1, "jitter": False}}
+            for node_id, config in nodes.items()
+        },
+        "flow": [list(nodes)],
+        "retry_budget": retry_budget,
+    })
+    return WorkflowExecutor(node_factory=factory, observers=[]).execute(workflow, Context({}))
+
+
+@pytest.mark.asyncio
+async def test_transient_errors_are_retried():
+    result = await run({"a": {"failures": 2}})
+
+    assert result["node_outputs"]["a"] == {"output": 3}
+    assert result["retries"] == 2
+
+
+@pytest.mark.asyncio
+async def test_non_transient_errors_and_exhausted_attempts_fail():
+    result = await run({"bad": {"failures": 1, "error": "value"}, "down": {"failures": 5}})
+
+    assert result["node_outputs"]["bad"] == {"error": "bad input"}
+    assert "error" in result["node_outputs"]["down"]
+    assert FlakyNode.attempts == {"bad": 1, "down": 3}
+
+
+@pytest.mark.asyncio
+async def test_retry_budget_is_shared_across_nodes():
+    result = await run({"a": {"failures": 2}, "b": {"failures": 2}}, retry_budget=3)
+
+    assert result["retries"] == 3
+    assert sorted(FlakyNode.attempts.values()) == [2, 3]
+    assert sum("error" in output for output in result["node_outputs"].values()) == 1
+
+
+def test_backoff_and_classification():
+    policy = RetryPolicy.from_config({"delay": 100, "max_delay": 300, "jitter": False})
+    assert [policy.backoff_delay(retry) for retry in (1, 2, 3)] == [0.1, 0.2, 0.3]
+    assert 0 <= RetryPolicy(delay=1.0).backoff_delay(2) <= 2.0
+
+    class ServerError(Exception):
+        status_code = 503
+
+    assert is_retryable(ServerError())
+    assert is_retryable(ConnectionResetError())
+    assert not is_retryable(ValueError())
+    with pytest.raises(ValueError):
+        RetryPolicy.from_config({"backoff": "random"})
@@ -0,0 +1,79 @@
+import time
+
+import pytest
+
+from gil_py.core.node import Node
+from gil_py.core.context import Context
+from gil_py.core.deadline import deadline_scope, remaining_time
+from gil_py.workflow.executor import WorkflowExecutor, WorkflowTimeoutError
+from gil_py.workflow.node_factory import NodeFactory
+from gil_py.yaml_parser import YamlWorkflowParser
+
+from test_executor import BlockingSleepNode, SleepNode
+
+
+class DeadlineNode(Node):
+    """Reports the remaining deadline seen inside execute()."""
+
+    async def execute(self, data: dict, context: Context) -> dict:
+        return {"output": remaining_time()}
+
+
+def make_executor() -> WorkflowExecutor:
+    factory = NodeFactory()
+    factory.register("Test-Sleep", SleepNode)
+    factory.register("Test-BlockingSleep", BlockingSleepNode)
+    factory.register("Test-Deadline", DeadlineNode)
+    return WorkflowExecutor(node_factory=factory, observers=[])
+
+
+def parse(nodes: dict, flow: list, timeout=None):
+    return YamlWorkflowParser().parse_dict({
+        "version": "1.0",
+        "name": "timeout test",
+        "nodes": nodes,
+        "flow": flow,
+        "timeout": timeout,
+    })
+
+
+@pytest.mark.asyncio
+async def test_node_timeout_cancels_the_node():
+    workflow = parse({
+        "hung": {"type": "Test-Sleep", "config": {"delay": 5}, "timeout": 100},
+        "blocked": {"type": "Test-BlockingSleep", "config": {"delay": 0.5}, "timeout": 100},
+        "after": {"type": "Test-Deadline", "timeout": 2000},
+    }, [["hung", "blocked"], "after"])
+
+    started = time.perf_counter()
+    result = await make_executor().execute(workflow, Context({"events": []}))
+
+    assert time.perf_counter() - started < 1
+    assert "시간이 초과" in result["node_outputs"]["hung"]["error"]
+    assert "시간이 초과" in result["node_outputs"]["blocked"]["error"]
+    assert 1.5 < result["node_outputs"]["after"]["output"] <= 2.0
+
+
+@pytest.mark.asyncio
+async def test_run_timeout_aborts_the_workflow():
+    workflow = parse({"slow": {"type": "Test-Sleep", "config": {"delay": 5}}, "never": {"type": "Test-Sleep"}}, ["slow", "never"], timeout=100)
+    executor = make_executor()
+
+    started = time.perf_counter()
+    with pytest.raises(WorkflowTimeoutError):
+        await executor.execute(workflow, Context({"events": []}))
+
+    assert time.perf_counter() - started < 1
+    assert "error" in executor.get_node_result("slow")
+    assert executor.get_node_result("never") is None
+
+
+@pytest.mark.asyncio
+async def test_caller_deadline_propagates_into_nodes():
+    workflow = parse({"node": {"type": "Test-Deadline"}}, ["node"])
+
+    with deadline_scope(3):
+        result = await make_executor().execute(workflow, Context({}))
+
+    assert 2.5 < result["node_outputs"]["node"]["output"] <= 3
+    assert remaining_time() is None
@@ -0,0 +1,92 @@
+import json
+
+import pytest
+
+from gil_py.core.context import Context
+from gil_py.workflow.checkpoint import MemoryCheckpointStore
+from gil_py.workflow.executor import WorkflowExecutor
+from gil_py.workflow.node_factory import NodeFactory
+from gil_py.workflow.tracing import LatencyHistogram, MetricsRegistry, OtlpJsonFileExporter, TracingObserver
+from gil_py.yaml_parser import YamlWorkflowParser
+
+from test_executor import BlockingSleepNode, SleepNode
+
+
+def make_workflow():
+    return YamlWorkflowParser().parse_dict({
+        "version": "1.0",
+        "name": "tracing test",
+        "nodes": {
+            "sleep": {"type": "Test-Sleep", "config": {"delay": 0.05}},
+            "block": {"type": "Test-BlockingSleep", "config": {"delay": 0.05}},
+        },
+        "flow": ["sleep", "block"],
+    })
+
+
+@pytest.mark.asyncio
+async def test_tracing_observer_records_histograms_and_exports_spans(tmp_path):
+    factory = NodeFactory()
+    factory.register("Test-Sleep", SleepNode)
+    factory.register("Test-BlockingSleep", BlockingSleepNode)
+    metrics = MetricsRegistry()
+    trace_file = tmp_path / "trace.jsonl"
+    executor = WorkflowExecutor(
+        node_factory=factory,
+        observers=[TracingObserver(metrics=metrics, exporter=OtlpJsonFileExporter(str(trace_file)))],
+    )
+
+    first = await executor.execute(make_workflow(), Context({"events": []}))
+
+    summary = metrics.summary()
+    assert summary["Test-Sleep"]["execute"]["count"] == 1
+    assert summary["Test-BlockingSleep"]["execute"]["p50"] >= 0.025
+    assert set(summary["Test-Sleep"]) == {"queue_wait", "resolve_inputs", "execute", "propagate_outputs", "total"}
+    assert 'gil_node_duration_seconds_count{node_type="Test-Sleep",phase="execute"} 1' in metrics.to_prometheus()
+
+    request = json.loads(trace_file.read_text().splitlines()[0])
+    spans = request["resourceSpans"][0]["scopeSpans"][0]["spans"]
+    run_span = spans[0]
+    node_spans = [span for span in spans if span["name"].startswith("node ")]
+    assert run_span["name"] == "workflow tracing test"
+    assert run_span["traceId"] == executor.trace_id != executor.run_id
+    assert len(node_spans) == 2
+    assert all(span["parentSpanId"] == run_span["spanId"] for span in node_spans)
+    assert all(span["traceId"] == run_span["traceId"] for span in spans)
+    assert len(spans) == 1 + 2 * 5
+    assert {"key": "gil.run_id", "value": {"stringValue": first["run_id"]}} in run_span["attributes"]
+
+
+@pytest.mark.asyncio
+async def test_resumed_and_incremental_runs_get_a_new_trace_id(tmp_path):
+    factory = NodeFactory()
+    factory.register("Test-Sleep", SleepNode)
+    factory.register("Test-BlockingSleep", BlockingSleepNode)
+    trace_file = tmp_path / "trace.jsonl"
+    executor = WorkflowExecutor(
+        node_factory=factory,
+        observers=[TracingObserver(metrics=MetricsRegistry(), exporter=OtlpJsonFileExporter(str(trace_file)))],
+        checkpoints=MemoryCheckpointStore(),
+    )
+
+    for _ in range(2):
+        await executor.execute(make_workflow(), Context({"events": []}), incremental=True)
+
+    trace_ids = [
+        json.loads(line)["resourceSpans"][0]["scopeSpans"][0]["spans"][0]["traceId"]
+        for line in trace_file.read_text().splitlines()
+    ]
+    assert len(trace_ids) == 2 and trace_ids[0] != trace_ids[1]
+    # OTLP trace ids are 16 bytes of hex
+    assert all(len(trace_id) == 32 and int(trace_id, 16) for trace_id in trace_ids)
+
+
+def test_latency_histogram_quantiles():
+    histogram = LatencyHistogram(buckets=(0.1, 0.2, 0.4))
+    for value in (0.05, 0.15, 0.15, 0.3):
+        histogram.observe(value)
+
+    assert histogram.count == 4
+    assert histogram.cumulative_counts() == [1, 3, 4, 4]
+    assert 0.1 <= histogram.quantile(0.5) <= 0.2
+    assert LatencyHistogram().quantile(0.99) is None